@@ -2,7 +2,6 @@ import datetime as dt
 import decimal
 import enum
 import uuid
-from typing import Annotated
 
 import msgspec
 from django.conf import settings
@@ -72,9 +71,9 @@ class HeadersModel(msgspec.Struct):
 
 
 class QueryModel(msgspec.Struct):
-    per_page: Annotated[list[int], msgspec.Meta(min_length=1, max_length=1)]
-    count: Annotated[list[int], msgspec.Meta(min_length=1, max_length=1)]
-    page: Annotated[list[int], msgspec.Meta(min_length=1, max_length=1)]
+    per_page: int
+    count: int
+    page: int
     filter: list[str]
 
 
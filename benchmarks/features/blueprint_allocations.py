@@ -0,0 +1,66 @@
+import argparse
+import tracemalloc
+from typing import ClassVar, Final
+
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure(
+        DMR_SETTINGS={'validate_responses': False},
+        ALLOWED_HOSTS='*',
+        DEBUG=False,
+    )
+
+from django.test import RequestFactory
+
+from django_modern_rest import Blueprint, Controller
+from django_modern_rest.controller import BlueprintsT
+from django_modern_rest.plugins.msgspec import MsgspecSerializer
+
+
+class _PlainController(Controller[MsgspecSerializer]):
+    def get(self) -> list[int]:
+        return [1, 2]
+
+
+class _UserBlueprint(Blueprint[MsgspecSerializer]):
+    def get(self) -> list[int]:
+        return [1, 2]
+
+
+class _ComposedController(Controller[MsgspecSerializer]):
+    blueprints: ClassVar[BlueprintsT] = [_UserBlueprint]
+
+
+_CONTROLLERS: Final = {
+    'plain': _PlainController,
+    'composed': _ComposedController,
+}
+
+_REPEAT: Final = 50000
+
+
+def main() -> None:
+    """Run the per-request allocations benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--impl', choices=list(_CONTROLLERS), required=True)
+    parser.add_argument('--repeat', type=int, default=_REPEAT)
+    args = parser.parse_args()
+
+    view = _CONTROLLERS[args.impl].as_view()
+    request = RequestFactory().get('/whatever/')
+    view(request)  # warm up all caches
+
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    view(request)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f'{args.impl}: peak memory per request: {peak - baseline} bytes')  # noqa: WPS421
+
+    for _ in range(args.repeat):
+        view(request)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+import argparse
+import datetime as dt
+import decimal
+import enum
+import uuid
+from pathlib import Path
+from typing import Final
+
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure(
+        DMR_SETTINGS={'validate_responses': False},
+        ALLOWED_HOSTS='*',
+        DEBUG=False,
+    )
+
+import msgspec
+from django.http import HttpRequest
+from django.test import RequestFactory
+
+from django_modern_rest import Body, Controller
+from django_modern_rest.plugins.msgspec import (
+    MsgpackSerializer,
+    MsgspecSerializer,
+)
+
+
+class _Level(enum.StrEnum):
+    started = 'starter'
+    mid = 'mid'
+    pro = 'pro'
+
+
+class _Skill(msgspec.Struct):
+    name: str
+    description: str
+    optional: bool
+    level: _Level
+
+
+class _Item(msgspec.Struct):
+    name: str
+    quality: int
+    count: int
+    rarety: int
+    parts: list['_Item']
+
+
+class _User(msgspec.Struct):
+    email: str
+    age: int
+    height: float
+    average_score: float
+    balance: decimal.Decimal
+    skills: list[_Skill]
+    aliases: dict[str, str | int]
+    birthday: dt.datetime
+    timezone_diff: dt.timedelta
+    friends: list['_User']
+    best_friend: '_User | None'
+    promocodes: list[uuid.UUID]
+    items: list[_Item]
+    uid: uuid.UUID | None = None
+
+
+class _JsonController(Body[_User], Controller[MsgspecSerializer]):
+    def post(self) -> _User:
+        return self.parsed_body
+
+
+class _MsgpackController(Body[_User], Controller[MsgpackSerializer]):
+    def post(self) -> _User:
+        return self.parsed_body
+
+
+_CONTROLLERS: Final = {
+    'json': _JsonController,
+    'msgpack': _MsgpackController,
+}
+
+_PAYLOAD: Final = Path(__file__).parent.parent / 'payload.json'
+_REPEAT: Final = 10000
+
+
+def _request(body: bytes, content_type: str) -> HttpRequest:
+    return RequestFactory().generic(
+        'POST',
+        '/whatever/',
+        body,
+        content_type=content_type,
+    )
+
+
+def main() -> None:
+    """Run the MessagePack serializer benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--impl', choices=list(_CONTROLLERS), required=True)
+    parser.add_argument('--repeat', type=int, default=_REPEAT)
+    args = parser.parse_args()
+
+    controller = _CONTROLLERS[args.impl]
+    view = controller.as_view()
+    user = msgspec.json.decode(_PAYLOAD.read_bytes(), type=_User)
+    body = controller.serializer.serialize(user)
+    content_type = controller.serializer.content_type
+
+    response = view(_request(body, content_type))
+    print(  # noqa: WPS421
+        f'{args.impl}: {len(body)} bytes body, '
+        f'{len(response.content)} bytes response',
+    )
+
+    for _ in range(args.repeat):
+        view(_request(body, content_type))
+
+
+if __name__ == '__main__':
+    main()
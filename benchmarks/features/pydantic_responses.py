@@ -0,0 +1,66 @@
+import argparse
+import datetime as dt
+from typing import Final
+
+import pydantic
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure(ALLOWED_HOSTS='*', DEBUG=False)
+
+from django_modern_rest.plugins.pydantic import PydanticSerializer
+
+
+class _TagModel(pydantic.BaseModel):
+    name: str
+    color: str
+
+
+class _UserModel(pydantic.BaseModel):
+    user_id: int = pydantic.Field(alias='id')
+    email: str
+    age: int
+    created_at: dt.datetime
+    tags: list[_TagModel]
+
+
+def _build_models(count: int) -> list[_UserModel]:
+    created_at = dt.datetime.fromisoformat('2025-01-01T10:00:00+00:00')
+    return [
+        _UserModel(
+            id=index,
+            email=f'user{index}@example.com',
+            age=30,
+            created_at=created_at,
+            tags=[_TagModel(name='admin', color='red')],
+        )
+        for index in range(count)
+    ]
+
+
+_REPEAT: Final = 1000
+
+
+def main() -> None:
+    """Run the pydantic response serialization benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        '--impl',
+        choices=['hook', 'typed'],
+        required=True,
+    )
+    parser.add_argument('--models', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=_REPEAT)
+    args = parser.parse_args()
+
+    models = _build_models(args.models)
+    if args.impl == 'typed':
+        for _ in range(args.repeat):
+            PydanticSerializer.to_json(models, list[_UserModel])
+    else:
+        for _ in range(args.repeat):
+            PydanticSerializer.serialize(models)
+
+
+if __name__ == '__main__':
+    main()
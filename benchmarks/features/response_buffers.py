@@ -0,0 +1,68 @@
+import argparse
+import threading
+from collections.abc import Callable
+from typing import Any, Final
+
+import msgspec
+
+_ENCODER: Final = msgspec.json.Encoder()
+_LOCAL: Final = threading.local()
+
+
+def _build_payload(items: int) -> list[dict[str, Any]]:
+    return [
+        {
+            'id': index,
+            'name': f'item{index}',
+            'tags': ['a', 'b'],
+            'price': 1.5,
+            'description': 'x' * 200,
+        }
+        for index in range(items)
+    ]
+
+
+def _encode(payload: Any) -> bytes:
+    return _ENCODER.encode(payload)
+
+
+def _encode_into_pool(payload: Any) -> bytes:
+    buffer = getattr(_LOCAL, 'buffer', None)
+    if buffer is None:
+        buffer = _LOCAL.buffer = bytearray()
+    _ENCODER.encode_into(payload, buffer)
+    # `HttpResponse` and WSGI servers need `bytes`, so we have to copy:
+    return bytes(buffer)
+
+
+_IMPLS: Final[dict[str, Callable[[Any], bytes]]] = {
+    'encode': _encode,
+    'pool': _encode_into_pool,
+}
+
+
+def main() -> None:
+    """Run the response buffers benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--impl', choices=list(_IMPLS), required=True)
+    parser.add_argument('--items', type=int, default=1500)
+    parser.add_argument('--threads', type=int, default=16)
+    parser.add_argument('--repeat', type=int, default=300)
+    args = parser.parse_args()
+
+    payload = _build_payload(args.items)
+    encode = _IMPLS[args.impl]
+
+    def worker() -> None:
+        for _ in range(args.repeat):
+            encode(payload)
+
+    threads = [threading.Thread(target=worker) for _ in range(args.threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+if __name__ == '__main__':
+    main()
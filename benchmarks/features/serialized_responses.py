@@ -0,0 +1,117 @@
+import argparse
+import asyncio
+from typing import Any, Final
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.http.response import ResponseHeaders
+
+if not settings.configured:
+    settings.configure(
+        ROOT_URLCONF=__name__,
+        DMR_SETTINGS={'validate_responses': False},
+        ALLOWED_HOSTS='*',
+        DEBUG=False,
+    )
+
+from django.core.handlers import asgi, wsgi
+from django.test import RequestFactory
+
+from django_modern_rest import Controller, response
+from django_modern_rest.plugins.msgspec import MsgspecSerializer
+from django_modern_rest.routing import path
+
+_PAYLOAD: Final = [{'id': index, 'name': f'item{index}'} for index in range(10)]
+
+
+class _SyncController(Controller[MsgspecSerializer]):
+    def get(self) -> list[dict[str, Any]]:
+        return _PAYLOAD
+
+
+class _AsyncController(Controller[MsgspecSerializer]):
+    async def get(self) -> list[dict[str, Any]]:
+        return _PAYLOAD
+
+
+urlpatterns = [
+    path('sync/', _SyncController.as_view()),
+    path('async/', _AsyncController.as_view()),
+]
+
+
+def _http_response(
+    serialized: bytes,
+    *,
+    status: int,
+    content_type: str,
+    headers: dict[str, str] | ResponseHeaders | None = None,
+) -> HttpResponse:
+    """Previous way of building responses, used for comparison."""
+    response_headers = dict(headers or {})
+    response_headers.setdefault('Content-Type', content_type)
+    return HttpResponse(serialized, status=status, headers=response_headers)
+
+
+def _start_response(status: str, headers: list[tuple[str, str]]) -> None:
+    """We don't need to send anything."""
+
+
+def _run_sync(repeat: int) -> None:
+    sync_app = wsgi.WSGIHandler()
+    environ = RequestFactory().get('/sync/').environ
+    for _ in range(repeat):
+        b''.join(sync_app(environ, _start_response))
+
+
+async def _run_async(repeat: int) -> None:
+    async_app = asgi.ASGIHandler()
+    scope = {
+        'type': 'http',
+        'method': 'GET',
+        'path': '/async/',
+        'query_string': b'',
+        'headers': [],
+    }
+
+    disconnect = asyncio.Event()
+    request_message = {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message: dict[str, Any]) -> None:
+        """We don't need to send anything."""
+
+    for _ in range(repeat):
+        messages = [request_message]
+
+        async def receive() -> dict[str, Any]:
+            if messages:  # noqa: B023
+                return messages.pop()  # noqa: B023
+            # Django waits for disconnect until the response is sent:
+            await disconnect.wait()
+            return {'type': 'http.disconnect'}
+
+        await async_app(scope, receive, send)
+
+
+_REPEAT: Final = 10000
+
+
+def main() -> None:
+    """Run the serialized responses benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--impl', choices=['http', 'serialized'], required=True)
+    parser.add_argument('--app', choices=['sync', 'async'], required=True)
+    parser.add_argument('--repeat', type=int, default=_REPEAT)
+    args = parser.parse_args()
+
+    if args.impl == 'http':
+        response.SerializedResponse = _http_response  # type: ignore[assignment, misc]
+
+    if args.app == 'sync':
+        _run_sync(args.repeat)
+    else:
+        asyncio.run(_run_async(args.repeat))
+
+
+if __name__ == '__main__':
+    main()
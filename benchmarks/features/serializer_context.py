@@ -0,0 +1,104 @@
+import argparse
+import types
+from typing import Final
+
+import msgspec
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure(ALLOWED_HOSTS='*', DEBUG=False)
+
+from django.http import HttpRequest
+from django.test import RequestFactory
+
+from django_modern_rest import Body, Controller, Cookies, Headers, Path, Query
+from django_modern_rest.components import ComponentParser
+from django_modern_rest.plugins.msgspec import MsgspecSerializer
+
+
+class _PathModel(msgspec.Struct):
+    user_id: int
+
+
+class _QueryModel(msgspec.Struct):
+    search: str
+
+
+class _HeadersModel(msgspec.Struct):
+    accept: str
+
+
+class _CookiesModel(msgspec.Struct):
+    session: str
+
+
+class _BodyModel(msgspec.Struct):
+    email: str
+    age: int
+
+
+#: Components in the order they are added to the benchmark controller.
+_COMPONENTS: Final = (
+    Path[_PathModel],
+    Query[_QueryModel],
+    Headers[_HeadersModel],
+    Cookies[_CookiesModel],
+    Body[_BodyModel],
+)
+
+
+def _build_controller(components: int) -> type[Controller[MsgspecSerializer]]:
+    bases: tuple[type[ComponentParser], ...] = _COMPONENTS[:components]
+    return types.new_class(
+        f'Components{components}Controller',
+        (*bases, Controller[MsgspecSerializer]),
+    )
+
+
+def _build_request() -> HttpRequest:
+    request = RequestFactory().post(
+        '/users/1/?search=query',
+        data=b'{"email": "user@example.com", "age": 30}',
+        content_type='application/json',
+        headers={'Accept': 'application/json'},
+    )
+    request.COOKIES['session'] = 'abc'
+    return request
+
+
+_REPEAT: Final = 100_000
+
+
+def main() -> None:
+    """Run the serializer context benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        '--impl',
+        choices=['generic', 'compiled'],
+        required=True,
+    )
+    parser.add_argument(
+        '--components',
+        type=int,
+        choices=range(1, len(_COMPONENTS) + 1),
+        required=True,
+    )
+    parser.add_argument('--repeat', type=int, default=_REPEAT)
+    args = parser.parse_args()
+
+    controller_cls = _build_controller(args.components)
+    context = controller_cls._serializer_context  # noqa: SLF001
+    parse_and_bind = (
+        context.parse_and_bind
+        if args.impl == 'compiled'
+        else context._parse_and_bind_generic  # noqa: SLF001
+    )
+    request = _build_request()
+    controller = controller_cls()
+    controller.setup(request, user_id=1)
+    for _ in range(args.repeat):
+        parse_and_bind(controller, request, user_id=1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+import argparse
+import tracemalloc
+from typing import Final
+
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure(
+        DMR_SETTINGS={'validate_responses': False},
+        ALLOWED_HOSTS='*',
+        DEBUG=False,
+        # Big bodies are not allowed by default:
+        DATA_UPLOAD_MAX_MEMORY_SIZE=None,
+    )
+
+import msgspec
+from django.http import HttpRequest
+from django.test import RequestFactory
+
+from django_modern_rest import Body, Controller, StreamingBody
+from django_modern_rest.plugins.msgspec import MsgspecSerializer
+
+
+class _Item(msgspec.Struct):
+    id: int
+    name: str
+    tags: list[str]
+
+
+class _BodyController(Body[list[_Item]], Controller[MsgspecSerializer]):
+    def post(self) -> int:
+        return len(self.parsed_body)
+
+
+class _StreamingController(
+    StreamingBody[_Item],
+    Controller[MsgspecSerializer],
+):
+    def post(self) -> int:
+        return sum(1 for _ in self.parsed_body)
+
+
+_CONTROLLERS: Final = {
+    'body': _BodyController,
+    'streaming': _StreamingController,
+}
+
+_REPEAT: Final = 5
+
+
+def _request(body: bytes) -> HttpRequest:
+    return RequestFactory().generic(
+        'POST',
+        '/whatever/',
+        body,
+        content_type='application/json',
+    )
+
+
+def main() -> None:
+    """Run the streaming request body benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--impl', choices=list(_CONTROLLERS), required=True)
+    parser.add_argument('--items', type=int, required=True)
+    parser.add_argument('--repeat', type=int, default=_REPEAT)
+    args = parser.parse_args()
+
+    view = _CONTROLLERS[args.impl].as_view()
+    body = msgspec.json.encode([
+        _Item(id=index, name=f'item{index}', tags=['a', 'b'])
+        for index in range(args.items)
+    ])
+
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    response = view(_request(body))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(  # noqa: WPS421
+        f'{args.impl}: {response.content.decode()} items, '
+        f'peak memory per request: {peak - baseline} bytes',
+    )
+
+    for _ in range(args.repeat):
+        view(_request(body))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+import argparse
+import tracemalloc
+from collections.abc import Iterator
+from typing import Final
+
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure(
+        DMR_SETTINGS={'validate_responses': False},
+        ALLOWED_HOSTS='*',
+        DEBUG=False,
+    )
+
+import msgspec
+from django.http import HttpResponseBase
+from django.test import RequestFactory
+
+from django_modern_rest import Controller
+from django_modern_rest.plugins.msgspec import MsgspecSerializer
+
+
+class _Item(msgspec.Struct):
+    id: int
+    name: str
+    tags: list[str]
+
+
+def _produce(items: int) -> Iterator[_Item]:
+    for index in range(items):
+        yield _Item(id=index, name=f'item{index}', tags=['a', 'b'])
+
+
+class _ListController(Controller[MsgspecSerializer]):
+    items: int
+
+    def get(self) -> list[_Item]:
+        return list(_produce(self.items))
+
+
+class _StreamingController(Controller[MsgspecSerializer]):
+    items: int
+
+    def get(self) -> Iterator[_Item]:
+        return _produce(self.items)
+
+
+_CONTROLLERS: Final = {
+    'list': _ListController,
+    'streaming': _StreamingController,
+}
+
+_REPEAT: Final = 5
+
+
+def _consume(response: HttpResponseBase) -> int:
+    # Servers send content in chunks, we only count them:
+    if response.streaming:
+        return sum(len(chunk) for chunk in response.streaming_content)  # type: ignore[attr-defined]
+    return len(response.content)  # type: ignore[attr-defined]
+
+
+def main() -> None:
+    """Run the streaming responses benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--impl', choices=list(_CONTROLLERS), required=True)
+    parser.add_argument('--items', type=int, required=True)
+    parser.add_argument('--repeat', type=int, default=_REPEAT)
+    args = parser.parse_args()
+
+    controller = _CONTROLLERS[args.impl]
+    controller.items = args.items
+    view = controller.as_view()
+    request = RequestFactory().get('/whatever/')
+
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    size = _consume(view(request))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(  # noqa: WPS421
+        f'{args.impl}: {size} bytes, '
+        f'peak memory per request: {peak - baseline} bytes',
+    )
+
+    for _ in range(args.repeat):
+        _consume(view(request))
+
+
+if __name__ == '__main__':
+    main()
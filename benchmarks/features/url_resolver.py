@@ -1,4 +1,5 @@
 import argparse
+import itertools
 from collections.abc import Callable
 from contextlib import suppress
 from typing import Any, Final, Literal, assert_never
@@ -8,6 +9,7 @@ from django.urls import Resolver404, URLPattern, include
 from django.urls import path as django_path
 from django.urls.resolvers import RegexPattern, URLResolver
 
+from django_modern_rest.routing import Router
 from django_modern_rest.routing import path as dmr_path
 
 
@@ -15,69 +17,93 @@ def _a_view(request: HttpRequest) -> HttpResponse:
     return HttpResponse(b'')
 
 
+_BASE_ROUTES: Final = (
+    'users/',
+    'users/<int:user_id>',
+    'users/<int:user_id>/posts',
+    'users/<int:user_id>/posts/<int:post_id>',
+    'articles/',
+    'articles/<slug:slug>',
+    'articles/<slug:slug>/comments',
+    'authors/',
+    'authors/<int:author_id>',
+    'categories/',
+    'categories/<slug:category_slug>',
+    'tags/',
+    'tags/<str:tag_name>',
+    'products/',
+    'products/<int:product_id>',
+    'products/<int:product_id>/reviews',
+    'products/<int:product_id>/reviews/<int:review_id>',
+    'orders/',
+    'orders/<uuid:order_id>',
+    'payments/',
+    'payments/<uuid:payment_id>',
+    'inventory/',
+    'inventory/<int:item_id>',
+    'suppliers/',
+    'suppliers/<int:supplier_id>',
+    'customers/',
+    'customers/<int:customer_id>',
+    'addresses/',
+    'addresses/<int:address_id>',
+    'notifications/',
+    'notifications/<int:notification_id>',
+    'settings/',
+    'settings/<str:key>',
+    'analytics/',
+    'analytics/<str:metric>',
+    'reports/',
+    'reports/<int:report_id>',
+    'audit/',
+    'audit/<str:audit_id>',
+    'health',
+    'metrics',
+)
+
+
+def _suffixed(route: str, copy: int) -> str:
+    if not copy:
+        return route
+    resource, sep, rest = route.partition('/')
+    return f'{resource}{copy}{sep}{rest}'
+
+
 def _build_resolver(
     path: Callable[..., URLPattern | URLResolver],
+    routes: int,
+    *,
+    compiled: bool = False,
 ) -> URLResolver:
     inner_patterns = [
-        path('users/', _a_view),
-        path('users/<int:user_id>', _a_view),
-        path('users/<int:user_id>/posts', _a_view),
-        path('users/<int:user_id>/posts/<int:post_id>', _a_view),
-        path('articles/', _a_view),
-        path('articles/<slug:slug>', _a_view),
-        path('articles/<slug:slug>/comments', _a_view),
-        path('authors/', _a_view),
-        path('authors/<int:author_id>', _a_view),
-        path('categories/', _a_view),
-        path('categories/<slug:category_slug>', _a_view),
-        path('tags/', _a_view),
-        path('tags/<str:tag_name>', _a_view),
-        path('products/', _a_view),
-        path('products/<int:product_id>', _a_view),
-        path('products/<int:product_id>/reviews', _a_view),
-        path('products/<int:product_id>/reviews/<int:review_id>', _a_view),
-        path('orders/', _a_view),
-        path('orders/<uuid:order_id>', _a_view),
-        path('payments/', _a_view),
-        path('payments/<uuid:payment_id>', _a_view),
-        path('inventory/', _a_view),
-        path('inventory/<int:item_id>', _a_view),
-        path('suppliers/', _a_view),
-        path('suppliers/<int:supplier_id>', _a_view),
-        path('customers/', _a_view),
-        path('customers/<int:customer_id>', _a_view),
-        path('addresses/', _a_view),
-        path('addresses/<int:address_id>', _a_view),
-        path('notifications/', _a_view),
-        path('notifications/<int:notification_id>', _a_view),
-        path('settings/', _a_view),
-        path('settings/<str:key>', _a_view),
-        path('analytics/', _a_view),
-        path('analytics/<str:metric>', _a_view),
-        path('reports/', _a_view),
-        path('reports/<int:report_id>', _a_view),
-        path('audit/', _a_view),
-        path('audit/<str:audit_id>', _a_view),
-        path('health', _a_view),
-        path('metrics', _a_view),
+        path(_suffixed(route, index // len(_BASE_ROUTES)), _a_view)
+        for index, route in zip(
+            range(routes),
+            itertools.cycle(_BASE_ROUTES),
+            strict=False,
+        )
     ]
     return URLResolver(
         RegexPattern(r''),
         [
             path(
                 'api/',
-                include((inner_patterns, 'app-name'), namespace='api'),
+                include(
+                    (Router(inner_patterns, compiled=compiled).urls, 'app'),
+                    namespace='api',
+                ),
             ),
         ],
     )
 
 
-def _pick_url(case: Literal['best', 'avg', 'worst']) -> str:
+def _pick_url(case: Literal['best', 'avg', 'worst'], routes: int) -> str:
     match case:
         case 'best':
             return 'api/users/'
         case 'avg':
-            return 'api/tags/sometag'
+            middle_copy = routes // len(_BASE_ROUTES) // 2
+            return f'api/{_suffixed("tags/sometag", middle_copy)}'
         case 'worst':
             return 'api/no-such-path/'
         case other:
@@ -96,23 +122,32 @@ _REPEAT: Final = 1_000_100
 def main() -> None:
     """Run the URL resolver benchmark."""
     parser = argparse.ArgumentParser()
-    parser.add_argument('--impl', choices=['dmr', 'django'], required=True)
+    parser.add_argument(
+        '--impl',
+        choices=['dmr', 'compiled', 'django'],
+        required=True,
+    )
     parser.add_argument(
         '--case',
         choices=['best', 'avg', 'worst'],
         required=True,
     )
+    parser.add_argument('--routes', type=int, default=len(_BASE_ROUTES))
     parser.add_argument('--repeat', type=int, default=_REPEAT)
     args = parser.parse_args()
     match args.impl:
-        case 'dmr':
+        case 'dmr' | 'compiled':
             path = dmr_path
         case 'django':
             path = django_path
         case other:
             raise ValueError(f"Unknown impl '{other}'")
-    resolver = _build_resolver(path)
-    _bench(resolver.resolve, _pick_url(args.case), args.repeat)
+    resolver = _build_resolver(
+        path,
+        args.routes,
+        compiled=args.impl == 'compiled',
+    )
+    _bench(resolver.resolve, _pick_url(args.case, args.routes), args.repeat)
 
 
 if __name__ == '__main__':
@@ -3,6 +3,7 @@ from django_modern_rest.components import Cookies as Cookies
 from django_modern_rest.components import Headers as Headers
 from django_modern_rest.components import Path as Path
 from django_modern_rest.components import Query as Query
+from django_modern_rest.components import StreamingBody as StreamingBody
 from django_modern_rest.controller import Blueprint as Blueprint
 from django_modern_rest.controller import Controller as Controller
 from django_modern_rest.cookies import CookieSpec as CookieSpec
@@ -13,3 +14,4 @@ from django_modern_rest.headers import HeaderSpec as HeaderSpec
 from django_modern_rest.headers import NewHeader as NewHeader
 from django_modern_rest.response import APIError as APIError
 from django_modern_rest.response import ResponseSpec as ResponseSpec
+from django_modern_rest.sse import ServerSentEvent as ServerSentEvent
@@ -0,0 +1,83 @@
+import io
+from collections.abc import Awaitable, Callable, Mapping
+from typing import IO, Any, TypeAlias, final
+
+import django
+from django.core.exceptions import RequestAborted
+from django.core.handlers import asgi
+from typing_extensions import override
+
+from django_modern_rest.settings import Settings, resolve_setting
+
+_Message: TypeAlias = Mapping[str, Any]
+_Receive: TypeAlias = Callable[[], Awaitable[_Message]]
+
+
+class ASGIHandler(asgi.ASGIHandler):
+    """
+    Drop-in replacement for :class:`django.core.handlers.asgi.ASGIHandler`.
+
+    Django spools all request bodies to
+    a :class:`tempfile.SpooledTemporaryFile`, which copies the body twice
+    and rolls over to disk for bodies bigger than
+    ``FILE_UPLOAD_MAX_MEMORY_SIZE`` setting.
+
+    We read request bodies up to
+    :data:`~django_modern_rest.settings.Settings.max_memory_body_size`
+    directly to memory. Body chunks are joined only once,
+    and ``request.body`` returns this exact object.
+    Bigger bodies are handled by Django, as usual.
+    """
+
+    @override
+    async def read_body(self, receive: _Receive) -> IO[bytes]:
+        """Reads an HTTP body from an ASGI connection."""
+        max_size: int = resolve_setting(Settings.max_memory_body_size)
+        chunks: list[bytes] = []
+        body_size = 0
+        while True:  # noqa: WPS457
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                # Early client disconnect.
+                raise RequestAborted
+            chunk = message.get('body', b'')
+            chunks.append(chunk)
+            body_size += len(chunk)
+            if not message.get('more_body', False):
+                return io.BytesIO(b''.join(chunks))
+            if body_size > max_size:
+                return await super().read_body(
+                    _ReplayReceive(b''.join(chunks), receive),
+                )
+
+
+@final
+class _ReplayReceive:
+    """Returns the already received *body* before other messages."""
+
+    __slots__ = ('_body', '_receive')
+
+    def __init__(self, body: bytes, receive: _Receive) -> None:
+        self._body: bytes | None = body
+        self._receive = receive
+
+    async def __call__(self) -> _Message:
+        if self._body is None:
+            return await self._receive()
+        message = {
+            'type': 'http.request',
+            'body': self._body,
+            'more_body': True,
+        }
+        self._body = None
+        return message
+
+
+def get_asgi_application() -> ASGIHandler:
+    """
+    Drop-in replacement for :func:`django.core.asgi.get_asgi_application`.
+
+    Returns our :class:`ASGIHandler`.
+    """
+    django.setup(set_prefix=False)
+    return ASGIHandler()
@@ -8,8 +8,16 @@ from django_modern_rest.exceptions import (
     DataParsingError,
     RequestSerializationError,
 )
+from django_modern_rest.internal.request_meta import (
+    field_names,
+    header_meta_keys,
+    parse_cookies,
+    parse_query,
+    sequence_field_names,
+)
 from django_modern_rest.response import ResponseSpec
 from django_modern_rest.serialization import BaseSerializer
+from django_modern_rest.streaming import BodyStream
 
 if TYPE_CHECKING:
     from django_modern_rest.controller import Blueprint
@@ -29,6 +37,7 @@ class ComponentParser:
 
     # Internal API:
     __is_base_type__: ClassVar[bool] = True
+    __validates_data__: ClassVar[bool] = False
 
     @classmethod
     @abc.abstractmethod
@@ -47,6 +56,26 @@ class ComponentParser:
         """
         raise NotImplementedError
 
+    @classmethod
+    def provide_validated_data(
+        cls,
+        blueprint: 'Blueprint[BaseSerializer]',
+        model: Any,
+        request: HttpRequest,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Return value already validated against *model*.
+
+        Must be redefined when ``__validates_data__`` is set.
+        Must raise ``serializer.validation_error`` or
+        :exc:`~django_modern_rest.exceptions.DataParsingError`
+        when data is not valid, in this case :meth:`provide_context_data`
+        is used to report errors in the same format as other components.
+        """
+        raise NotImplementedError
+
     @classmethod
     def provide_responses(
         cls,
@@ -67,6 +96,29 @@ class ComponentParser:
             ),
         ]
 
+    @classmethod
+    def _check_content_type(
+        cls,
+        serializer: type[BaseSerializer],
+        request: HttpRequest,
+    ) -> bool:
+        """
+        Used by components that parse request body.
+
+        Returns ``True`` for newline delimited json bodies.
+        """
+        if request.content_type == serializer.content_type:
+            return False
+        if request.content_type in serializer.ndjson_content_types:
+            return True
+        raise RequestSerializationError(
+            serializer.error_serialize(
+                'Cannot parse request body '
+                f'with content type {request.content_type!r}, '
+                f'expected {serializer.content_type!r}',
+            ),
+        )
+
 
 class Query(ComponentParser, Generic[_QueryT]):
     """
@@ -92,6 +144,11 @@ class Query(ComponentParser, Generic[_QueryT]):
     Will parse a request like ``?category=cars&reversed=true``
     into ``ProductQuery`` model.
 
+    When model's fields are known, we parse only them from the query string.
+    Fields like ``tags: list[str]`` get all the values,
+    other fields get the last value.
+    Otherwise, the whole ``request.GET`` is validated.
+
     You can access parsed query as ``self.parsed_query`` attribute.
     """
 
@@ -108,7 +165,14 @@ class Query(ComponentParser, Generic[_QueryT]):
         *args: Any,
         **kwargs: Any,
     ) -> Any:
-        return request.GET
+        names = field_names(blueprint.serializer, model)  # type: ignore[arg-type]
+        if names is None:
+            return request.GET
+        return parse_query(
+            request,
+            names,
+            sequence_field_names(blueprint.serializer, model),  # type: ignore[arg-type]
+        )
 
 
 class Body(ComponentParser, Generic[_BodyT]):
@@ -135,12 +199,20 @@ class Body(ComponentParser, Generic[_BodyT]):
     Will parse a body like ``{'email': 'user@mail.ru', 'age': 18}`` into
     ``UserCreateInput`` model.
 
+    Models like ``list[UserCreateInput]`` can also be parsed
+    from newline delimited json bodies, one item per line.
+    See ``ndjson_content_types`` of
+    :class:`~django_modern_rest.serialization.BaseSerializer`.
+
     You can access parsed body as ``self.parsed_body`` attribute.
     """
 
     parsed_body: _BodyT
     context_name: ClassVar[str] = 'parsed_body'
 
+    # Internal API:
+    __validates_data__: ClassVar[bool] = True
+
     @override
     @classmethod
     def provide_context_data(
@@ -152,21 +224,123 @@ class Body(ComponentParser, Generic[_BodyT]):
         **kwargs: Any,
     ) -> Any:
         serializer = blueprint.serializer
-        if request.content_type != serializer.content_type:
-            raise RequestSerializationError(
-                serializer.error_serialize(
-                    'Cannot parse request body '
-                    f'with content type {request.content_type!r}, '
-                    f'expected {serializer.content_type!r}',
-                ),
-            )
+        deserialize = (
+            serializer.deserialize_ndjson
+            if cls._check_content_type(serializer, request)
+            else serializer.deserialize
+        )
         try:
-            return serializer.deserialize(request.body)
+            return deserialize(request.body)
         except DataParsingError as exc:
             raise RequestSerializationError(
                 serializer.error_serialize(str(exc)),
             ) from exc
 
+    @override
+    @classmethod
+    def provide_validated_data(
+        cls,
+        blueprint: 'Blueprint[BaseSerializer]',
+        model: Any,
+        request: HttpRequest,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        # Decodes json directly into the model, without python primitives:
+        serializer = blueprint.serializer
+        strict = blueprint.serializer_context_cls.strict_validation
+        if cls._check_content_type(serializer, request):
+            return serializer.from_ndjson(request.body, model, strict=strict)
+        return serializer.from_json(request.body, model, strict=strict)
+
+
+class StreamingBody(ComponentParser, Generic[_BodyT]):
+    """
+    Parses big json array request bodies item by item.
+
+    For example:
+
+    .. code:: python
+
+        >>> import pydantic
+        >>> from django_modern_rest import StreamingBody, Controller
+        >>> from django_modern_rest.plugins.pydantic import PydanticSerializer
+
+        >>> class ProductInput(pydantic.BaseModel):
+        ...     name: str
+        ...     price: int
+
+        >>> class ProductImportController(
+        ...     StreamingBody[ProductInput],
+        ...     Controller[PydanticSerializer],
+        ... ):
+        ...     def post(self) -> int:
+        ...         count = 0
+        ...         for product in self.parsed_body:
+        ...             count += 1  # save `product` here
+        ...         return count
+
+    Will parse a body like ``[{"name": "car", "price": 10}, ...]``
+    into ``ProductInput`` models, one at a time.
+    Newline delimited json bodies are parsed line by line.
+    Unlike :class:`Body`, it does not read the whole request body
+    to memory, only the current item and
+    a :attr:`chunk_size` buffer are kept.
+
+    You can iterate over parsed items in ``self.parsed_body`` attribute,
+    which is a :class:`~django_modern_rest.streaming.BodyStream`.
+    """
+
+    parsed_body: BodyStream[_BodyT]
+    context_name: ClassVar[str] = 'parsed_body'
+
+    #: How many bytes of request body are read at once, subclass to change.
+    chunk_size: ClassVar[int] = 64 * 1024  # noqa: WPS432
+
+    # Internal API:
+    __validates_data__: ClassVar[bool] = True
+
+    @override
+    @classmethod
+    def provide_context_data(
+        cls,
+        blueprint: 'Blueprint[BaseSerializer]',
+        model: Any,
+        request: HttpRequest,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        # This is only used to report errors of other components:
+        return Body.provide_context_data(
+            blueprint,
+            model,
+            request,
+            *args,
+            **kwargs,
+        )
+
+    @override
+    @classmethod
+    def provide_validated_data(
+        cls,
+        blueprint: 'Blueprint[BaseSerializer]',
+        model: Any,
+        request: HttpRequest,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        serializer = blueprint.serializer
+        return BodyStream(
+            serializer.split_body(
+                request.read,
+                cls.chunk_size,
+                ndjson=cls._check_content_type(serializer, request),
+            ),
+            serializer,
+            model,
+            strict=blueprint.serializer_context_cls.strict_validation,
+        )
+
 
 class Headers(ComponentParser, Generic[_HeadersT]):
     """
@@ -191,6 +365,11 @@ class Headers(ComponentParser, Generic[_HeadersT]):
     Will parse request headers like ``Token: secret`` into ``AuthHeaders``
     model.
 
+    Declared headers are looked up the same way
+    as ``request.headers[name]`` does: names are case-insensitive
+    and underscores match dashes, so ``x_api_key`` field
+    is read from ``X-Api-Key`` header.
+
     You can access parsed headers as ``self.parsed_headers`` attribute.
     """
 
@@ -207,7 +386,16 @@ class Headers(ComponentParser, Generic[_HeadersT]):
         *args: Any,
         **kwargs: Any,
     ) -> Any:
-        return request.headers
+        names = field_names(blueprint.serializer, model)  # type: ignore[arg-type]
+        if names is None:
+            return request.headers
+        # We only read declared headers, without building `request.headers`:
+        meta = request.META
+        return {
+            header_name: meta[meta_key]
+            for header_name, meta_key in header_meta_keys(names)
+            if meta_key in meta
+        }
 
 
 class Path(ComponentParser, Generic[_PathT]):
@@ -329,4 +517,8 @@ class Cookies(ComponentParser, Generic[_CookiesT]):
         *args: Any,
         **kwargs: Any,
     ) -> Any:
-        return request.COOKIES
+        names = field_names(blueprint.serializer, model)  # type: ignore[arg-type]
+        if names is None or 'COOKIES' in request.__dict__:
+            # Cookies were already parsed, or we need all of them:
+            return request.COOKIES
+        return parse_cookies(request.META.get('HTTP_COOKIE', ''), names)
@@ -9,8 +9,9 @@ from typing import (
     get_args,
 )
 
+from asgiref.sync import markcoroutinefunction
 from django.http import HttpRequest, HttpResponse
-from django.utils.functional import cached_property, classproperty
+from django.utils.functional import classproperty
 from django.views import View
 from typing_extensions import deprecated, override
 
@@ -23,6 +24,7 @@ from django_modern_rest.exceptions import (
 from django_modern_rest.internal.io import identity
 from django_modern_rest.response import (
     ResponseSpec,
+    SerializedResponse,
     build_response,
 )
 from django_modern_rest.serialization import BaseSerializer, SerializerContext
@@ -82,6 +84,9 @@ class Blueprint(Generic[_SerializerT_co]):  # noqa: WPS214
             that we disable for this class.
         validate_responses: Boolean whether or not validating responses.
             Works in runtime, can be disabled for better performance.
+        validate_responses_sample_rate: Fraction of responses to validate,
+            from ``0.0`` to ``1.0``. When it is less than ``1.0``,
+            validation errors are logged instead of being returned.
         responses: List of responses schemas that this controller can return.
             Also customizable in endpoints and globally with ``'responses'``
             key in the settings.
@@ -107,6 +112,7 @@ class Blueprint(Generic[_SerializerT_co]):  # noqa: WPS214
     )
     no_validate_http_spec: ClassVar[Set[HttpSpec]] = frozenset()
     validate_responses: ClassVar[bool | None] = None
+    validate_responses_sample_rate: ClassVar[float | None] = None
     responses: ClassVar[list[ResponseSpec]] = []
     responses_from_components: ClassVar[bool] = True
     http_methods: ClassVar[Set[str]] = frozenset(
@@ -322,6 +328,9 @@ class Controller(Blueprint[_SerializerT_co], View):  # noqa: WPS214
             that we disable for this class.
         validate_responses: Boolean whether or not validating responses.
             Works in runtime, can be disabled for better performance.
+        validate_responses_sample_rate: Fraction of responses to validate,
+            from ``0.0`` to ``1.0``. When it is less than ``1.0``,
+            validation errors are logged instead of being returned.
         responses: List of responses schemas that this controller can return.
             Also customizable in endpoints and globally with ``'responses'``
             key in the settings.
@@ -335,6 +344,8 @@ class Controller(Blueprint[_SerializerT_co], View):  # noqa: WPS214
         kwargs: Path named parameters of the request.
         blueprints: A sequence of :class:`Blueprint` types
             that should be composed together.
+        blueprint: Blueprint instance that serves the current request, if any.
+            It is created for each request, just like the controller itself.
 
     """
 
@@ -351,6 +362,9 @@ class Controller(Blueprint[_SerializerT_co], View):  # noqa: WPS214
     # Protected API:
     _blueprint_per_method: ClassVar[Mapping[str, _BlueprintT]]
     _is_async: ClassVar[bool | None] = None  # `None` means that nothing's found
+    _allowed_methods: ClassVar[list[str]]
+    _method_not_allowed_responses: ClassVar[Mapping[str, SerializedResponse]]
+    _options_response: ClassVar[SerializedResponse]
 
     @override
     def __init_subclass__(cls) -> None:
@@ -383,6 +397,7 @@ class Controller(Blueprint[_SerializerT_co], View):  # noqa: WPS214
             for canonical in blueprint._existing_http_methods  # noqa: SLF001
         }
         cls._is_async = cls.controller_validator_cls()(cls)
+        cls._prebuild_responses()
 
     @override
     def setup(self, request: HttpRequest, *args: Any, **kwargs: Any) -> None:
@@ -393,16 +408,51 @@ class Controller(Blueprint[_SerializerT_co], View):  # noqa: WPS214
         """
         super().setup(request, *args, **kwargs)
         # Controller is created once per request, so we can assign attributes.
-        blueprint = self._blueprint_per_method.get(
+        blueprint_cls = self._blueprint_per_method.get(
             request.method,  # type: ignore[arg-type]
         )
-        if blueprint:
-            instance = blueprint()
-            instance.setup(request, *args, **kwargs)
-            # We validate that serializers match:
-            self.blueprint = instance  # type: ignore[assignment]
-        else:
+        if blueprint_cls is None:
             self.blueprint = None
+            return
+        # Blueprint endpoints are called with this instance as `self`
+        # and parsed components are bound to it, so it is not shared:
+        blueprint = blueprint_cls()
+        blueprint.setup(request, *args, **kwargs)
+        # We validate that serializers match:
+        self.blueprint = blueprint  # type: ignore[assignment]
+
+    @classmethod
+    def as_fast_view(cls) -> Callable[..., HttpResponse]:
+        """
+        Faster alternative to :meth:`~django.views.generic.base.View.as_view`.
+
+        Returns a view function that goes straight from the request
+        to the endpoint, without ``dispatch`` and ``Endpoint.__call__``
+        calls on every request.
+        Endpoints and blueprints are resolved during the import time.
+
+        Works with blueprints and with custom ``dispatch`` methods,
+        including :func:`~django_modern_rest.decorators.wrap_middleware`
+        and :func:`~django_modern_rest.decorators.dispatch_decorator`,
+        but does not optimize them: custom ``dispatch`` is still called.
+
+        Unlike ``as_view``, does not accept any initialization arguments.
+        """
+        if cls.dispatch is Controller.dispatch:
+            view = cls._direct_dispatch_view()
+        else:
+            view = cls._custom_dispatch_view()
+
+        view.view_class = cls  # type: ignore[attr-defined]
+        view.view_initkwargs = {}  # type: ignore[attr-defined]
+        # Copy attributes the same way Django does in `View.as_view`:
+        view.__doc__ = cls.__doc__
+        view.__module__ = cls.__module__
+        view.__annotations__ = cls.dispatch.__annotations__
+        view.__dict__.update(cls.dispatch.__dict__)
+        if cls.view_is_async:
+            markcoroutinefunction(view)
+        return view
 
     @override
     def dispatch(
@@ -420,8 +470,6 @@ class Controller(Blueprint[_SerializerT_co], View):  # noqa: WPS214
         method: str = request.method  # type: ignore[assignment]
         endpoint = self.api_endpoints.get(method)
         if endpoint is not None:
-            # TODO: support `StreamingHttpResponse`
-            # TODO: support `FileResponse`
             # TODO: support redirects
             return endpoint(self, *args, **kwargs)
         # This return is very special,
@@ -546,22 +594,38 @@ class Controller(Blueprint[_SerializerT_co], View):  # noqa: WPS214
         Return error response for 405 response code.
 
         It is special in way that we don't have an endpoint associated with it.
+        Responses for all known HTTP methods are pre-built once,
+        see :meth:`build_method_not_allowed` to customize them.
+        """
+        response = cls._method_not_allowed_responses.get(method)
+        return cls._maybe_wrap(
+            cls.build_method_not_allowed(method)
+            if response is None
+            else response.copy(),
+        )
+
+    @classmethod
+    def build_method_not_allowed(cls, method: str) -> SerializedResponse:
+        """
+        Build a new response for 405 response code.
+
+        Called once per HTTP method during the controller's creation,
+        responses are cached and copied for each request.
+        Called for each request with unknown HTTP methods.
         """
         # This method cannot call `self.to_response`, because it does not have
         # an endpoint associated with it. We switch to lower level
         # `build_response` primitive
-        allowed_methods = sorted(cls.api_endpoints.keys())
-        return cls._maybe_wrap(
-            build_response(
-                cls.serializer,
-                raw_data={
-                    'detail': (
-                        f'Method {method!r} is not allowed, '
-                        f'allowed: {allowed_methods!r}'
-                    ),
-                },
-                status_code=HTTPStatus.METHOD_NOT_ALLOWED,
-            ),
+        return build_response(
+            cls.serializer,
+            raw_data={
+                'detail': (
+                    f'Method {method!r} is not allowed, '
+                    f'allowed: {cls._allowed_methods!r}'
+                ),
+            },
+            headers={'Allow': ', '.join(cls._allowed_methods)},
+            status_code=HTTPStatus.METHOD_NOT_ALLOWED,
         )
 
     @classproperty
@@ -570,13 +634,72 @@ class Controller(Blueprint[_SerializerT_co], View):  # noqa: WPS214
         """We already know this in advance, no need to recalculate."""
         return cls._is_async is True
 
-    @cached_property
+    @property
     def active_blueprint(self) -> Blueprint[_SerializerT_co]:
-        """Returns a blueprint if it was used, otherwise, returns self."""
+        """
+        Returns a blueprint if it was used, otherwise, returns self.
+
+        It is not cached on purpose: caching ``self`` on the instance
+        creates a reference cycle, and the controller is not freed
+        until the garbage collector runs.
+        """
         return self.blueprint or self
 
     # Protected API:
 
+    @classmethod
+    def _prebuild_responses(cls) -> None:
+        cls._allowed_methods = sorted(cls.api_endpoints.keys())
+        cls._method_not_allowed_responses = {
+            method.value: cls.build_method_not_allowed(method.value)
+            for method in HTTPMethod
+            if method not in cls.api_endpoints
+        }
+        if HTTPMethod.OPTIONS not in cls.api_endpoints:
+            return
+        # Is used by `MetaMixin` and `AsyncMetaMixin`:
+        cls._options_response = build_response(
+            cls.serializer,
+            raw_data=None,
+            headers={'Allow': ', '.join(cls._allowed_methods)},
+            status_code=HTTPStatus.NO_CONTENT,
+        )
+
+    @classmethod
+    def _direct_dispatch_view(cls) -> Callable[..., HttpResponse]:
+        endpoints = {
+            method: endpoint._func  # noqa: SLF001
+            for method, endpoint in cls.api_endpoints.items()
+        }
+
+        def view(  # noqa: WPS430
+            request: HttpRequest,
+            *args: Any,
+            **kwargs: Any,
+        ) -> HttpResponse:
+            method: str = request.method  # type: ignore[assignment]
+            func = endpoints.get(method)
+            if func is None:
+                return cls.handle_method_not_allowed(method)
+            controller = cls()
+            controller.setup(request, *args, **kwargs)
+            return func(controller, *args, **kwargs)  # type: ignore[no-any-return]
+
+        return view
+
+    @classmethod
+    def _custom_dispatch_view(cls) -> Callable[..., HttpResponse]:
+        def view(  # noqa: WPS430
+            request: HttpRequest,
+            *args: Any,
+            **kwargs: Any,
+        ) -> HttpResponse:
+            controller = cls()
+            controller.setup(request, *args, **kwargs)
+            return controller.dispatch(request, *args, **kwargs)
+
+        return view
+
     @classmethod
     def _maybe_wrap(
         cls,
@@ -2,10 +2,16 @@
 # https://github.com/litestar-org/litestar/blob/main/litestar/datastructures/cookie.py
 # under MIT license.
 
+import copy
 import dataclasses
+import time
+from collections.abc import Mapping
 from http.cookies import Morsel, SimpleCookie
 from typing import Any, ClassVar, Literal, final
 
+from django.http.response import HttpResponseBase
+from django.utils.http import http_date
+
 
 @dataclasses.dataclass(frozen=True, slots=True, kw_only=True)
 class _BaseCookie:
@@ -112,3 +118,31 @@ class NewCookie(_BaseCookie):
     def as_dict(self) -> dict[str, Any]:
         """Converts to a dictionary ."""
         return dataclasses.asdict(self)
+
+
+def render_cookies(cookies: Mapping[str, NewCookie]) -> SimpleCookie:
+    """
+    Renders new cookies to morsels once, so they can be reused.
+
+    ``expires`` that is computed from ``max_age`` is left empty,
+    because it is relative to the current time.
+    Use :func:`copy_cookies` to set rendered cookies to a response.
+    """
+    response = HttpResponseBase()
+    for cookie_key, new_cookie in cookies.items():
+        namespace = new_cookie.as_dict()
+        max_age = namespace.pop('max_age')
+        response.set_cookie(cookie_key, **namespace)
+        if max_age is not None:
+            response.cookies[cookie_key]['max-age'] = max_age
+    return response.cookies
+
+
+def copy_cookies(response: HttpResponseBase, cookies: SimpleCookie) -> None:
+    """Sets copies of cookies from :func:`render_cookies` to *response*."""
+    for cookie_key, morsel in cookies.items():
+        cookie = copy.copy(morsel)
+        max_age = cookie['max-age']
+        if isinstance(max_age, int) and not cookie['expires']:
+            cookie['expires'] = http_date(time.time() + max_age)
+        response.cookies[cookie_key] = cookie
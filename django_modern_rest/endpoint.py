@@ -1,5 +1,5 @@
 import inspect
-from collections.abc import Awaitable, Callable, Mapping, Set
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping, Set
 from http import HTTPStatus
 from typing import (
     TYPE_CHECKING,
@@ -10,6 +10,7 @@ from typing import (
 )
 
 from django.http import HttpResponse
+from django.http.response import HttpResponseBase
 from typing_extensions import ParamSpec, Protocol, TypeVar, deprecated
 
 from django_modern_rest.cookies import NewCookie
@@ -30,6 +31,15 @@ from django_modern_rest.settings import (
     Settings,
     resolve_setting,
 )
+from django_modern_rest.sse import (
+    ServerSentEvent,
+    build_event_stream_response,
+)
+from django_modern_rest.streaming import (
+    accepted_ndjson,
+    build_streaming_response,
+)
+from django_modern_rest.types import is_safe_subclass
 from django_modern_rest.validation import (
     EndpointMetadataValidator,
     ModifyEndpointPayload,
@@ -103,17 +113,36 @@ class Endpoint:  # noqa: WPS214
         self.metadata = metadata
 
         # We need a func before any wrappers, but with metadata:
+        # Endpoint options have priority over blueprint and controller ones,
+        # we resolve them once, not on every request:
+        owner_classes = (blueprint_cls, controller_cls)
         self.response_validator = self.response_validator_cls(
             metadata,
             controller_cls.serializer,
+            validate_responses=self._resolve_option(
+                metadata.validate_responses,
+                'validate_responses',
+                owner_classes,
+            ),
+            validate_responses_sample_rate=self._resolve_option(
+                metadata.validate_responses_sample_rate,
+                'validate_responses_sample_rate',
+                owner_classes,
+            ),
         )
         # We can now run endpoint's optimization:
-        controller_cls.serializer.optimizer.optimize_endpoint(metadata)
+        controller_cls.serializer.optimizer.optimize_endpoint(
+            metadata,
+            controller_cls.serializer,
+        )
 
         # Now we can add wrappers:
         if inspect.iscoroutinefunction(func):
             self.is_async = True
             self._func = self._async_endpoint(func)
+        elif inspect.isasyncgenfunction(func):
+            self.is_async = True
+            self._func = self._async_endpoint(self._async_generator(func))
         else:
             self.is_async = False
             self._func = self._sync_endpoint(func)
@@ -204,12 +233,12 @@ class Endpoint:  # noqa: WPS214
     def _async_endpoint(
         self,
         func: Callable[..., Any],
-    ) -> Callable[..., Awaitable[HttpResponse]]:
+    ) -> Callable[..., Awaitable[HttpResponseBase]]:
         async def decorator(
             controller: 'Controller[BaseSerializer]',
             *args: Any,
             **kwargs: Any,
-        ) -> HttpResponse:
+        ) -> HttpResponseBase:
             active_blueprint = controller.active_blueprint
             # Parse request:
             try:
@@ -239,15 +268,26 @@ class Endpoint:  # noqa: WPS214
 
         return decorator
 
+    def _async_generator(
+        self,
+        func: Callable[..., AsyncIterator[Any]],
+    ) -> Callable[..., Awaitable[Any]]:
+        # Async generators are awaited as regular async endpoints.
+        # Their errors happen during streaming and can't be handled here:
+        async def factory(*args: Any) -> AsyncIterator[Any]:  # noqa: RUF029
+            return func(*args)
+
+        return factory
+
     def _sync_endpoint(
         self,
         func: Callable[..., Any],
-    ) -> Callable[..., HttpResponse]:
+    ) -> Callable[..., HttpResponseBase]:
         def decorator(
             controller: 'Controller[BaseSerializer]',
             *args: Any,
             **kwargs: Any,
-        ) -> HttpResponse:
+        ) -> HttpResponseBase:
             active_blueprint = controller.active_blueprint
             # Parse request:
             try:
@@ -277,11 +317,25 @@ class Endpoint:  # noqa: WPS214
 
         return decorator
 
+    def _resolve_option(
+        self,
+        endpoint_value: Any,
+        option_name: str,
+        owner_classes: tuple[type[Any] | None, ...],
+    ) -> Any:
+        if endpoint_value is not None:
+            return endpoint_value
+        for owner_cls in owner_classes:
+            owner_value = getattr(owner_cls, option_name, None)
+            if owner_value is not None:
+                return owner_value
+        return None
+
     def _make_http_response(
         self,
         controller: 'Controller[BaseSerializer]',
         raw_data: Any | HttpResponse,
-    ) -> HttpResponse:
+    ) -> HttpResponseBase:
         """
         Returns the actual ``HttpResponse`` object after optional validation.
 
@@ -305,8 +359,10 @@ class Endpoint:  # noqa: WPS214
         self,
         controller: 'Controller[BaseSerializer]',
         raw_data: Any | HttpResponse,
-    ) -> HttpResponse:
-        if isinstance(raw_data, HttpResponse):
+    ) -> HttpResponseBase:
+        if isinstance(raw_data, HttpResponseBase):
+            # `StreamingHttpResponse` is not an `HttpResponse` subclass,
+            # but it is served the same way:
             return self.response_validator.validate_response(
                 controller,
                 raw_data,
@@ -316,12 +372,43 @@ class Endpoint:  # noqa: WPS214
             controller,
             raw_data,
         )
+        if validated.streaming and is_safe_subclass(
+            validated.return_type,
+            ServerSentEvent,
+        ):
+            return build_event_stream_response(
+                controller.serializer,
+                events=validated.raw_data,
+                event_type=validated.return_type,
+                status_code=validated.status_code,
+                headers=validated.headers,
+                cookies=validated.cookies,
+                validate_event=validated.validate_item,
+                heartbeat_interval=resolve_setting(
+                    Settings.sse_heartbeat_interval,
+                ),
+            )
+        if validated.streaming:
+            return build_streaming_response(
+                controller.serializer,
+                stream=validated.raw_data,
+                item_type=validated.return_type,
+                status_code=validated.status_code,
+                headers=validated.headers,
+                cookies=validated.cookies,
+                validate_item=validated.validate_item,
+                ndjson_content_type=accepted_ndjson(
+                    controller.serializer,
+                    controller.request.META.get('HTTP_ACCEPT', ''),
+                ),
+            )
         return build_response(
             controller.serializer,
             raw_data=validated.raw_data,
             status_code=validated.status_code,
             headers=validated.headers,
             cookies=validated.cookies,
+            return_type=validated.return_type,
         )
 
     def _handle_default_error(
@@ -342,7 +429,10 @@ class Endpoint:  # noqa: WPS214
 
 _ParamT = ParamSpec('_ParamT')
 _ReturnT = TypeVar('_ReturnT')
-_ResponseT = TypeVar('_ResponseT', bound=HttpResponse | Awaitable[HttpResponse])
+_ResponseT = TypeVar(
+    '_ResponseT',
+    bound=HttpResponseBase | Awaitable[HttpResponseBase],
+)
 
 
 @overload
@@ -352,6 +442,7 @@ def validate(  # noqa: WPS234
     *responses: ResponseSpec,
     error_handler: AsyncErrorHandlerT,
     validate_responses: bool | None = None,
+    validate_responses_sample_rate: float | None = None,
     no_validate_http_spec: Set[HttpSpec] | None = None,
     allow_custom_http_methods: bool = False,
 ) -> Callable[
@@ -367,6 +458,7 @@ def validate(
     *responses: ResponseSpec,
     error_handler: SyncErrorHandlerT,
     validate_responses: bool | None = None,
+    validate_responses_sample_rate: float | None = None,
     no_validate_http_spec: Set[HttpSpec] | None = None,
     allow_custom_http_methods: bool = False,
 ) -> Callable[
@@ -381,6 +473,7 @@ def validate(
     /,
     *responses: ResponseSpec,
     validate_responses: bool | None = None,
+    validate_responses_sample_rate: float | None = None,
     no_validate_http_spec: Set[HttpSpec] | None = None,
     error_handler: None = None,
     allow_custom_http_methods: bool = False,
@@ -395,6 +488,7 @@ def validate(  # noqa: WPS211  # pyright: ignore[reportInconsistentOverload]
     /,
     *responses: ResponseSpec,
     validate_responses: bool | None = None,
+    validate_responses_sample_rate: float | None = None,
     no_validate_http_spec: Set[HttpSpec] | None = None,
     error_handler: SyncErrorHandlerT | AsyncErrorHandlerT | None = None,
     allow_custom_http_methods: bool = False,
@@ -460,6 +554,10 @@ def validate(  # noqa: WPS211  # pyright: ignore[reportInconsistentOverload]
             of responses for this endpoint? Customizable via global setting,
             per controller, and per endpoint.
             Here we only store the per endpoint information.
+        validate_responses_sample_rate: Fraction of responses to validate,
+            from ``0.0`` to ``1.0``. When it is less than ``1.0``,
+            validation errors are logged instead of being returned.
+            Customizable the same way as *validate_responses*.
         no_validate_http_spec: Set of http spec validation checks
             that we disable for this endpoint.
         error_handler: Callback function to be called
@@ -497,6 +595,7 @@ def validate(  # noqa: WPS211  # pyright: ignore[reportInconsistentOverload]
         payload=ValidateEndpointPayload(
             responses=[response, *responses],
             validate_responses=validate_responses,
+            validate_responses_sample_rate=validate_responses_sample_rate,
             no_validate_http_spec=no_validate_http_spec,
             error_handler=error_handler,
             allow_custom_http_methods=allow_custom_http_methods,
@@ -590,6 +689,7 @@ def modify(
     headers: Mapping[str, NewHeader] | None = None,
     cookies: Mapping[str, NewCookie] | None = None,
     validate_responses: bool | None = None,
+    validate_responses_sample_rate: float | None = None,
     extra_responses: list[ResponseSpec] | None = None,
     no_validate_http_spec: Set[HttpSpec] | None = None,
     allow_custom_http_methods: bool = False,
@@ -613,6 +713,7 @@ def modify(
     headers: Mapping[str, NewHeader] | None = None,
     cookies: Mapping[str, NewCookie] | None = None,
     validate_responses: bool | None = None,
+    validate_responses_sample_rate: float | None = None,
     extra_responses: list[ResponseSpec] | None = None,
     no_validate_http_spec: Set[HttpSpec] | None = None,
     allow_custom_http_methods: bool = False,
@@ -635,6 +736,7 @@ def modify(
     headers: Mapping[str, NewHeader] | None = None,
     cookies: Mapping[str, NewCookie] | None = None,
     validate_responses: bool | None = None,
+    validate_responses_sample_rate: float | None = None,
     extra_responses: list[ResponseSpec] | None = None,
     no_validate_http_spec: Set[HttpSpec] | None = None,
     error_handler: None = None,
@@ -657,6 +759,7 @@ def modify(  # noqa: WPS211
     headers: Mapping[str, NewHeader] | None = None,
     cookies: Mapping[str, NewCookie] | None = None,
     validate_responses: bool | None = None,
+    validate_responses_sample_rate: float | None = None,
     extra_responses: list[ResponseSpec] | None = None,
     no_validate_http_spec: Set[HttpSpec] | None = None,
     error_handler: SyncErrorHandlerT | AsyncErrorHandlerT | None = None,
@@ -701,6 +804,10 @@ def modify(  # noqa: WPS211
             of responses for this endpoint? Customizable via global setting,
             per controller, and per endpoint.
             Here we only store the per endpoint information.
+        validate_responses_sample_rate: Fraction of responses to validate,
+            from ``0.0`` to ``1.0``. When it is less than ``1.0``,
+            validation errors are logged instead of being returned.
+            Customizable the same way as *validate_responses*.
         no_validate_http_spec: Set of http spec validation checks
             that we disable for this endpoint.
         error_handler: Callback function to be called
@@ -745,6 +852,7 @@ def modify(  # noqa: WPS211
             cookies=cookies,
             responses=extra_responses,
             validate_responses=validate_responses,
+            validate_responses_sample_rate=validate_responses_sample_rate,
             no_validate_http_spec=no_validate_http_spec,
             error_handler=error_handler,
             allow_custom_http_methods=allow_custom_http_methods,
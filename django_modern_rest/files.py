@@ -0,0 +1,219 @@
+import dataclasses
+import mimetypes
+import os
+import re
+from collections.abc import Iterator
+from http import HTTPStatus
+from pathlib import Path
+from typing import IO, Final, Literal, final
+from urllib.parse import quote
+
+from django.http import FileResponse, HttpRequest, HttpResponse
+from django.http.response import HttpResponseBase
+from django.utils.http import content_disposition_header
+
+from django_modern_rest.settings import Settings, resolve_setting
+
+#: Headers set by :func:`build_file_response`, they are not validated.
+FILE_RESPONSE_HEADERS: Final = frozenset((
+    'Accept-Ranges',
+    'Content-Disposition',
+    'Content-Range',
+    'X-Accel-Redirect',
+    'X-Sendfile',
+))
+
+# Only single byte ranges are supported, other ranges are ignored:
+_BYTE_RANGE: Final = re.compile(r'bytes=(\d*)-(\d*)')
+
+
+@final
+@dataclasses.dataclass(frozen=True, slots=True, kw_only=True)
+class FileOffload:
+    """
+    Describes how files are sent by the web server in front of Django.
+
+    Args:
+        header: ``X-Accel-Redirect`` for nginx,
+            ``X-Sendfile`` for Apache and lighttpd.
+        root: Directory with files that the web server can send,
+            files outside of it are sent by Django.
+        location: Prefix of file locations sent to the web server.
+            Usually it is an internal location like ``/protected/``
+            for nginx. Defaults to *root* itself.
+
+    """
+
+    header: Literal['X-Accel-Redirect', 'X-Sendfile']
+    root: str | os.PathLike[str]
+    location: str | None = None
+
+    def resolve(self, path: Path) -> str | None:
+        """Returns location of *path* or ``None`` when it is outside root."""
+        root = Path(self.root).resolve()
+        try:
+            relative = path.resolve().relative_to(root)
+        except ValueError:
+            return None
+        location = '/'.join((
+            (str(root) if self.location is None else self.location).rstrip('/'),
+            relative.as_posix(),
+        ))
+        if self.header == 'X-Accel-Redirect':
+            return quote(location)
+        return location
+
+
+def build_file_response(
+    request: HttpRequest,
+    file_or_path: str | os.PathLike[str] | IO[bytes],
+    *,
+    content_type: str | None = None,
+    filename: str = '',
+    as_attachment: bool = False,
+) -> HttpResponseBase:
+    """
+    Returns a response that sends a file without reading it to memory.
+
+    *file_or_path* is either a path or a binary file object,
+    which is closed together with the response.
+    *content_type* is guessed from the file name by default.
+
+    Files are sent with :class:`django.http.FileResponse`,
+    so WSGI servers send them with ``wsgi.file_wrapper``,
+    for example, with :func:`os.sendfile`.
+    Single byte ranges from ``Range`` request header
+    are sent with ``206`` status code,
+    unsatisfiable ranges are answered with ``416`` status code.
+
+    When :data:`~django_modern_rest.settings.Settings.file_offload`
+    is configured, files from its root are sent by the web server,
+    we only return an empty response with the offload header.
+    """
+    if isinstance(file_or_path, (str, os.PathLike)):
+        path = Path(file_or_path)
+        filename = filename or path.name
+        offloaded = _offload_response(
+            path,
+            content_type=content_type,
+            filename=filename,
+            as_attachment=as_attachment,
+        )
+        if offloaded is not None:
+            return offloaded
+        file_or_path = path.open('rb')
+
+    response = FileResponse(
+        file_or_path,
+        content_type=content_type,
+        filename=filename,
+        as_attachment=as_attachment,
+    )
+    return _ranged_response(request, response, file_or_path)
+
+
+def _offload_response(
+    path: Path,
+    *,
+    content_type: str | None,
+    filename: str,
+    as_attachment: bool,
+) -> HttpResponse | None:
+    offload: FileOffload | None = resolve_setting(Settings.file_offload)
+    location = None if offload is None else offload.resolve(path)
+    if offload is None or location is None:
+        return None
+
+    response = HttpResponse(
+        content_type=(
+            content_type
+            or mimetypes.guess_type(filename)[0]
+            or 'application/octet-stream'
+        ),
+    )
+    response.headers[offload.header] = location
+    # Paths always have names, so the disposition is always rendered:
+    response.headers['Content-Disposition'] = content_disposition_header(  # type: ignore[assignment]
+        as_attachment,
+        filename,
+    )
+    return response
+
+
+def _ranged_response(
+    request: HttpRequest,
+    response: FileResponse,
+    file_object: IO[bytes],
+) -> HttpResponseBase:
+    size = response.headers.get('Content-Length')
+    if size is None or not file_object.seekable():
+        return response
+    response.headers['Accept-Ranges'] = 'bytes'
+    requested = _requested_range(request, int(size))
+    if requested is None:
+        return response
+    return _partial_response(response, file_object, requested, size=size)
+
+
+def _requested_range(request: HttpRequest, size: int) -> range | None:
+    """
+    Returns requested bytes, they are empty when they can't be satisfied.
+
+    ``None`` means that the whole file must be sent.
+    """
+    match = _BYTE_RANGE.fullmatch(request.headers.get('Range', '').strip())
+    # We don't send validators, so conditional ranges can't be checked:
+    if match is None or 'If-Range' in request.headers:
+        return None
+    first, last = match.groups()
+    if not first and last:
+        # Suffix ranges request last bytes of files:
+        return range(max(size - int(last), 0), size)
+    if not first or (last and int(last) < int(first)):
+        return None
+    stop = min(int(last) + 1, size) if last else size
+    return range(int(first), stop)
+
+
+def _partial_response(
+    response: FileResponse,
+    file_object: IO[bytes],
+    requested: range,
+    *,
+    size: str,
+) -> HttpResponseBase:
+    if not requested:
+        # We don't close the response, it is not sent:
+        file_object.close()
+        return HttpResponse(
+            status=HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE,
+            headers={'Content-Range': f'bytes */{size}'},
+        )
+
+    # Content length is counted from the current position of files:
+    file_object.seek(requested.start, os.SEEK_CUR)
+    # Servers' file wrappers would send the rest of the file, so we don't
+    # use them and only read requested bytes:
+    response.streaming_content = _read_range(
+        file_object,
+        len(requested),
+        response.block_size,
+    )
+    first, last = requested.start, requested.stop - 1
+    response.status_code = HTTPStatus.PARTIAL_CONTENT
+    response.headers['Content-Length'] = str(len(requested))
+    response.headers['Content-Range'] = f'bytes {first}-{last}/{size}'
+    return response
+
+
+def _read_range(
+    file_object: IO[bytes],
+    length: int,
+    block_size: int,
+) -> Iterator[bytes]:
+    while length > 0:
+        chunk = file_object.read(min(block_size, length))
+        if not chunk:
+            return
+        length -= len(chunk)
+        yield chunk
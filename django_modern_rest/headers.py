@@ -1,6 +1,8 @@
 import dataclasses
 from typing import TYPE_CHECKING, Any, final
 
+from django.http.response import ResponseHeaders
+
 if TYPE_CHECKING:
     from django_modern_rest.response import ResponseModification
     from django_modern_rest.serialization import BaseSerializer
@@ -68,13 +70,17 @@ class HeaderSpec(_BaseResponseHeader):
 def build_headers(
     modification: 'ResponseModification',
     serializer: type['BaseSerializer'],
-) -> dict[str, str]:
-    """Returns headers with values for raw data endpoints."""
+) -> ResponseHeaders:
+    """
+    Returns headers with values for raw data endpoints.
+
+    Headers are normalized here, once per endpoint.
+    So, they can be copied to responses as is.
+    """
     result_headers: dict[str, Any] = {'Content-Type': serializer.content_type}
-    if not modification.headers:
-        return result_headers
-    result_headers.update({
-        header_name: response_header.value
-        for header_name, response_header in modification.headers.items()
-    })
-    return result_headers
+    if modification.headers:
+        result_headers.update({
+            header_name: response_header.value
+            for header_name, response_header in modification.headers.items()
+        })
+    return ResponseHeaders(result_headers)
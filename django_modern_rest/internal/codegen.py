@@ -0,0 +1,123 @@
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any, TypeAlias
+
+_Context: TypeAlias = dict[str, Any]
+_Validate: TypeAlias = Callable[[_Context], _Context]
+
+
+def compile_context_parser(  # noqa: WPS211
+    specs: Mapping[Any, Any],
+    validated_specs: Mapping[Any, Any],
+    validate: _Validate,
+    fallback: Callable[..., None],
+    errors: tuple[type[Exception], ...],
+    *,
+    name: str,
+) -> Callable[..., None]:
+    """
+    Generate a function to parse and bind components for a blueprint.
+
+    We know all components during the import time,
+    so we generate code without any loops or dynamic lookups.
+    For ``Headers`` and ``Query`` components it would look like:
+
+    .. code:: python
+
+        def parse_and_bind(blueprint, request, *args, **kwargs):
+            validated = validate({
+                'parsed_headers': provide_0(
+                    blueprint, model_0, request, *args, **kwargs,
+                ),
+                'parsed_query': provide_1(
+                    blueprint, model_1, request, *args, **kwargs,
+                ),
+            })
+            blueprint.parsed_headers = validated['parsed_headers']
+            blueprint.parsed_query = validated['parsed_query']
+
+    Components from *validated_specs*, like ``Body``,
+    provide already validated data, so it is bound as is.
+    When they raise one of *errors*, we call *fallback* instead:
+
+    .. code:: python
+
+        def parse_and_bind(blueprint, request, *args, **kwargs):
+            try:
+                validated_0 = provide_validated_0(
+                    blueprint, validated_model_0, request, *args, **kwargs,
+                )
+            except errors:
+                return fallback(blueprint, request, *args, **kwargs)
+            ...
+            blueprint.parsed_body = validated_0
+
+    Components with ``context_name`` that is not a valid identifier
+    are bound with ``setattr``.
+    """
+    namespace: dict[str, Any] = {
+        'validate': validate,
+        'fallback': fallback,
+        'errors': errors,
+    }
+    for index, (component, model) in enumerate(specs.items()):
+        namespace[f'provide_{index}'] = component.provide_context_data
+        namespace[f'model_{index}'] = model
+    for index, (component, model) in enumerate(validated_specs.items()):
+        namespace[f'provide_validated_{index}'] = (
+            component.provide_validated_data
+        )
+        namespace[f'validated_model_{index}'] = model
+
+    source = _render(
+        [parser.context_name for parser in specs],
+        [parser.context_name for parser in validated_specs],
+    )
+    exec(  # noqa: S102, WPS421
+        compile(source, f'<{name}@parse_and_bind>', 'exec'),  # noqa: WPS421
+        namespace,
+    )
+    return namespace['parse_and_bind']  # type: ignore[no-any-return]
+
+
+def _render(
+    context_names: Sequence[str],
+    validated_names: Sequence[str],
+) -> str:
+    lines = ['def parse_and_bind(blueprint, request, *args, **kwargs):']
+    if validated_names:
+        lines.extend((
+            '    try:',
+            *[
+                f'        validated_{index} = provide_validated_{index}('
+                + f'blueprint, validated_model_{index}, '
+                + 'request, *args, **kwargs)'
+                for index in range(len(validated_names))
+            ],
+            '    except errors:',
+            '        return fallback(blueprint, request, *args, **kwargs)',
+        ))
+    if context_names:
+        lines.extend((
+            '    validated = validate({',
+            *[
+                f'        {context_name!r}: provide_{index}('
+                + f'blueprint, model_{index}, request, *args, **kwargs),'
+                for index, context_name in enumerate(context_names)
+            ],
+            '    })',
+        ))
+    lines.extend(
+        _bind_line(context_name, f'validated[{context_name!r}]')
+        for context_name in context_names
+    )
+    lines.extend(
+        _bind_line(context_name, f'validated_{index}')
+        for index, context_name in enumerate(validated_names)
+    )
+    return '\n'.join(lines)
+
+
+def _bind_line(context_name: str, parsed_value: str) -> str:
+    if context_name.isidentifier():
+        return f'    blueprint.{context_name} = {parsed_value}'
+    return f'    setattr(blueprint, {context_name!r}, {parsed_value})'
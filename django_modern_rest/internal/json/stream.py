@@ -0,0 +1,206 @@
+import re
+from collections.abc import Callable, Iterator
+from typing import Final, final
+
+from django_modern_rest.exceptions import DataParsingError
+
+# Characters that change the structure of json outside of strings:
+_STRUCTURE: Final = re.compile(rb'["\[\]{},]')
+# The rest of a json string, without the closing quote, it always matches:
+_STRING_REST: Final = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+_NOT_WHITESPACE: Final = re.compile(rb'[^ \t\n\r]')
+_NEWLINE: Final = b'\n'
+
+
+def _json_value(depth: int) -> bytes:
+    """Pattern for a part of json value with a limited nesting *depth*."""
+    parts = [rb'[^"\[\]{},]++', rb'"[^"\\]*+(?:\\.[^"\\]*+)*+"']
+    if depth:
+        nested = _json_value(depth - 1)
+        parts.extend((
+            b''.join((rb'\[(?:', nested, rb'|,)*+\]')),
+            b''.join((rb'\{(?:', nested, rb'|,)*+\}')),
+        ))
+    return b''.join((b'(?:', b'|'.join(parts), b')'))
+
+
+# Whole array item, followed by a comma or the closing bracket.
+# Matching items in C is a lot faster than looking at each token in python.
+# Deeply nested items and items that are cut by chunks don't match it:
+_ARRAY_ELEMENT: Final = re.compile(
+    b''.join((_json_value(4), rb'*+(?=[,\]])')),
+    re.DOTALL,
+)
+
+_QUOTE: Final = ord('"')
+_COMMA: Final = ord(',')
+_OPENING: Final = b'[{'
+_ARRAY_END: Final = ord(']')
+# Closing brackets mapped to opening ones:
+_CLOSING: Final = (  # noqa: WPS407
+    {ord(']'): ord('['), ord('}'): ord('{')}
+)
+
+
+def split_json_array(
+    read: Callable[[int], bytes],
+    chunk_size: int,
+) -> Iterator[bytearray]:
+    """
+    Lazily split a json array from *read* into raw json items.
+
+    Only the current item and a single chunk are kept in memory.
+    Items are not parsed here, decoders will check that they are valid.
+
+    Raises:
+        DataParsingError: When the input is not a json array.
+
+    """
+    splitter = _ArraySplitter()
+    while chunk := read(chunk_size):
+        yield from splitter.feed(chunk)
+    if not splitter.is_complete:
+        raise DataParsingError('Unexpected end of json array')
+
+
+def split_json_lines(
+    read: Callable[[int], bytes],
+    chunk_size: int,
+) -> Iterator[bytes]:
+    """
+    Lazily split newline delimited json from *read* into raw json values.
+
+    Only the current line and a single chunk are kept in memory.
+    Blank lines are skipped.
+    """
+    buffer = bytearray()
+    while chunk := read(chunk_size):
+        buffer += chunk
+        # Json values can't contain raw line breaks, so we only look
+        # for them in the new chunk:
+        end = buffer.rfind(_NEWLINE, len(buffer) - len(chunk))
+        if end >= 0:
+            yield from json_lines(buffer[:end])
+            del buffer[: end + 1]  # noqa: WPS420
+    yield from json_lines(buffer)
+
+
+def json_lines(buffer: bytes | bytearray) -> list[bytes]:
+    """Split newline delimited json *buffer* into raw json values."""
+    return [
+        bytes(line)
+        for line in buffer.split(_NEWLINE)
+        if _NOT_WHITESPACE.search(line)
+    ]
+
+
+@final
+class _ArraySplitter:  # noqa: WPS214
+    __slots__ = (
+        '_buffer',
+        '_count',
+        '_in_string',
+        '_item_start',
+        '_position',
+        '_stack',
+        'is_complete',
+    )
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        # Opened and not yet closed arrays and objects:
+        self._stack = bytearray()
+        self._in_string = False
+        # Item start is `-1` before the array is opened:
+        self._item_start = -1
+        self._position = 0
+        self._count = 0
+        self.is_complete = False
+
+    def feed(self, chunk: bytes) -> Iterator[bytearray]:
+        """Yield all items that were completed by this *chunk*."""
+        self._buffer += chunk
+        if self._item_start < 0 and not self._open():
+            return
+        yield from self._match_items()
+        while self._stack and self._skip_string():
+            match = _STRUCTURE.search(self._buffer, self._position)
+            if match is None:
+                self._position = len(self._buffer)
+                break
+            self._position = match.end()
+            raw_item = self._handle_token(match[0][0], match.start())
+            if raw_item is not None:
+                yield raw_item
+                yield from self._match_items()
+        self._compact()
+
+    def _open(self) -> bool:
+        match = _NOT_WHITESPACE.search(self._buffer)
+        if match is None:
+            self._buffer.clear()
+            return False
+        if match[0] != b'[':
+            raise DataParsingError('Expected json array')
+        self._stack.append(match[0][0])
+        self._position = match.end()
+        self._item_start = self._position
+        return True
+
+    def _skip_string(self) -> bool:
+        # Returns `False`, when more bytes are needed to close a string:
+        if self._in_string:
+            end = _STRING_REST.match(self._buffer, self._position).end()  # type: ignore[union-attr]
+            self._in_string = self._buffer[end : end + 1] != b'"'
+            self._position = end + 1 - self._in_string
+        return not self._in_string
+
+    def _match_items(self) -> Iterator[bytearray]:
+        while len(self._stack) == 1 and self._position == self._item_start:
+            match = _ARRAY_ELEMENT.match(self._buffer, self._position)
+            if match is None:
+                return
+            end = match.end()
+            self._position = end + 1
+            if self._buffer[end] == _ARRAY_END:
+                self._stack.pop()
+            raw_item = self._cut_item(end)
+            if raw_item is not None:
+                yield raw_item
+
+    def _handle_token(self, token: int, start: int) -> bytearray | None:
+        if token == _QUOTE:
+            self._in_string = True
+            return None
+        if token in _OPENING:
+            self._stack.append(token)
+        elif token != _COMMA and self._stack.pop() != _CLOSING[token]:
+            raise DataParsingError('Mismatched brackets in json array')
+        # Items end with commas in the array itself or with its last bracket:
+        if len(self._stack) == (token == _COMMA):
+            return self._cut_item(start)
+        return None
+
+    def _cut_item(self, end: int) -> bytearray | None:
+        raw_item = self._buffer[self._item_start : end]
+        self._item_start = self._position
+        self._count += 1
+        if self._stack:
+            return raw_item
+        self.is_complete = True
+        # Empty arrays have no items, but `[1,]` has an empty one:
+        if self._count > 1 or _NOT_WHITESPACE.search(raw_item):
+            return raw_item
+        return None
+
+    def _compact(self) -> None:
+        if self.is_complete:
+            # We only need to check that nothing follows the array:
+            if _NOT_WHITESPACE.search(self._buffer, self._position):
+                raise DataParsingError('Extra data after json array')
+            self._buffer.clear()
+            self._position = 0
+        elif self._item_start > 0:
+            del self._buffer[: self._item_start]  # noqa: WPS420
+            self._position -= self._item_start
+            self._item_start = 0
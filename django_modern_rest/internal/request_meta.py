@@ -0,0 +1,128 @@
+from functools import lru_cache
+from http import cookies
+from typing import TYPE_CHECKING, Any
+from urllib.parse import unquote_plus
+
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIRequest
+from django.http import HttpRequest
+from django.http.request import HttpHeaders
+
+from django_modern_rest.settings import MAX_CACHE_SIZE
+
+if TYPE_CHECKING:
+    from django_modern_rest.serialization import BaseSerializer
+
+
+@lru_cache(maxsize=MAX_CACHE_SIZE)
+def field_names(
+    serializer: type['BaseSerializer'],
+    model: Any,
+) -> frozenset[str] | None:
+    """
+    Cached version of :meth:`BaseSerializer.field_names`.
+
+    Computed once per component model, reused for all requests.
+    """
+    return serializer.field_names(model)
+
+
+@lru_cache(maxsize=MAX_CACHE_SIZE)
+def sequence_field_names(
+    serializer: type['BaseSerializer'],
+    model: Any,
+) -> frozenset[str]:
+    """Cached version of :meth:`BaseSerializer.sequence_field_names`."""
+    return serializer.sequence_field_names(model)
+
+
+@lru_cache(maxsize=MAX_CACHE_SIZE)
+def header_meta_keys(names: frozenset[str]) -> tuple[tuple[str, str], ...]:
+    """
+    Map header *names* to ``request.META`` keys.
+
+    Works like :class:`django.http.HttpHeaders` lookups,
+    which also match underscores in *names* to dashes.
+    """
+    return tuple((name, HttpHeaders.to_wsgi_name(name)) for name in names)
+
+
+def parse_cookies(cookie: str, names: frozenset[str]) -> dict[str, str]:
+    """
+    Parse only cookies with *names* from a ``Cookie:`` header string.
+
+    Works exactly like :func:`django.http.cookie.parse_cookie`,
+    but does not unquote values of cookies that we don't need.
+    """
+    parsed = {}
+    for chunk in cookie.split(';'):
+        key, separator, cookie_value = chunk.partition('=')
+        # Chunks without `=` have an empty name, models can't declare it:
+        if separator and key.strip() in names:
+            parsed[key.strip()] = cookies._unquote(cookie_value.strip())  # noqa: SLF001
+    return parsed
+
+
+def parse_query(
+    request: HttpRequest,
+    names: frozenset[str],
+    sequence_names: frozenset[str],
+) -> dict[str, Any]:
+    """
+    Parse only *names* from the request's query string.
+
+    Keys from *sequence_names* get lists of all values,
+    other keys get their last value, like :class:`django.http.QueryDict` does.
+    """
+    query_string: str = request.META.get('QUERY_STRING', '')
+    if isinstance(request, WSGIRequest) and not query_string.isascii():
+        query_string = _decode_wsgi_string(query_string)
+    max_fields = settings.DATA_UPLOAD_MAX_NUMBER_FIELDS
+    if 'GET' in request.__dict__ or (
+        max_fields is not None and query_string.count('&') >= max_fields
+    ):
+        # `GET` was already parsed or modified, or it must raise
+        # `TooManyFieldsSent` error:
+        query = request.GET
+        return {
+            key: query.getlist(key) if key in sequence_names else query[key]
+            for key in names
+            if key in query
+        }
+    return _parse_query_string(
+        query_string,
+        names,
+        sequence_names,
+        request.encoding or settings.DEFAULT_CHARSET,
+    )
+
+
+def _decode_wsgi_string(wsgi_string: str) -> str:
+    # WSGI servers pass raw bytes as latin-1 strings,
+    # we decode them the same way `QueryDict` does:
+    raw_bytes = wsgi_string.encode('iso-8859-1')
+    try:
+        return raw_bytes.decode()
+    except UnicodeDecodeError:
+        return raw_bytes.decode('iso-8859-1')
+
+
+def _parse_query_string(
+    query_string: str,
+    names: frozenset[str],
+    sequence_names: frozenset[str],
+    encoding: str,
+) -> dict[str, Any]:
+    parsed: dict[str, Any] = {}
+    # It is a single pass over the query string,
+    # values of undeclared keys are not even unquoted:
+    for chunk in query_string.split('&'):
+        key, _, query_value = chunk.partition('=')
+        key = unquote_plus(key, encoding, errors='replace')
+        if key in sequence_names:
+            parsed.setdefault(key, []).append(
+                unquote_plus(query_value, encoding, errors='replace'),
+            )
+        elif key in names:
+            parsed[key] = unquote_plus(query_value, encoding, errors='replace')
+    return parsed
@@ -0,0 +1,150 @@
+import re
+from collections.abc import Sequence
+from typing import Final, TypeAlias, final
+
+from django.urls.converters import (
+    IntConverter,
+    SlugConverter,
+    StringConverter,
+    UUIDConverter,
+)
+from django.urls.resolvers import RoutePattern, URLPattern, URLResolver
+from django.utils.functional import Promise
+
+_AnyPattern: TypeAlias = URLPattern | URLResolver
+
+#: Converter regexes that never match ``/``, so they match a whole segment.
+_SEGMENT_REGEXES: Final = frozenset((
+    IntConverter.regex,
+    SlugConverter.regex,
+    StringConverter.regex,
+    UUIDConverter.regex,
+))
+
+#: Matches a single ``<converter:name>`` or ``<name>`` path segment.
+_SEGMENT_PARAMETER: Final = re.compile(r'<(?:[^>:]+:)?(?P<parameter>[^>]+)>')
+
+
+@final
+class _RouteNode:
+    """Single node of the route segment trie."""
+
+    __slots__ = ('converters', 'endpoints', 'prefixes', 'regexes', 'static')
+
+    def __init__(self) -> None:
+        self.static: dict[str, _RouteNode] = {}
+        self.converters: dict[str, _RouteNode] = {}
+        self.regexes: dict[str, re.Pattern[str]] = {}
+        # Indexes of patterns that fully match the path ending here:
+        self.endpoints: list[int] = []
+        # Indexes of patterns that might match any path going through here:
+        self.prefixes: list[int] = []
+
+    def static_child(self, segment: str) -> '_RouteNode':
+        return self.static.setdefault(segment, _RouteNode())
+
+    def converter_child(self, regex: str) -> '_RouteNode':
+        # Segments with the same converter regex share the same node:
+        if regex not in self.converters:
+            self.regexes[regex] = re.compile(regex)
+            self.converters[regex] = _RouteNode()
+        return self.converters[regex]
+
+
+@final
+class RouteTrie:
+    """
+    Segment trie of url patterns.
+
+    It is used to filter patterns that can possibly match a given path.
+    The final match is still done by the pattern itself,
+    so Django's semantics is fully preserved.
+
+    Patterns that can't be represented as segments
+    (like regex patterns, ``path`` converters or custom converters)
+    are tried for any path that goes through their static prefix.
+    """
+
+    __slots__ = ('_root',)
+
+    def __init__(self, patterns: Sequence[_AnyPattern]) -> None:
+        """Builds the trie from patterns, preserving their order."""
+        self._root = _RouteNode()
+        for index, pattern in enumerate(patterns):
+            self._insert(index, pattern)
+
+    def candidates(self, path: str) -> list[int]:
+        """Returns sorted indexes of patterns that might match *path*."""
+        found: list[int] = []
+        self._collect(self._root, path.split('/'), 0, found)
+        return sorted(set(found)) if len(found) > 1 else found
+
+    def _insert(self, index: int, pattern: _AnyPattern) -> None:
+        route = pattern.pattern
+        if not isinstance(route, RoutePattern) or isinstance(
+            route._route,  # type: ignore[attr-defined]  # noqa: SLF001
+            Promise,
+        ):
+            # Regex and translated patterns can match anything:
+            self._root.prefixes.append(index)
+            return
+
+        is_endpoint = isinstance(pattern, URLPattern)
+        segments = str(route).split('/')
+        if not is_endpoint:
+            # Includes only match a prefix of the path. The last segment
+            # is either empty (route ends with `/`) or partial.
+            segments.pop()
+        self._register(index, route, segments, is_endpoint=is_endpoint)
+
+    def _register(
+        self,
+        index: int,
+        route: RoutePattern,
+        segments: list[str],
+        *,
+        is_endpoint: bool,
+    ) -> None:
+        node = self._root
+        for segment in segments:
+            child = self._child(node, segment, route)
+            if child is None:
+                node.prefixes.append(index)
+                return
+            node = child
+        (node.endpoints if is_endpoint else node.prefixes).append(index)
+
+    def _child(
+        self,
+        node: _RouteNode,
+        segment: str,
+        route: RoutePattern,
+    ) -> _RouteNode | None:
+        if '<' not in segment:
+            return node.static_child(segment)
+        parameter = _SEGMENT_PARAMETER.fullmatch(segment)
+        if parameter is None:
+            return None  # mixed segment, like `page-<int:pk>`
+        regex: str = route.converters[parameter.group('parameter')].regex
+        if regex not in _SEGMENT_REGEXES:
+            return None  # `path` or custom converter
+        return node.converter_child(regex)
+
+    def _collect(
+        self,
+        node: _RouteNode,
+        segments: list[str],
+        position: int,
+        found: list[int],
+    ) -> None:
+        found.extend(node.prefixes)
+        if position == len(segments):
+            found.extend(node.endpoints)
+            return
+        segment = segments[position]
+        static = node.static.get(segment)
+        if static is not None:
+            self._collect(static, segments, position + 1, found)
+        for regex, child in node.converters.items():
+            if node.regexes[regex].fullmatch(segment):
+                self._collect(child, segments, position + 1, found)
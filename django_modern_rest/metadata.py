@@ -40,6 +40,8 @@ class EndpointMetadata:
             of responses for this endpoint? Customizable via global setting,
             per controller, and per endpoint.
             Here we only store the per endpoint information.
+        validate_responses_sample_rate: Fraction of responses to validate.
+            Customizable the same way as *validate_responses*.
         modification: Default modifications that are applied
             to the returned data. Can be ``None``, when ``@validate`` is used.
         error_handler: Callback function to be called
@@ -80,6 +82,7 @@ class EndpointMetadata:
 
     responses: dict[HTTPStatus, ResponseSpec]
     validate_responses: bool | None
+    validate_responses_sample_rate: float | None = None
     method: str
     modification: ResponseModification | None
     error_handler: SyncErrorHandlerT | AsyncErrorHandlerT | None
@@ -83,11 +83,5 @@ class AsyncMetaMixin:
 
 
 def _meta_impl(controller: 'Controller[BaseSerializer]') -> HttpResponse:
-    allow = ', '.join(
-        method for method in sorted(controller.api_endpoints.keys())
-    )
-    return controller.to_response(
-        raw_data=None,
-        status_code=HTTPStatus.NO_CONTENT,
-        headers={'Allow': allow},
-    )
+    # It is pre-built once per controller, we just copy it:
+    return controller._options_response.copy()  # noqa: SLF001
@@ -1,9 +1,12 @@
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Iterator
+from functools import lru_cache
 from typing import (
     TYPE_CHECKING,
     Any,
     ClassVar,
     NotRequired,
+    get_args,
+    get_origin,
 )
 
 try:
@@ -18,14 +21,21 @@ except ImportError:  # pragma: no cover
 
 from typing_extensions import TypedDict, override
 
+from django_modern_rest.exceptions import DataParsingError
+from django_modern_rest.internal.json import (
+    deserialize as default_deserialize,
+)
+from django_modern_rest.internal.json import serialize as default_serialize
 from django_modern_rest.serialization import (
     BaseEndpointOptimizer,
     BaseSerializer,
 )
 from django_modern_rest.settings import (
+    MAX_CACHE_SIZE,
     Settings,
     resolve_setting,
 )
+from django_modern_rest.types import is_sequence_annotation
 
 if TYPE_CHECKING:
     from django_modern_rest.internal.json import (
@@ -61,14 +71,29 @@ class MsgspecEndpointOptimizer(BaseEndpointOptimizer):
 
     @override
     @classmethod
-    def optimize_endpoint(cls, metadata: 'EndpointMetadata') -> None:
-        """Does nothing for msgspec."""
+    def optimize_endpoint(
+        cls,
+        metadata: 'EndpointMetadata',
+        serializer: type[BaseSerializer],
+    ) -> None:
+        """Build json encoders and typed decoders."""
         # `msgspec.convert` does not have any API
         # to pre-build validation schema.
         # Returning `Struct` or `list[Struct]` will be just fast enough.
-
-
-class MsgspecSerializer(BaseSerializer):
+        # Responses with known return types are encoded without settings:
+        _get_cached_encoder(serializer.serialize_hook)
+        # And we can build typed json decoders for components like `Body`:
+        for component, type_args in metadata.component_parsers:
+            if getattr(get_origin(component), '__validates_data__', False):
+                for strict in (True, False):
+                    _get_cached_decoder(
+                        type_args[0],
+                        serializer.deserialize_hook,
+                        strict=strict,
+                    )
+
+
+class MsgspecSerializer(BaseSerializer):  # noqa: WPS214
     """
     Serialize and deserialize objects using msgspec.
 
@@ -102,6 +127,22 @@ class MsgspecSerializer(BaseSerializer):
             cls.serialize_hook,
         )
 
+    @override
+    @classmethod
+    def to_json(cls, structure: Any, model: Any) -> bytes:
+        """
+        Convert *structure* of a known *model* type to json bytestring.
+
+        Uses prebuilt :class:`msgspec.json.Encoder` directly,
+        without extra hook dispatch.
+        When custom :data:`~django_modern_rest.settings.Settings.serialize`
+        is set, we use :meth:`serialize` instead.
+        """
+        serialize = resolve_setting(Settings.serialize, import_string=True)
+        if serialize is not default_serialize:
+            return cls.serialize(structure)
+        return _get_cached_encoder(cls.serialize_hook).encode(structure)
+
     @override
     @classmethod
     def deserialize(cls, buffer: 'FromJson') -> Any:
@@ -153,6 +194,89 @@ class MsgspecSerializer(BaseSerializer):
             **cls.convert_kwargs,
         )
 
+    @override
+    @classmethod
+    def from_json(
+        cls,
+        buffer: 'FromJson',
+        model: Any,
+        *,
+        strict: bool,
+    ) -> Any:
+        """
+        Decode json *buffer* straight into *model*.
+
+        Uses a cached typed ``msgspec.json.Decoder``,
+        so no intermediate python primitives are created.
+        Typed decoders can't use custom
+        :data:`~django_modern_rest.settings.Settings.deserialize`
+        and :attr:`convert_kwargs`, so when they are set,
+        we use :meth:`deserialize` and :meth:`from_python` instead.
+        """
+        if cls._has_custom_parsing():
+            return super().from_json(buffer, model, strict=strict)
+        try:
+            return _get_cached_decoder(
+                model,
+                cls.deserialize_hook,
+                strict=strict,
+            ).decode(buffer)
+        except msgspec.DecodeError as exc:
+            # Both decoding and validation errors are reported
+            # by the combined model later:
+            raise DataParsingError(str(exc)) from exc
+
+    @override
+    @classmethod
+    def from_ndjson(
+        cls,
+        buffer: bytes,
+        model: Any,
+        *,
+        strict: bool,
+    ) -> Any:
+        """
+        Decode newline delimited json *buffer* straight into *model*.
+
+        Lines of ``list[Item]`` models are decoded
+        with a cached typed ``msgspec.json.Decoder``,
+        unless custom parsing options are set, see :meth:`from_json`.
+        """
+        if get_origin(model) is not list or cls._has_custom_parsing():
+            return super().from_ndjson(buffer, model, strict=strict)
+        try:
+            return _get_cached_decoder(
+                get_args(model)[0],
+                cls.deserialize_hook,
+                strict=strict,
+            ).decode_lines(buffer)
+        except msgspec.DecodeError as exc:
+            raise DataParsingError(str(exc)) from exc
+
+    @override
+    @classmethod
+    def field_names(cls, model: Any) -> frozenset[str] | None:
+        """Return all keys that *model* can read from a mapping."""
+        if isinstance(model, type) and issubclass(model, msgspec.Struct):
+            if model.__struct_config__.forbid_unknown_fields:
+                return None
+            return frozenset(
+                field.encode_name for field in msgspec.structs.fields(model)
+            )
+        return super().field_names(model)
+
+    @override
+    @classmethod
+    def sequence_field_names(cls, model: Any) -> frozenset[str]:
+        """Return keys of ``Struct`` fields that expect multiple values."""
+        if isinstance(model, type) and issubclass(model, msgspec.Struct):
+            return frozenset(
+                field.encode_name
+                for field in msgspec.structs.fields(model)
+                if is_sequence_annotation(field.type)
+            )
+        return super().sequence_field_names(model)
+
     @override
     @classmethod
     def error_serialize(
@@ -174,3 +298,204 @@ class MsgspecSerializer(BaseSerializer):
         raise NotImplementedError(
             f'Cannot serialize {error!r} of type {type(error)} to json safely',
         )
+
+    @classmethod
+    def _has_custom_parsing(cls) -> bool:
+        return bool(cls.convert_kwargs) or (
+            resolve_setting(Settings.deserialize, import_string=True)
+            is not default_deserialize
+        )
+
+
+class MsgpackEndpointOptimizer(BaseEndpointOptimizer):
+    """Optimize endpoints that are parsed with MessagePack."""
+
+    @override
+    @classmethod
+    def optimize_endpoint(
+        cls,
+        metadata: 'EndpointMetadata',
+        serializer: type[BaseSerializer],
+    ) -> None:
+        """Build MessagePack encoders and typed decoders."""
+        _get_cached_msgpack_encoder(serializer.serialize_hook)
+        for component, type_args in metadata.component_parsers:
+            if getattr(get_origin(component), '__validates_data__', False):
+                for strict in (True, False):
+                    _get_cached_msgpack_decoder(
+                        type_args[0],
+                        serializer.deserialize_hook,
+                        strict=strict,
+                    )
+
+
+class MsgpackSerializer(MsgspecSerializer):
+    """
+    Serialize and deserialize objects as MessagePack using msgspec.
+
+    MessagePack is a binary format, it is smaller and faster to parse
+    than json, so it is useful for service-to-service APIs.
+    Request bodies must be sent with ``application/msgpack`` content type,
+    responses are sent with the same content type.
+
+    Models and validation rules are the same as in
+    :class:`MsgspecSerializer`, but
+    :data:`~django_modern_rest.settings.Settings.serialize` and
+    :data:`~django_modern_rest.settings.Settings.deserialize`
+    settings are not used, since they are json specific.
+    Streamed responses and server-sent events are not supported.
+    """
+
+    __slots__ = ()
+
+    # Required API:
+    optimizer: ClassVar[type[BaseEndpointOptimizer]] = MsgpackEndpointOptimizer
+
+    # API that have defaults:
+    content_type: ClassVar[str] = 'application/msgpack'
+    ndjson_content_types: ClassVar[tuple[str, ...]] = ()
+    supports_streaming: ClassVar[bool] = False
+
+    @override
+    @classmethod
+    def serialize(cls, structure: Any) -> bytes:
+        """Convert any object to MessagePack bytestring."""
+        return _get_cached_msgpack_encoder(cls.serialize_hook).encode(
+            structure,
+        )
+
+    @override
+    @classmethod
+    def to_json(cls, structure: Any, model: Any) -> bytes:
+        """
+        Convert *structure* of a known *model* type to MessagePack.
+
+        MessagePack encoders do not depend on types,
+        so it is the same as :meth:`serialize`.
+        """
+        return cls.serialize(structure)
+
+    @override
+    @classmethod
+    def deserialize(cls, buffer: 'FromJson') -> Any:
+        """Convert MessagePack bytestring to simple python object."""
+        try:
+            return _get_cached_msgpack_decoder(
+                Any,
+                cls.deserialize_hook,
+                strict=cls.from_json_strict,
+            ).decode(buffer)  # type: ignore[arg-type]
+        except msgspec.DecodeError as exc:
+            # The same corner case as for json, empty bodies are `null`:
+            if buffer == b'':
+                return None
+            raise DataParsingError(str(exc)) from exc
+
+    @override
+    @classmethod
+    def from_json(
+        cls,
+        buffer: 'FromJson',
+        model: Any,
+        *,
+        strict: bool,
+    ) -> Any:
+        """
+        Decode MessagePack *buffer* straight into *model*.
+
+        Uses a cached typed ``msgspec.msgpack.Decoder``,
+        unless :attr:`convert_kwargs` are set.
+        """
+        if cls.convert_kwargs:
+            return cls.from_python(
+                cls.deserialize(buffer),
+                model,
+                strict=strict,
+            )
+        try:
+            return _get_cached_msgpack_decoder(
+                model,
+                cls.deserialize_hook,
+                strict=strict,
+            ).decode(buffer)  # type: ignore[arg-type]
+        except msgspec.DecodeError as exc:
+            raise DataParsingError(str(exc)) from exc
+
+    @override
+    @classmethod
+    def split_body(
+        cls,
+        read: Callable[[int], bytes],
+        chunk_size: int,
+        *,
+        ndjson: bool,
+    ) -> Iterator['FromJson']:
+        """
+        Split a MessagePack array into raw items.
+
+        MessagePack arrays can't be split while they are read,
+        so the whole body is read, but items are still parsed one by one.
+        """
+        return _split_msgpack_array(read(-1))
+
+
+@lru_cache(maxsize=MAX_CACHE_SIZE)
+def _get_cached_encoder(
+    enc_hook: Callable[[Any], Any],
+) -> msgspec.json.Encoder:
+    """
+    Encoders do not depend on types, so we have one per *enc_hook*.
+
+    If you want to clear this cache run:
+
+    .. code:: python
+
+        >>> _get_cached_encoder.cache_clear()
+
+    """
+    return msgspec.json.Encoder(enc_hook=enc_hook)
+
+
+@lru_cache(maxsize=MAX_CACHE_SIZE)
+def _get_cached_decoder(
+    model: Any,
+    dec_hook: Callable[[type[Any], Any], Any],
+    *,
+    strict: bool,
+) -> msgspec.json.Decoder[Any]:
+    """
+    It is expensive to create typed decoders, reuse existing ones.
+
+    If you want to clear this cache run:
+
+    .. code:: python
+
+        >>> _get_cached_decoder.cache_clear()
+
+    """
+    return msgspec.json.Decoder(model, dec_hook=dec_hook, strict=strict)
+
+
+@lru_cache(maxsize=MAX_CACHE_SIZE)
+def _get_cached_msgpack_encoder(
+    enc_hook: Callable[[Any], Any],
+) -> msgspec.msgpack.Encoder:
+    return msgspec.msgpack.Encoder(enc_hook=enc_hook)
+
+
+@lru_cache(maxsize=MAX_CACHE_SIZE)
+def _get_cached_msgpack_decoder(
+    model: Any,
+    dec_hook: Callable[[type[Any], Any], Any],
+    *,
+    strict: bool,
+) -> msgspec.msgpack.Decoder[Any]:
+    return msgspec.msgpack.Decoder(model, dec_hook=dec_hook, strict=strict)
+
+
+def _split_msgpack_array(buffer: bytes) -> Iterator[Any]:
+    try:
+        raw_items = msgspec.msgpack.decode(buffer, type=list[msgspec.Raw])
+    except msgspec.DecodeError as exc:
+        raise DataParsingError(str(exc)) from exc
+    yield from raw_items
@@ -7,12 +7,10 @@ from typing import (
     Literal,
     NotRequired,
     TypeAlias,
-    Union,
     final,
+    get_origin,
 )
 
-from typing_extensions import TypedDict
-
 try:
     import pydantic
 except ImportError:  # pragma: no cover
@@ -24,9 +22,13 @@ except ImportError:  # pragma: no cover
 
 import pydantic_core
 from pydantic.config import ExtraValues
-from typing_extensions import override
+from typing_extensions import TypedDict, override
 
 from django_modern_rest.exceptions import ResponseSerializationError
+from django_modern_rest.internal.json import (
+    deserialize as default_deserialize,
+)
+from django_modern_rest.internal.json import serialize as default_serialize
 from django_modern_rest.serialization import (
     BaseEndpointOptimizer,
     BaseSerializer,
@@ -36,11 +38,13 @@ from django_modern_rest.settings import (
     Settings,
     resolve_setting,
 )
+from django_modern_rest.types import (
+    contains_subclass,
+    is_sequence_annotation,
+)
 
 if TYPE_CHECKING:
-    from django_modern_rest.internal.json import (
-        FromJson,
-    )
+    from django_modern_rest.internal.json import FromJson
     from django_modern_rest.metadata import EndpointMetadata
 
 
@@ -49,8 +53,8 @@ if TYPE_CHECKING:
 _IncEx: TypeAlias = (
     set[int]
     | set[str]
-    | Mapping[int, Union['_IncEx', bool]]
-    | Mapping[str, Union['_IncEx', bool]]
+    | Mapping[int, '_IncEx | bool']
+    | Mapping[str, '_IncEx | bool']
 )
 
 
@@ -90,12 +94,20 @@ class PydanticEndpointOptimizer(BaseEndpointOptimizer):
 
     @override
     @classmethod
-    def optimize_endpoint(cls, metadata: 'EndpointMetadata') -> None:
-        """Create models for return types for validation."""
+    def optimize_endpoint(
+        cls,
+        metadata: 'EndpointMetadata',
+        serializer: type[BaseSerializer],
+    ) -> None:
+        """Create models for return types and request bodies."""
         # Just build all `TypeAdapater` instances
         # during import time and cache them for later use in runtime.
         for response in metadata.responses.values():
             _get_cached_type_adapter(response.return_type)
+        # Components like `Body` validate json directly with these adapters:
+        for component, type_args in metadata.component_parsers:
+            if getattr(get_origin(component), '__validates_data__', False):
+                _get_cached_type_adapter(type_args[0])
 
 
 class PydanticErrorDetails(TypedDict):
@@ -123,7 +135,7 @@ class PydanticErrorModel(TypedDict):
     detail: list[PydanticErrorDetails]
 
 
-class PydanticSerializer(BaseSerializer):
+class PydanticSerializer(BaseSerializer):  # noqa: WPS214
     """
     Serialize and deserialize objects using pydantic.
 
@@ -167,6 +179,37 @@ class PydanticSerializer(BaseSerializer):
         except pydantic_core.PydanticSerializationError as exc:
             raise ResponseSerializationError(str(exc)) from None
 
+    @override
+    @classmethod
+    def to_json(cls, structure: Any, model: Any) -> bytes:
+        """
+        Dump *structure* straight to json, when *model* has pydantic models.
+
+        It does not create intermediate python primitives
+        with :meth:`pydantic.BaseModel.model_dump`.
+        Other models are faster to serialize with :meth:`serialize`,
+        it is also used when *structure* does not match the *model*
+        and when custom :data:`~django_modern_rest.settings.Settings.serialize`
+        is set.
+        """
+        serialize = resolve_setting(Settings.serialize, import_string=True)
+        if serialize is not default_serialize or not contains_subclass(
+            model,
+            pydantic.BaseModel,
+        ):
+            return cls.serialize(structure)
+        dump_kwargs = dict(cls.model_dump_kwargs)
+        # `dump_json` always uses `json` mode:
+        dump_kwargs.pop('mode', None)
+        dump_kwargs['warnings'] = 'error'
+        try:
+            return _get_cached_type_adapter(model).dump_json(
+                structure,
+                **dump_kwargs,  # type: ignore[arg-type]
+            )
+        except pydantic_core.PydanticSerializationError:
+            return cls.serialize(structure)
+
     @override
     @classmethod
     def serialize_hook(cls, to_serialize: Any) -> Any:
@@ -228,6 +271,86 @@ class PydanticSerializer(BaseSerializer):
             **cls.from_python_kwargs,
         )
 
+    @override
+    @classmethod
+    def from_json(
+        cls,
+        buffer: 'FromJson',
+        model: Any,
+        *,
+        strict: bool,
+    ) -> Any:
+        """
+        Validate json *buffer* straight into *model*.
+
+        Uses ``pydantic-core`` json parser,
+        so no intermediate python primitives are created.
+        It can't use custom
+        :data:`~django_modern_rest.settings.Settings.deserialize`,
+        so when it is set, we use :meth:`deserialize`
+        and :meth:`from_python` instead.
+        """
+        deserialize = resolve_setting(Settings.deserialize, import_string=True)
+        if deserialize is not default_deserialize:
+            return super().from_json(buffer, model, strict=strict)
+        validate_kwargs = dict(cls.from_python_kwargs)
+        # This is the only option that is not supported for json:
+        validate_kwargs.pop('from_attributes', None)
+        return _get_cached_type_adapter(model).validate_json(
+            buffer,
+            strict=strict,
+            **validate_kwargs,  # type: ignore[arg-type]
+        )
+
+    @override
+    @classmethod
+    def field_names(cls, model: Any) -> frozenset[str] | None:
+        """
+        Return all keys that *model* can read from a mapping.
+
+        We return both names and aliases of fields,
+        because it depends on ``by_alias`` and ``by_name`` options.
+        Complex aliases like :class:`pydantic.AliasChoices` are not supported.
+        """
+        is_model = isinstance(model, type) and issubclass(
+            model,
+            pydantic.BaseModel,
+        )
+        config = (
+            model.model_config
+            if is_model
+            else getattr(model, '__pydantic_config__', {})
+        )
+        extra = cls.from_python_kwargs.get('extra') or config.get('extra')
+        if extra in {'allow', 'forbid'}:
+            return None
+        if not is_model:
+            return super().field_names(model)
+
+        aliases = [
+            field.alias
+            if field.validation_alias is None
+            else field.validation_alias
+            for field in model.model_fields.values()
+        ]
+        if any(not isinstance(alias, str | None) for alias in aliases):
+            return None
+        return frozenset((*model.model_fields, *filter(None, aliases)))
+
+    @override
+    @classmethod
+    def sequence_field_names(cls, model: Any) -> frozenset[str]:
+        """Return names and aliases of fields that expect multiple values."""
+        if isinstance(model, type) and issubclass(model, pydantic.BaseModel):
+            return frozenset(
+                field_name
+                for name, field in model.model_fields.items()
+                if is_sequence_annotation(field.annotation)
+                for field_name in (name, field.alias, field.validation_alias)
+                if isinstance(field_name, str)
+            )
+        return super().sequence_field_names(model)
+
     @override
     @classmethod
     def error_serialize(cls, error: Exception | str) -> Any:
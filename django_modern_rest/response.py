@@ -1,16 +1,20 @@
 import dataclasses
 from collections.abc import Mapping
 from http import HTTPMethod, HTTPStatus
+from http.cookies import SimpleCookie
 from typing import Any, Generic, TypeVar, overload
 
 from django.http import HttpResponse
+from django.http.response import HttpResponseBase, ResponseHeaders
+from typing_extensions import override
 
-from django_modern_rest.cookies import CookieSpec, NewCookie
+from django_modern_rest.cookies import CookieSpec, NewCookie, copy_cookies
 from django_modern_rest.headers import (
     HeaderSpec,
     NewHeader,
 )
 from django_modern_rest.serialization import BaseSerializer
+from django_modern_rest.types import EmptyObj
 
 _ItemT = TypeVar('_ItemT')
 
@@ -86,6 +90,9 @@ class ResponseSpec:
         cookies: Shows *cookies* in the documentation.
             When passed, we validate that all given required cookies are present
             in the final response.
+        media_type: Shows *media_type* in the documentation.
+            Responses are json encoded by the serializer by default.
+            Bodies of other media types, like files, are not validated.
 
     We use this structure to validate responses and render them in OpenAPI.
     """
@@ -101,6 +108,7 @@ class ResponseSpec:
         kw_only=True,
         default=None,
     )
+    media_type: str | None = dataclasses.field(kw_only=True, default=None)
 
     # TODO: description, examples, etc
 
@@ -122,6 +130,10 @@ class ResponseModification:
             Headers passed here will be added to the final response.
         cookies: Shows *cookies* in the documentation.
             Cookies passed here will be added to the final response.
+        streaming: Items of *return_type* list are streamed one by one.
+            It is set for endpoints that return iterators.
+        media_type: Shows *media_type* in the documentation.
+            It is set for streams that are not json encoded.
 
     We use this structure to modify the default response.
     """
@@ -131,6 +143,8 @@ class ResponseModification:
     status_code: HTTPStatus
     headers: Mapping[str, NewHeader] | None
     cookies: Mapping[str, NewCookie] | None
+    streaming: bool = False
+    media_type: str | None = None
 
     def to_spec(self) -> ResponseSpec:
         """Convert response modification to response description."""
@@ -153,6 +167,95 @@ class ResponseModification:
                     for cookie_key, cookie in self.cookies.items()
                 }
             ),
+            media_type=self.media_type,
+        )
+
+
+class SerializedResponse(HttpResponse):
+    """
+    Lightweight :class:`django.http.HttpResponse` for serialized content.
+
+    It is fully compatible with the regular ``HttpResponse``,
+    but skips all the work that is not needed for already serialized data:
+
+    - *content* is stored as is, without any copies or conversions
+    - ``Content-Type`` is always passed explicitly
+    - ``Content-Length`` is set up front and is kept in sync with the content,
+      so servers don't need to use chunked responses
+
+    Pre-built *headers* from :func:`~django_modern_rest.headers.build_headers`
+    are copied as is, other headers are normalized by Django.
+    Both override the *content_type*.
+    """
+
+    #: Python data of the content, it is set by :func:`build_response`
+    #: and cleared when the content is changed.
+    __raw_data__: tuple[Any] | None
+
+    def __init__(
+        self,
+        serialized: bytes,
+        *,
+        status: int,
+        content_type: str,
+        headers: dict[str, str] | ResponseHeaders | None = None,
+    ) -> None:
+        """Create the response, without slow content conversions."""
+        # Parent's constructor would convert the content, we skip it:
+        HttpResponseBase.__init__(
+            self,
+            content_type=content_type,
+            status=status,
+        )
+        if isinstance(headers, ResponseHeaders):
+            # They are already normalized, we don't do it twice:
+            self.headers._store.update(headers._store)  # noqa: SLF001
+        elif headers:
+            for header_name, header_value in headers.items():
+                self.headers[header_name] = header_value
+        self._set_content(serialized)
+
+    @property  # type: ignore[explicit-override]
+    def content(self) -> bytes:  # noqa: WPS110
+        """Returns the response content."""
+        return b''.join(self._container)
+
+    @content.setter
+    def content(self, new_content: object) -> None:  # noqa: WPS110
+        """Sets new content and ``Content-Length`` header."""
+        HttpResponse.content.fset(self, new_content)  # type: ignore[attr-defined]
+        self._set_content(self._container[0])
+        self.__raw_data__ = None
+
+    @override
+    def write(self, chunk: str | bytes) -> None:
+        """Writes new content and updates ``Content-Length`` header."""
+        super().write(chunk)
+        self._set_content(b''.join(self._container))
+        self.__raw_data__ = None
+
+    def copy(self) -> 'SerializedResponse':
+        """
+        Returns a new response with the same content, headers, and cookies.
+
+        Use it to serve pre-built responses,
+        because response objects can be modified by middleware.
+        """
+        response = SerializedResponse(
+            self._container[0],
+            status=self.status_code,
+            content_type=self.headers['Content-Type'],
+            headers=self.headers,
+        )
+        copy_cookies(response, self.cookies)
+        return response
+
+    def _set_content(self, serialized: bytes) -> None:
+        self._container = [serialized]
+        # The length is always a valid header value:
+        self.headers._store['content-length'] = (  # noqa: SLF001
+            'Content-Length',
+            str(len(serialized)),
         )
 
 
@@ -162,10 +265,11 @@ def build_response(
     *,
     raw_data: Any,
     method: HTTPMethod | str,
-    headers: dict[str, str] | None = None,
-    cookies: Mapping[str, NewCookie] | None = None,
+    headers: dict[str, str] | ResponseHeaders | None = None,
+    cookies: Mapping[str, NewCookie] | SimpleCookie | None = None,
     status_code: HTTPStatus | None = None,
-) -> HttpResponse: ...
+    return_type: Any = EmptyObj,
+) -> SerializedResponse: ...
 
 
 @overload
@@ -175,9 +279,10 @@ def build_response(
     raw_data: Any,
     status_code: HTTPStatus,
     method: None = None,
-    headers: dict[str, str] | None = None,
-    cookies: Mapping[str, NewCookie] | None = None,
-) -> HttpResponse: ...
+    headers: dict[str, str] | ResponseHeaders | None = None,
+    cookies: Mapping[str, NewCookie] | SimpleCookie | None = None,
+    return_type: Any = EmptyObj,
+) -> SerializedResponse: ...
 
 
 def build_response(  # noqa: WPS211
@@ -185,10 +290,11 @@ def build_response(  # noqa: WPS211
     *,
     raw_data: Any,
     method: HTTPMethod | str | None = None,
-    headers: dict[str, str] | None = None,
-    cookies: Mapping[str, NewCookie] | None = None,
+    headers: dict[str, str] | ResponseHeaders | None = None,
+    cookies: Mapping[str, NewCookie] | SimpleCookie | None = None,
     status_code: HTTPStatus | None = None,
-) -> HttpResponse:
+    return_type: Any = EmptyObj,
+) -> SerializedResponse:
     """
     Utility that returns the actual `HttpResponse` object from its parts.
 
@@ -199,6 +305,11 @@ def build_response(  # noqa: WPS211
     :meth:`~django_modern_rest.controller.Controller.to_response` method.
 
     You have to provide either *method* or *status_code*.
+    When *return_type* of *raw_data* is known,
+    it is used to pick a faster serialization path.
+    Pre-built *headers* from :func:`~django_modern_rest.headers.build_headers`
+    and *cookies* from :func:`~django_modern_rest.cookies.render_cookies`
+    are copied to the response without extra processing.
     """
     if status_code is not None:
         status = status_code
@@ -209,16 +320,22 @@ def build_response(  # noqa: WPS211
             'Cannot pass both `method=None` and `status_code=Empty`',
         )
 
-    response_headers = {} if headers is None else headers
-    if 'Content-Type' not in response_headers:
-        response_headers['Content-Type'] = serializer.content_type
-
-    response = HttpResponse(
-        content=serializer.serialize(raw_data),
+    response = SerializedResponse(
+        (
+            serializer.serialize(raw_data)
+            if return_type is EmptyObj
+            else serializer.to_json(raw_data, return_type)
+        ),
         status=status,
-        headers=response_headers,
+        content_type=serializer.content_type,
+        headers=headers,
     )
-    if cookies:
+    # Response validation can reuse *raw_data* instead of parsing the content,
+    # until the content is changed:
+    response.__raw_data__ = (raw_data,)
+    if isinstance(cookies, SimpleCookie):
+        copy_cookies(response, cookies)
+    elif cookies:
         for cookie_key, new_cookie in cookies.items():
             response.set_cookie(cookie_key, **new_cookie.as_dict())
     return response
@@ -6,14 +6,18 @@ from typing import (
     TypeAlias,
     TypeVar,
     cast,
+    final,
     overload,
 )
 
 from django.http import HttpResponseBase
+from django.urls import Resolver404, ResolverMatch
 from django.urls import path as _django_path
 from django.urls.resolvers import RoutePattern, URLPattern, URLResolver
 from typing_extensions import override
 
+from django_modern_rest.internal.url_trie import RouteTrie
+
 if TYPE_CHECKING:
     from django_modern_rest.controller import Blueprint, Controller
     from django_modern_rest.options_mixins import AsyncMetaMixin, MetaMixin
@@ -28,12 +32,30 @@ _AnyPattern: TypeAlias = URLPattern | URLResolver
 
 
 class Router:
-    """Collection of HTTP routes for REST framework."""
+    """
+    Collection of HTTP routes for REST framework.
+
+    Args:
+        urls: Sequence of url patterns to route.
+        compiled: Compile all routes into a segment trie.
+            Instead of trying all patterns one by one,
+            we only try patterns which can possibly match the path.
+            Resolution takes ``O(path segments)`` and produces
+            the same :class:`django.urls.ResolverMatch` as Django does.
+
+    """
 
     __slots__ = ('urls',)
 
-    def __init__(self, urls: Sequence[_AnyPattern]) -> None:
-        """Just stores the passed routes."""
+    def __init__(
+        self,
+        urls: Sequence[_AnyPattern],
+        *,
+        compiled: bool = False,
+    ) -> None:
+        """Stores the passed routes, possibly compiling them."""
+        if compiled:
+            urls = [_CompiledURLResolver(urls)]
         self.urls = urls
 
 
@@ -181,3 +203,64 @@ def path(
             Pattern=_PrefixRoutePattern,
         ),
     )
+
+
+@final
+class _CompiledURLResolver(URLResolver):
+    """
+    URL resolver that only tries patterns from the segment trie.
+
+    Reversing, namespaces, and checks work the same way,
+    because all the original patterns are kept as-is.
+    """
+
+    def __init__(self, urls: Sequence[_AnyPattern]) -> None:
+        super().__init__(_PrefixRoutePattern(''), urls)
+        self._patterns = list(urls)
+        self._trie = RouteTrie(self._patterns)
+
+    @override
+    def resolve(self, path: str) -> ResolverMatch:  # noqa: WPS210
+        """Same as :meth:`django.urls.URLResolver.resolve`, but faster."""
+        path = str(path)  # path may be a reverse_lazy object
+        tried: list[list[Any]] = []
+        # Our own pattern is empty, so it always matches:
+        for index in self._trie.candidates(path):
+            pattern = self._patterns[index]
+            try:
+                sub_match = pattern.resolve(path)
+            except Resolver404 as exc:
+                self._extend_tried(tried, pattern, exc.args[0].get('tried'))  # type: ignore[attr-defined]  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType]
+            else:
+                if sub_match:
+                    return self._build_match(pattern, sub_match, tried)
+                tried.append([pattern])
+        raise Resolver404({'tried': tried, 'path': path})
+
+    def _build_match(
+        self,
+        pattern: _AnyPattern,
+        sub_match: ResolverMatch,
+        tried: list[list[Any]],
+    ) -> ResolverMatch:
+        # Same logic as in Django, but our own pattern never captures:
+        sub_match_dict = {**self.default_kwargs, **sub_match.kwargs}
+        current_route = (
+            '' if isinstance(pattern, URLPattern) else str(pattern.pattern)
+        )
+        self._extend_tried(tried, pattern, sub_match.tried)  # type: ignore[attr-defined]  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType]
+        return ResolverMatch(
+            sub_match.func,
+            sub_match.args,
+            sub_match_dict,
+            sub_match.url_name,
+            [self.app_name, *sub_match.app_names],
+            [self.namespace, *sub_match.namespaces],
+            self._join_route(current_route, sub_match.route),  # type: ignore[attr-defined]  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType]
+            tried,
+            captured_kwargs=sub_match.captured_kwargs,  # type: ignore[attr-defined]
+            extra_kwargs={
+                **self.default_kwargs,
+                **sub_match.extra_kwargs,  # type: ignore[attr-defined]
+            },
+        )
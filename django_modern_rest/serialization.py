@@ -1,14 +1,31 @@
 import abc
 import dataclasses
-from typing import TYPE_CHECKING, Any, ClassVar, TypeAlias, TypeVar
+from collections.abc import Callable, Iterator
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    TypeAlias,
+    TypeVar,
+    get_args,
+    get_origin,
+)
 
 from django.http import HttpHeaders, HttpRequest
-from typing_extensions import TypedDict
+from typing_extensions import TypedDict, get_type_hints, is_typeddict
 
 from django_modern_rest.exceptions import (
+    DataParsingError,
     RequestSerializationError,
     ResponseSerializationError,
 )
+from django_modern_rest.internal.codegen import compile_context_parser
+from django_modern_rest.internal.json.stream import (
+    json_lines,
+    split_json_array,
+    split_json_lines,
+)
+from django_modern_rest.types import is_sequence_annotation
 
 if TYPE_CHECKING:
     from django_modern_rest.components import ComponentParser
@@ -21,7 +38,7 @@ _ComponentParserSpec = dict[type['ComponentParser'], Any]
 _TypeMapResult: TypeAlias = tuple[_ComponentParserSpec, dict[str, Any]]
 
 
-class BaseSerializer:
+class BaseSerializer:  # noqa: WPS214
     """Abstract base class for JSON serialization."""
 
     __slots__ = ()
@@ -33,6 +50,13 @@ class BaseSerializer:
 
     # API that have defaults:
     content_type: ClassVar[str] = 'application/json'
+    #: Content types of newline delimited json, also known as JSON Lines.
+    ndjson_content_types: ClassVar[tuple[str, ...]] = (
+        'application/x-ndjson',
+        'application/jsonl',
+    )
+    #: Whether endpoints can stream items and server-sent events.
+    supports_streaming: ClassVar[bool] = True
 
     @classmethod
     @abc.abstractmethod
@@ -40,6 +64,17 @@ class BaseSerializer:
         """Convert structured data to json bytestring."""
         raise NotImplementedError
 
+    @classmethod
+    def to_json(cls, structure: Any, model: Any) -> bytes:
+        """
+        Convert *structure* of a known *model* type to json bytestring.
+
+        Plugins can redefine this method to use encoders
+        that are specialized for the *model*.
+        By default it is :meth:`serialize`.
+        """
+        return cls.serialize(structure)
+
     @classmethod
     def serialize_hook(cls, to_serialize: Any) -> Any:
         """
@@ -111,6 +146,116 @@ class BaseSerializer:
         """
         raise NotImplementedError
 
+    @classmethod
+    def from_json(
+        cls,
+        buffer: 'FromJson',
+        model: Any,
+        *,
+        strict: bool,
+    ) -> Any:
+        """
+        Parse json *buffer* straight into *model*.
+
+        Plugins can redefine this method to skip creating
+        intermediate python primitives.
+        By default it is :meth:`deserialize` and :meth:`from_python`.
+
+        Raises:
+            validation_error: When data does not match the *model*.
+            DataParsingError: When *buffer* is not a valid json.
+
+        """
+        return cls.from_python(cls.deserialize(buffer), model, strict=strict)
+
+    @classmethod
+    def deserialize_ndjson(cls, buffer: bytes) -> list[Any]:
+        """Convert newline delimited json to a list of simple objects."""
+        return [cls.deserialize(line) for line in json_lines(buffer)]
+
+    @classmethod
+    def from_ndjson(
+        cls,
+        buffer: bytes,
+        model: Any,
+        *,
+        strict: bool,
+    ) -> Any:
+        """
+        Parse newline delimited json *buffer* into *model*.
+
+        Each line is a single item of *model*, like ``list[Item]``.
+        Lines of ``list[Item]`` models are parsed with :meth:`from_json`,
+        other models get :meth:`deserialize_ndjson` and :meth:`from_python`.
+        Plugins can redefine this method to decode all lines at once.
+
+        Raises:
+            validation_error: When data does not match the *model*.
+            DataParsingError: When any line is not a valid json.
+
+        """
+        if get_origin(model) is list:
+            item_model = get_args(model)[0]
+            return [
+                cls.from_json(line, item_model, strict=strict)
+                for line in json_lines(buffer)
+            ]
+        return cls.from_python(
+            cls.deserialize_ndjson(buffer),
+            model,
+            strict=strict,
+        )
+
+    @classmethod
+    def split_body(
+        cls,
+        read: Callable[[int], bytes],
+        chunk_size: int,
+        *,
+        ndjson: bool,
+    ) -> Iterator['FromJson']:
+        """
+        Split a request body into raw items of a top level array.
+
+        Used by :class:`~django_modern_rest.components.StreamingBody`.
+        By default the body is read with *read* by *chunk_size* bytes
+        and is split as a json array or as newline delimited json.
+        Raw items are parsed later with :meth:`from_json`.
+        """
+        if ndjson:
+            return split_json_lines(read, chunk_size)
+        return split_json_array(read, chunk_size)
+
+    @classmethod
+    def field_names(cls, model: Any) -> frozenset[str] | None:
+        """
+        Return all keys that *model* can read from a mapping.
+
+        Used to read only the needed keys from big mappings,
+        like request headers, before validation.
+        Returns ``None`` when keys can't be known in advance,
+        for example, when *model* allows or forbids extra keys.
+        """
+        if is_typeddict(model):
+            return model.__required_keys__ | model.__optional_keys__  # type: ignore[no-any-return]
+        return None
+
+    @classmethod
+    def sequence_field_names(cls, model: Any) -> frozenset[str]:
+        """
+        Return keys from :meth:`field_names` that expect multiple values.
+
+        Used to parse query strings: keys like ``tags: list[str]``
+        get all the values, other keys only get the last value.
+        """
+        if is_typeddict(model):
+            return frozenset(
+                field_name
+                for field_name, annotation in get_type_hints(model).items()
+                if is_sequence_annotation(annotation)
+            )
+        return frozenset()
+
     @classmethod
     @abc.abstractmethod
     def error_serialize(cls, error: Exception | str) -> Any:
@@ -135,23 +280,34 @@ class BaseEndpointOptimizer:
 
     @classmethod
     @abc.abstractmethod
-    def optimize_endpoint(cls, metadata: 'EndpointMetadata') -> None:
+    def optimize_endpoint(
+        cls,
+        metadata: 'EndpointMetadata',
+        serializer: type[BaseSerializer],
+    ) -> None:
         """
         Optimize the endpoint.
 
         Args:
             metadata: Endpoint metadata to optimize.
+            serializer: Serializer that is used by the endpoint.
 
         """
 
 
 @dataclasses.dataclass(slots=True)
-class SerializerContext:
+class SerializerContext:  # noqa: WPS214
     """Parse and bind request components for a controller.
 
     This context collects raw data for all registered components, validates
     the combined payload in a single call using a cached TypedDict model,
     and then binds the parsed values back to the controller.
+    Components that can validate their data themselves, like ``Body``,
+    are not a part of the combined payload.
+
+    Attributes:
+        strict_validation: Whether to use strict validation for requests.
+
     """
 
     # Public API:
@@ -161,23 +317,44 @@ class SerializerContext:
 
     blueprint_cls: 'type[Blueprint[BaseSerializer]]'
     _specs: _ComponentParserSpec = dataclasses.field(init=False)
+    _raw_specs: _ComponentParserSpec = dataclasses.field(init=False)
+    _validated_specs: _ComponentParserSpec = dataclasses.field(init=False)
+    _full_model: Any = dataclasses.field(init=False)
     _combined_model: Any = dataclasses.field(init=False)
+    _compiled: Callable[..., None] = dataclasses.field(init=False)
 
     def __post_init__(self) -> None:
         """Eagerly build context for a given controller and serializer."""
         specs, type_map = self._build_type_map(self.blueprint_cls)
         self._specs = specs
+        self._raw_specs = {
+            component: model
+            for component, model in specs.items()
+            if not _has_flag(component, '__validates_data__')
+        }
+        self._validated_specs = {
+            component: model
+            for component, model in specs.items()
+            if component not in self._raw_specs
+        }
 
         # Name is not really important,
         # we use `@` to identify that it is generated:
         name_prefix = self.blueprint_cls.__qualname__
-        combined_name = f'_{name_prefix}@ContextModel'
-
-        self._combined_model = TypedDict(  # type: ignore[misc]
-            combined_name,  # pyright: ignore[reportArgumentType]
+        self._full_model = TypedDict(  # type: ignore[misc]
+            f'_{name_prefix}@ContextModel',  # pyright: ignore[reportArgumentType]
             type_map,
             total=True,
         )
+        self._combined_model = TypedDict(  # type: ignore[misc]
+            f'_{name_prefix}@RawContextModel',  # pyright: ignore[reportArgumentType]
+            {
+                component.context_name: model
+                for component, model in self._raw_specs.items()
+            },
+            total=True,
+        )
+        self._compiled = self._compile()
 
     def parse_and_bind(
         self,
@@ -189,17 +366,107 @@ class SerializerContext:
         """
         Collect, validate, and bind component data to the controller.
 
+        Uses a function specialized for the exact set of components,
+        which is generated once when the blueprint is created.
+
         Raises:
             serializer.validation_error: When provided data does not
                 match the expected model.
 
         """
-        if not self._specs:
-            return
+        self._compiled(blueprint, request, *args, **kwargs)
+
+    def _parse_and_bind_generic(
+        self,
+        blueprint: 'Blueprint[BaseSerializer]',
+        request: HttpRequest,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """Generic version of :meth:`parse_and_bind` without codegen."""
+        errors = self._validated_errors()
+        try:
+            validated = {
+                component.context_name: component.provide_validated_data(
+                    blueprint,
+                    model,
+                    request,
+                    *args,
+                    **kwargs,
+                )
+                for component, model in self._validated_specs.items()
+            }
+        except errors:
+            self._parse_and_bind_fallback(blueprint, request, *args, **kwargs)
+        else:
+            context = self._collect_context(
+                blueprint,
+                request,
+                *args,
+                **kwargs,
+            )
+            validated.update(self._validate_context(context))
+            self._bind_parsed(blueprint, validated)
+
+    def _parse_and_bind_fallback(
+        self,
+        blueprint: 'Blueprint[BaseSerializer]',
+        request: HttpRequest,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Parse all components from raw data with a single model.
+
+        Used when some component failed to validate its own data,
+        so we can report all errors in the same format.
+        """
+        context = {
+            component.context_name: component.provide_context_data(
+                blueprint,
+                model,
+                request,
+                *args,
+                **kwargs,
+            )
+            for component, model in self._specs.items()
+        }
+        self._bind_parsed(
+            blueprint,
+            self._validate_combined(context, self._full_model),
+        )
 
-        context = self._collect_context(blueprint, request, *args, **kwargs)
-        validated = self._validate_context(context)
-        self._bind_parsed(blueprint, validated)
+    def _validated_errors(self) -> tuple[type[Exception], ...]:
+        return (
+            self.blueprint_cls.serializer.validation_error,
+            DataParsingError,
+        )
+
+    def _compile(self) -> Callable[..., None]:
+        """
+        Generate a specialized ``parse_and_bind`` function.
+
+        It does the same thing as :meth:`_parse_and_bind_generic`,
+        but without any loops over components in runtime.
+        Subclasses with custom ``_collect_context`` or ``_bind_parsed``
+        use the generic version.
+        """
+        if not self._specs:
+            return _do_nothing
+        klass = type(self)
+        if any(
+            getattr(klass, method) is not getattr(SerializerContext, method)
+            for method in ('_collect_context', '_bind_parsed')
+        ):
+            return self._parse_and_bind_generic
+        return compile_context_parser(
+            self._raw_specs,
+            self._validated_specs,
+            self._validate_context,
+            self._parse_and_bind_fallback,
+            self._validated_errors(),
+            name=self.blueprint_cls.__qualname__,
+        )
 
     def _build_type_map(
         self,
@@ -224,7 +491,7 @@ class SerializerContext:
     ) -> dict[str, Any]:
         """Collect raw data for all components into a mapping."""
         context: dict[str, Any] = {}
-        for component, submodel in self._specs.items():
+        for component, submodel in self._raw_specs.items():
             raw = component.provide_context_data(
                 blueprint,
                 submodel,  # just the one for the exact key
@@ -236,12 +503,20 @@ class SerializerContext:
         return context
 
     def _validate_context(self, context: dict[str, Any]) -> dict[str, Any]:
+        """Validate the raw payload of components."""
+        return self._validate_combined(context, self._combined_model)
+
+    def _validate_combined(
+        self,
+        context: dict[str, Any],
+        combined_model: Any,
+    ) -> dict[str, Any]:
         """Validate the combined payload using the cached TypedDict model."""
         serializer = self.blueprint_cls.serializer
         try:
             return serializer.from_python(  # type: ignore[no-any-return]
                 context,
-                self._combined_model,
+                combined_model,
                 strict=self.strict_validation,
             )
         except serializer.validation_error as exc:
@@ -257,3 +532,13 @@ class SerializerContext:
         """Bind parsed values back to the blueprint instance."""
         for name, parsed_value in validated.items():
             setattr(blueprint, name, parsed_value)
+
+
+def _has_flag(component: Any, flag: str) -> bool:
+    # Components are generic aliases here, they don't proxy
+    # dunder attributes, so we use the origin class:
+    return getattr(get_origin(component), flag, False)
+
+
+def _do_nothing(*args: Any, **kwargs: Any) -> None:
+    """Used when there are no components to parse."""
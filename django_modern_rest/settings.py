@@ -30,9 +30,13 @@ class Settings(enum.StrEnum):
     deserialize = 'deserialize'
     no_validate_http_spec = 'no_validate_http_spec'
     validate_responses = 'validate_responses'
+    validate_responses_sample_rate = 'validate_responses_sample_rate'
     responses = 'responses'
     global_error_handler = 'global_error_handler'
     openapi_config = 'openapi_config'
+    max_memory_body_size = 'max_memory_body_size'
+    sse_heartbeat_interval = 'sse_heartbeat_interval'
+    file_offload = 'file_offload'
 
 
 @final
@@ -77,10 +81,18 @@ _DEFAULTS: Final[Mapping[str, Any]] = {  # noqa: WPS407
     Settings.no_validate_http_spec: frozenset(),
     # Means that we would run extra validation on the response object.
     Settings.validate_responses: True,
+    # Fraction of responses to validate, failures are only logged when < 1:
+    Settings.validate_responses_sample_rate: 1.0,
     Settings.responses: [],  # global responses, for response validation
     Settings.global_error_handler: (
         'django_modern_rest.errors.global_error_handler'
     ),
+    # Request bodies bigger than 10 MiB are spooled to temporary files:
+    Settings.max_memory_body_size: 10 * 1024 * 1024,
+    # Idle server-sent events streams send comments every 15 seconds:
+    Settings.sse_heartbeat_interval: 15.0,
+    # Files are sent by Django itself by default:
+    Settings.file_offload: None,
 }
 
 assert all(setting_key in _DEFAULTS for setting_key in Settings), (  # noqa: S101
@@ -0,0 +1,211 @@
+import asyncio
+import contextlib
+import dataclasses
+from collections.abc import AsyncIterable, AsyncIterator, Callable
+from http import HTTPStatus
+from http.cookies import SimpleCookie
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Final,
+    Generic,
+    TypeVar,
+    final,
+    get_args,
+)
+
+from django.http import StreamingHttpResponse
+from django.http.response import ResponseHeaders
+
+from django_modern_rest.cookies import copy_cookies
+
+if TYPE_CHECKING:
+    from django_modern_rest.serialization import BaseSerializer
+
+_DataT = TypeVar('_DataT')
+
+#: Content type of server-sent events streams.
+EVENT_STREAM_CONTENT_TYPE: Final = 'text/event-stream'
+
+# Comments are ignored by clients, but keep connections alive:
+_HEARTBEAT: Final = b':\n\n'
+_LINE_BREAKS: Final = frozenset('\r\n')
+
+
+@final
+@dataclasses.dataclass(frozen=True, slots=True)
+class ServerSentEvent(Generic[_DataT]):
+    """
+    Single server-sent event.
+
+    Return ``AsyncIterator[ServerSentEvent[Model]]`` from async endpoints
+    to stream events to clients.
+
+    Args:
+        data: Event payload, it is serialized to json
+            with the controller's serializer.
+        event: Event type, clients can subscribe to specific types.
+        id: Event id, clients send the last received one
+            in ``Last-Event-ID`` header when they reconnect.
+        retry: Reconnection time in milliseconds.
+
+    """
+
+    data: _DataT  # noqa: WPS110
+    event: str | None = dataclasses.field(default=None, kw_only=True)
+    id: str | None = dataclasses.field(default=None, kw_only=True)
+    retry: int | None = dataclasses.field(default=None, kw_only=True)
+
+    def __post_init__(self) -> None:
+        """Ensure that fields can't break the stream format."""
+        for field_value in (self.event, self.id):
+            if field_value is not None and not _LINE_BREAKS.isdisjoint(
+                field_value,
+            ):
+                raise ValueError(
+                    f'Server-sent event fields cannot contain line breaks: '
+                    f'{field_value!r}',
+                )
+
+
+def event_data_type(event_type: Any) -> Any:
+    """
+    Returns payload type of server-sent events.
+
+    >>> event_data_type(ServerSentEvent[int])
+    <class 'int'>
+    >>> event_data_type(ServerSentEvent)
+    typing.Any
+    """
+    type_args = get_args(event_type)
+    return type_args[0] if type_args else Any
+
+
+def build_event_stream_response(  # noqa: WPS211
+    serializer: type['BaseSerializer'],
+    *,
+    events: AsyncIterable[ServerSentEvent[Any]],
+    event_type: Any,
+    status_code: HTTPStatus,
+    headers: ResponseHeaders | None = None,
+    cookies: SimpleCookie | None = None,
+    validate_event: Callable[[Any], None] | None = None,
+    heartbeat_interval: float | None = None,
+) -> StreamingHttpResponse:
+    """
+    Returns :class:`django.http.StreamingHttpResponse` with server-sent events.
+
+    Event payloads are serialized with the *serializer*,
+    *event_type* is a type of events, like ``ServerSentEvent[Model]``.
+    *validate_event* is called before encoding each event, if passed.
+
+    Each event is sent as soon as it is produced.
+    The next event is only requested from *events*
+    when the previous one is sent to the client,
+    so slow clients slow down producers instead of growing buffers.
+    When no events are produced for *heartbeat_interval* seconds,
+    we send a comment to keep the connection alive.
+    """
+    data_type = event_data_type(event_type)
+    response = StreamingHttpResponse(
+        _encode_events(
+            events,
+            lambda event: _encode_event(
+                event,
+                serializer.to_json(event.data, data_type),
+            ),
+            validate_event,
+            heartbeat_interval,
+        ),
+        status=status_code,
+        headers=headers,
+    )
+    response.headers['Content-Type'] = EVENT_STREAM_CONTENT_TYPE
+    # Events must not be cached or buffered by proxies:
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    if cookies:
+        copy_cookies(response, cookies)
+    return response
+
+
+def _encode_event(event: ServerSentEvent[Any], encoded_data: bytes) -> bytes:
+    lines = []
+    if event.id is not None:
+        lines.append(f'id: {event.id}\n'.encode())
+    if event.event is not None:
+        lines.append(f'event: {event.event}\n'.encode())
+    if event.retry is not None:
+        lines.append(f'retry: {event.retry}\n'.encode())
+    # Json is encoded to a single line, since all line breaks are escaped:
+    lines.extend((b'data: ', encoded_data, b'\n\n'))
+    return b''.join(lines)
+
+
+async def _encode_events(
+    events: AsyncIterable[ServerSentEvent[Any]],
+    encode: Callable[[ServerSentEvent[Any]], bytes],
+    validate_event: Callable[[Any], None] | None,
+    heartbeat_interval: float | None,
+) -> AsyncIterator[bytes]:
+    async with _EventProducer(events, heartbeat_interval) as producer:
+        async for event in producer:
+            if event is None:
+                yield _HEARTBEAT
+                continue
+            if validate_event is not None:
+                validate_event(event)
+            yield encode(event)
+
+
+@final
+class _EventProducer:
+    """
+    Waits for events, but not longer than *heartbeat_interval*.
+
+    Producers are closed on exit, even when clients disconnect.
+    """
+
+    __slots__ = ('_heartbeat_interval', '_iterator', '_next_event')
+
+    def __init__(
+        self,
+        events: AsyncIterable[ServerSentEvent[Any]],
+        heartbeat_interval: float | None,
+    ) -> None:
+        self._iterator = aiter(events)
+        self._heartbeat_interval = heartbeat_interval
+        self._next_event: asyncio.Future[ServerSentEvent[Any]] | None = None
+
+    async def __aenter__(self) -> '_EventProducer':
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        next_event = self._next_event
+        if next_event is not None and next_event.cancel():
+            with contextlib.suppress(
+                asyncio.CancelledError,
+                StopAsyncIteration,
+            ):
+                await next_event
+        aclose = getattr(self._iterator, 'aclose', None)
+        if aclose is not None:
+            await aclose()
+
+    def __aiter__(self) -> '_EventProducer':
+        return self
+
+    async def __anext__(self) -> ServerSentEvent[Any] | None:
+        """Returns ``None`` when a heartbeat must be sent."""
+        if self._next_event is None:
+            self._next_event = asyncio.ensure_future(anext(self._iterator))
+        # We don't use `wait_for`, because timeouts cancel producers:
+        await asyncio.wait(
+            (self._next_event,),
+            timeout=self._heartbeat_interval,
+        )
+        if not self._next_event.done():
+            return None
+        next_event = self._next_event
+        self._next_event = None
+        return next_event.result()
@@ -0,0 +1,288 @@
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+)
+from http import HTTPStatus
+from http.cookies import SimpleCookie
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Final,
+    Generic,
+    TypeVar,
+    final,
+    get_args,
+    get_origin,
+)
+
+from django.http import StreamingHttpResponse
+from django.http.request import MediaType
+from django.http.response import ResponseHeaders
+
+from django_modern_rest.cookies import copy_cookies
+from django_modern_rest.exceptions import (
+    DataParsingError,
+    RequestSerializationError,
+)
+from django_modern_rest.types import EmptyObj
+
+if TYPE_CHECKING:
+    from django_modern_rest.internal.json import FromJson
+    from django_modern_rest.serialization import BaseSerializer
+
+_ItemT = TypeVar('_ItemT')
+
+_STREAM_TYPES: Final = frozenset((
+    Iterator,
+    AsyncIterator,
+    Generator,
+    AsyncGenerator,
+))
+# Encoded items are sent in chunks of about this size:
+_CHUNK_SIZE: Final = 64 * 1024  # noqa: WPS432
+_NEWLINE: Final = b'\n'
+
+
+@final
+class BodyStream(Generic[_ItemT]):
+    """
+    Lazily parsed and validated items of a request body.
+
+    Items are parsed one by one, when you iterate over the stream,
+    so only a single item is kept in memory.
+    Supports both ``for`` and ``async for`` loops,
+    but can be iterated over only once.
+
+    Raises :exc:`~django_modern_rest.exceptions.RequestSerializationError`
+    on the first item that can't be parsed.
+    Locations of its errors start with the item's index.
+    Items that were already processed are not rolled back,
+    use database transactions if you need to.
+    """
+
+    __slots__ = ('_index', '_model', '_raw_items', '_serializer', '_strict')
+
+    def __init__(
+        self,
+        raw_items: Iterator['FromJson'],
+        serializer: type['BaseSerializer'],
+        model: Any,
+        *,
+        strict: bool,
+    ) -> None:
+        """Create a stream of *raw_items* to be validated as *model*."""
+        self._raw_items = raw_items
+        self._serializer = serializer
+        self._model = model
+        self._strict = strict
+        self._index = 0
+
+    def __iter__(self) -> 'BodyStream[_ItemT]':
+        """Iterate over validated items."""
+        return self
+
+    def __next__(self) -> _ItemT:
+        """Parse and validate the next item."""
+        serializer = self._serializer
+        try:
+            return serializer.from_json(  # type: ignore[no-any-return]
+                next(self._raw_items),
+                self._model,
+                strict=self._strict,
+            )
+        except serializer.validation_error as exc:
+            raise self._item_error(exc) from None
+        except DataParsingError as exc:
+            raise self._item_error(str(exc)) from None
+        finally:
+            self._index += 1
+
+    def __aiter__(self) -> 'BodyStream[_ItemT]':
+        """
+        Iterate over validated items in async code.
+
+        Request bodies are already received by Django at this point,
+        so we don't switch threads to read them.
+        """
+        return self
+
+    async def __anext__(self) -> _ItemT:
+        """Parse and validate the next item."""
+        try:
+            return next(self)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+    def _item_error(
+        self,
+        error: Exception | str,
+    ) -> RequestSerializationError:
+        return RequestSerializationError([
+            {**detail, 'loc': [self._index, *detail['loc']]}
+            for detail in self._serializer.error_serialize(error)
+        ])
+
+
+def stream_item_type(annotation: Any) -> Any:
+    """
+    Returns item type of streamed return annotations.
+
+    >>> from collections.abc import AsyncIterator, Iterator
+    >>> stream_item_type(Iterator[int])
+    <class 'int'>
+    >>> stream_item_type(AsyncIterator[str])
+    <class 'str'>
+    >>> stream_item_type(list[int])
+    Empty()
+    """
+    if get_origin(annotation) in _STREAM_TYPES:
+        return get_args(annotation)[0]
+    return EmptyObj
+
+
+def accepted_ndjson(
+    serializer: type['BaseSerializer'],
+    accept: str,
+) -> str | None:
+    """
+    Returns newline delimited json content type from *accept* header.
+
+    It must be listed explicitly, with a quality that is not lower
+    than the quality of the regular json content type.
+
+    >>> from django_modern_rest.serialization import BaseSerializer
+    >>> accepted_ndjson(BaseSerializer, 'application/jsonl, */*')
+    'application/jsonl'
+    >>> accepted_ndjson(BaseSerializer, 'application/json') is None
+    True
+    >>> accepted_ndjson(BaseSerializer, 'application/x-ndjson;q=0') is None
+    True
+    """
+    qualities: dict[str, float] = {}
+    for accepted in accept.split(','):
+        media_type = MediaType(accepted)
+        qualities[f'{media_type.main_type}/{media_type.sub_type}'] = (
+            media_type.quality
+        )
+    content_type = max(
+        serializer.ndjson_content_types,
+        key=lambda ndjson_content_type: qualities.get(ndjson_content_type, 0),
+        default=None,
+    )
+    quality = qualities.get(content_type or '', 0)
+    if quality and quality >= qualities.get(serializer.content_type, 0):
+        return content_type
+    return None
+
+
+def build_streaming_response(  # noqa: WPS211
+    serializer: type['BaseSerializer'],
+    *,
+    stream: Iterable[Any] | AsyncIterable[Any],
+    item_type: Any,
+    status_code: HTTPStatus,
+    headers: ResponseHeaders | None = None,
+    cookies: SimpleCookie | None = None,
+    validate_item: Callable[[Any], None] | None = None,
+    ndjson_content_type: str | None = None,
+) -> StreamingHttpResponse:
+    """
+    Returns :class:`django.http.StreamingHttpResponse` with encoded *stream*.
+
+    Items of *stream* are encoded one by one as a json array
+    or as newline delimited json, when *ndjson_content_type* is passed.
+    Encoded items are buffered and sent in chunks,
+    so we don't do a write for each small item.
+    *validate_item* is called before encoding each item, if passed.
+
+    Both sync and async iterables are supported.
+    """
+    encoder = _ItemsEncoder(
+        lambda instance: serializer.to_json(instance, item_type),
+        validate_item,
+        ndjson=ndjson_content_type is not None,
+    )
+    response = StreamingHttpResponse(
+        (
+            _aencode_stream(stream, encoder)
+            if isinstance(stream, AsyncIterable)
+            else _encode_stream(stream, encoder)
+        ),
+        status=status_code,
+        headers=headers,
+    )
+    response.headers['Content-Type'] = (
+        ndjson_content_type or serializer.content_type
+    )
+    if cookies:
+        copy_cookies(response, cookies)
+    return response
+
+
+@final
+class _ItemsEncoder:
+    __slots__ = ('_buffer', '_encode', '_is_empty', '_ndjson', '_validate_item')
+
+    def __init__(
+        self,
+        encode: Callable[[Any], bytes],
+        validate_item: Callable[[Any], None] | None,
+        *,
+        ndjson: bool,
+    ) -> None:
+        self._encode = encode
+        self._validate_item = validate_item
+        self._ndjson = ndjson
+        self._is_empty = True
+        self._buffer = bytearray()
+
+    def write(self, instance: Any) -> bytes | None:
+        """Encode *instance*, returns a chunk when enough items are buffered."""
+        if self._validate_item is not None:
+            self._validate_item(instance)
+        buffer = self._buffer
+        if self._ndjson:
+            buffer += self._encode(instance)
+            buffer += _NEWLINE
+        else:
+            buffer += b'[' if self._is_empty else b','
+            buffer += self._encode(instance)
+        self._is_empty = False
+        if len(buffer) < _CHUNK_SIZE:
+            return None
+        chunk = bytes(buffer)
+        buffer.clear()
+        return chunk
+
+    def close(self) -> bytes:
+        """Returns the last chunk."""
+        if not self._ndjson:
+            self._buffer += b'[]' if self._is_empty else b']'
+        return bytes(self._buffer)
+
+
+def _encode_stream(
+    stream: Iterable[Any],
+    encoder: _ItemsEncoder,
+) -> Iterator[bytes]:
+    for instance in stream:
+        chunk = encoder.write(instance)
+        if chunk is not None:
+            yield chunk
+    yield encoder.close()
+
+
+async def _aencode_stream(
+    stream: AsyncIterable[Any],
+    encoder: _ItemsEncoder,
+) -> AsyncIterator[bytes]:
+    async for instance in stream:
+        chunk = encoder.write(instance)
+        if chunk is not None:
+            yield chunk
+    yield encoder.close()
@@ -1,8 +1,12 @@
 import dataclasses
-from collections.abc import Callable
+import types
+from collections.abc import Callable, Sequence, Set
+from functools import lru_cache
 from typing import (
+    Annotated,
     Any,
     Final,
+    Union,
     final,
     get_args,
     get_origin,
@@ -11,6 +15,7 @@ from typing import (
 from typing_extensions import get_original_bases, get_type_hints
 
 from django_modern_rest.exceptions import UnsolvableAnnotationsError
+from django_modern_rest.settings import MAX_CACHE_SIZE
 
 
 @final
@@ -92,7 +97,10 @@ def parse_return_annotation(endpoint_func: Callable[..., Any]) -> Any:
     return return_annotation
 
 
-def is_safe_subclass(annotation: Any, base_class: type[Any]) -> bool:
+def is_safe_subclass(
+    annotation: Any,
+    base_class: type[Any] | tuple[type[Any], ...],
+) -> bool:
     """Possibly unwraps subscribed class before checking for subclassing."""
     if annotation is None:
         annotation = type(None)
@@ -103,3 +111,38 @@ def is_safe_subclass(annotation: Any, base_class: type[Any]) -> bool:
         )
     except TypeError:
         return False
+
+
+def is_sequence_annotation(annotation: Any) -> bool:
+    """
+    Tells whether *annotation* expects multiple values, like ``list[int]``.
+
+    Strings and bytes are not considered to be sequences here.
+    Unions are sequences when at least one of their members is.
+    """
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return is_sequence_annotation(get_args(annotation)[0])
+    if origin in {Union, types.UnionType}:
+        return any(is_sequence_annotation(arg) for arg in get_args(annotation))
+    return is_safe_subclass(annotation, (Sequence, Set)) and not (
+        is_safe_subclass(annotation, (str, bytes, bytearray))
+    )
+
+
+@lru_cache(maxsize=MAX_CACHE_SIZE)
+def contains_subclass(annotation: Any, base_class: type[Any]) -> bool:
+    """
+    Tells whether *annotation* or any of its type args is a *base_class*.
+
+    For example, ``list[Model]`` and ``dict[str, Model | None]``
+    both contain ``Model`` type.
+    """
+    type_args = get_args(annotation)
+    if get_origin(annotation) is Annotated:
+        # Metadata of `Annotated` is not a type:
+        type_args = type_args[:1]
+    return is_safe_subclass(annotation, base_class) or any(
+        contains_subclass(type_arg, base_class)  # type: ignore[arg-type]
+        for type_arg in type_args
+    )
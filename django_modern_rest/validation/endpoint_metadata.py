@@ -1,6 +1,6 @@
 import dataclasses
 import inspect
-from collections.abc import Callable, Set
+from collections.abc import AsyncIterator, Callable, Mapping, Set
 from http import HTTPMethod, HTTPStatus
 from types import NoneType
 from typing import (
@@ -12,8 +12,9 @@ from typing import (
     cast,
 )
 
-from django.http import HttpResponse
+from django.http.response import HttpResponseBase
 
+from django_modern_rest.cookies import NewCookie
 from django_modern_rest.exceptions import (
     EndpointMetadataError,
 )
@@ -33,7 +34,10 @@ from django_modern_rest.settings import (
     Settings,
     resolve_setting,
 )
+from django_modern_rest.sse import EVENT_STREAM_CONTENT_TYPE, ServerSentEvent
+from django_modern_rest.streaming import stream_item_type
 from django_modern_rest.types import (
+    EmptyObj,
     is_safe_subclass,
     parse_return_annotation,
 )
@@ -184,6 +188,38 @@ def _is_check_enabled(
     return setting not in resolve_setting(Settings.no_validate_http_spec)
 
 
+def _validate_sample_rates(
+    payload_value: float | None,
+    blueprint_cls: type['Blueprint[BaseSerializer]'] | None,
+    controller_cls: type['Controller[BaseSerializer]'],
+    *,
+    endpoint: str,
+) -> None:
+    sample_rates = {
+        'endpoint': payload_value,
+        'blueprint': getattr(
+            blueprint_cls,
+            'validate_responses_sample_rate',
+            None,
+        ),
+        'controller': controller_cls.validate_responses_sample_rate,
+        'settings': resolve_setting(Settings.validate_responses_sample_rate),
+    }
+    for source, sample_rate in sample_rates.items():
+        if sample_rate is None:
+            continue
+        is_number = isinstance(sample_rate, int | float) and not isinstance(
+            sample_rate,
+            bool,
+        )
+        if not is_number or not 0 <= sample_rate <= 1:
+            raise EndpointMetadataError(
+                f'{endpoint!r} has invalid {source} '
+                f'`validate_responses_sample_rate`: {sample_rate!r}, '
+                'it must be a number from 0 to 1',
+            )
+
+
 @dataclasses.dataclass(slots=True, frozen=True, kw_only=True)
 class EndpointMetadataValidator:  # noqa: WPS214
     """
@@ -211,7 +247,7 @@ class EndpointMetadataValidator:  # noqa: WPS214
         return_annotation = parse_return_annotation(func)
         if self.payload is None and is_safe_subclass(
             return_annotation,
-            HttpResponse,
+            HttpResponseBase,
         ):
             object.__setattr__(
                 self,
@@ -228,6 +264,12 @@ class EndpointMetadataValidator:  # noqa: WPS214
         )
         func.__name__ = method  # we can change it :)
         endpoint = str(func)
+        _validate_sample_rates(
+            getattr(self.payload, 'validate_responses_sample_rate', None),
+            blueprint_cls,
+            controller_cls,
+            endpoint=endpoint,
+        )
         if isinstance(self.payload, ValidateEndpointPayload):
             return self._from_validate(
                 self.payload,
@@ -314,6 +356,9 @@ class EndpointMetadataValidator:  # noqa: WPS214
             responses=responses,
             method=method,
             validate_responses=payload.validate_responses,
+            validate_responses_sample_rate=(
+                payload.validate_responses_sample_rate
+            ),
             modification=None,
             error_handler=payload.error_handler,
             component_parsers=(
@@ -349,8 +394,9 @@ class EndpointMetadataValidator:  # noqa: WPS214
             controller_cls=controller_cls,
         )
         self._validate_new_headers(payload, endpoint=endpoint)
-        modification = ResponseModification(
-            return_type=return_annotation,
+        modification = self._build_modification(
+            return_annotation,
+            endpoint=endpoint,
             headers=payload.headers,
             cookies=payload.cookies,
             status_code=(
@@ -378,6 +424,9 @@ class EndpointMetadataValidator:  # noqa: WPS214
         return EndpointMetadata(
             responses=responses,
             validate_responses=payload.validate_responses,
+            validate_responses_sample_rate=(
+                payload.validate_responses_sample_rate
+            ),
             method=method,
             modification=modification,
             error_handler=payload.error_handler,
@@ -410,10 +459,10 @@ class EndpointMetadataValidator:  # noqa: WPS214
             blueprint_cls=blueprint_cls,
             controller_cls=controller_cls,
         )
-        status_code = infer_status_code(method)
-        modification = ResponseModification(
-            return_type=return_annotation,
-            status_code=status_code,
+        modification = self._build_modification(
+            return_annotation,
+            endpoint=endpoint,
+            status_code=infer_status_code(method),
             headers=None,
             cookies=None,
         )
@@ -440,6 +489,46 @@ class EndpointMetadataValidator:  # noqa: WPS214
             ),
         )
 
+    def _build_modification(
+        self,
+        return_annotation: Any,
+        *,
+        endpoint: str,
+        status_code: HTTPStatus,
+        headers: Mapping[str, NewHeader] | None,
+        cookies: Mapping[str, NewCookie] | None,
+    ) -> ResponseModification:
+        item_type = stream_item_type(return_annotation)
+        if is_safe_subclass(item_type, ServerSentEvent) and not (
+            is_safe_subclass(return_annotation, AsyncIterator)
+        ):
+            raise EndpointMetadataError(
+                f'{endpoint!r} returns server-sent events, '
+                'it must return `AsyncIterator`, '
+                'because events are produced for a long time',
+            )
+        if item_type is EmptyObj:
+            return ResponseModification(
+                return_type=return_annotation,
+                status_code=status_code,
+                headers=headers,
+                cookies=cookies,
+            )
+        # Streamed items are described as a regular json array,
+        # unless they are sent as server-sent events:
+        return ResponseModification(
+            return_type=list[item_type],  # type: ignore[valid-type]
+            status_code=status_code,
+            headers=headers,
+            cookies=cookies,
+            streaming=True,
+            media_type=(
+                EVENT_STREAM_CONTENT_TYPE
+                if is_safe_subclass(item_type, ServerSentEvent)
+                else None
+            ),
+        )
+
     def _validate_new_headers(
         self,
         payload: ModifyEndpointPayload,
@@ -465,7 +554,7 @@ class EndpointMetadataValidator:  # noqa: WPS214
         blueprint_cls: type['Blueprint[BaseSerializer]'] | None,
         controller_cls: type['Controller[BaseSerializer]'],
     ) -> None:
-        if is_safe_subclass(return_annotation, HttpResponse):
+        if is_safe_subclass(return_annotation, HttpResponseBase):
             if isinstance(self.payload, ModifyEndpointPayload):
                 raise EndpointMetadataError(
                     f'{endpoint!r} returns HttpResponse '
@@ -489,12 +578,32 @@ class EndpointMetadataValidator:  # noqa: WPS214
             # we will check them in runtime if they are correct or not.
             return
 
+        self._validate_stream(
+            return_annotation,
+            endpoint=endpoint,
+            serializer=(blueprint_cls or controller_cls).serializer,
+        )
         if isinstance(self.payload, ValidateEndpointPayload):
             raise EndpointMetadataError(
                 f'{endpoint!r} returns raw data, '
                 'it requires `@modify` decorator instead of `@validate`',
             )
 
+    def _validate_stream(
+        self,
+        return_annotation: Any,
+        *,
+        endpoint: str,
+        serializer: type[BaseSerializer],
+    ) -> None:
+        if not serializer.supports_streaming and (
+            stream_item_type(return_annotation) is not EmptyObj
+        ):
+            raise EndpointMetadataError(
+                f'{endpoint!r} returns a stream, '
+                f'but {serializer!r} does not support streaming',
+            )
+
     def _validate_error_handler(
         self,
         payload: ValidateEndpointPayload | ModifyEndpointPayload,
@@ -34,6 +34,7 @@ class _BasePayload:
 
     # Common fields:
     validate_responses: bool | None = None
+    validate_responses_sample_rate: float | None = None
     error_handler: SyncErrorHandlerT | AsyncErrorHandlerT | None = None
     allow_custom_http_methods: bool = False
     no_validate_http_spec: Set[HttpSpec] | None = None
@@ -1,64 +1,108 @@
 import dataclasses
-from collections.abc import Mapping, Set
-from functools import lru_cache
+import functools
+import logging
+import random
+from collections.abc import Callable, Set
 from http import HTTPStatus
+from http.cookies import SimpleCookie
 from typing import (
     TYPE_CHECKING,
     Any,
     ClassVar,
+    Final,
     TypeVar,
     final,
+    get_args,
 )
 
 from django.http import HttpResponse
+from django.http.response import HttpResponseBase, ResponseHeaders
 
-from django_modern_rest.cookies import NewCookie
+from django_modern_rest.cookies import render_cookies
 from django_modern_rest.exceptions import ResponseSerializationError
+from django_modern_rest.files import FILE_RESPONSE_HEADERS
 from django_modern_rest.headers import build_headers
 from django_modern_rest.metadata import EndpointMetadata
 from django_modern_rest.response import ResponseSpec
 from django_modern_rest.serialization import BaseSerializer
 from django_modern_rest.settings import (
-    MAX_CACHE_SIZE,
     Settings,
     resolve_setting,
 )
+from django_modern_rest.sse import ServerSentEvent, event_data_type
+from django_modern_rest.types import EmptyObj
 
 if TYPE_CHECKING:
     from django_modern_rest.controller import Controller
 
-_ResponseT = TypeVar('_ResponseT', bound=HttpResponse)
+_ResponseT = TypeVar('_ResponseT', bound=HttpResponseBase)
+
+_logger: Final = logging.getLogger(__name__)
 
 
 @dataclasses.dataclass(frozen=True, slots=True)
-class ResponseValidator:
+class ResponseValidator:  # noqa: WPS214
     """
     Response validator.
 
     Can validate responses that return raw data as well as real ``HttpResponse``
     that are returned from endpoints.
+
+    *validate_responses* and *validate_responses_sample_rate*
+    are already resolved for the endpoint, its blueprint, and controller.
+    ``None`` means that the default value from settings is used.
     """
 
     # Public API:
     metadata: 'EndpointMetadata'
     serializer: type[BaseSerializer]
+    validate_responses: bool | None = None
+    validate_responses_sample_rate: float | None = None
     strict_validation: ClassVar[bool] = True
 
+    # Protected API:
+    _headers: ResponseHeaders | None = dataclasses.field(init=False)
+    _cookies: SimpleCookie | None = dataclasses.field(init=False)
+
+    def __post_init__(self) -> None:
+        """Pre-build static headers and cookies of raw data endpoints."""
+        modification = self.metadata.modification
+        object.__setattr__(
+            self,
+            '_headers',
+            None
+            if modification is None
+            else build_headers(modification, self.serializer),
+        )
+        object.__setattr__(
+            self,
+            '_cookies',
+            None
+            if modification is None or not modification.cookies
+            else render_cookies(modification.cookies),
+        )
+
     def validate_response(
         self,
         controller: 'Controller[BaseSerializer]',
         response: _ResponseT,
     ) -> _ResponseT:
-        """Validate ``.content`` of existing ``HttpResponse`` object."""
-        if not _is_validation_enabled(
+        """
+        Validate ``.content`` of existing ``HttpResponse`` object.
+
+        Content of streaming responses is not validated,
+        because it can only be consumed once.
+        """
+        self._validate_sampled(
             controller,
-            metadata_validate_responses=self.metadata.validate_responses,
-        ):
-            return response
-        schema = self._get_response_schema(response.status_code)
-        self._validate_body(response.content, schema, response=response)
-        self._validate_response_headers(response, schema)
-        self._validate_response_cookies(response, schema)
+            response.status_code,
+            (
+                response.content
+                if isinstance(response, HttpResponse)
+                else EmptyObj
+            ),
+            response=response,
+        )
         return response
 
     def validate_modification(
@@ -75,24 +119,153 @@ class ResponseValidator:
                 'without associated `@modify` usage.',
             )
 
+        if self.metadata.modification.streaming:
+            return self._validate_stream(controller, structured)
+
         all_response_data = _ValidationContext(
             raw_data=structured,
             status_code=self.metadata.modification.status_code,
-            headers=build_headers(
-                self.metadata.modification,
-                self.serializer,
-            ),
-            cookies=self.metadata.modification.cookies,
+            return_type=self.metadata.modification.return_type,
+            headers=self._headers,
+            cookies=self._cookies,
         )
-        if not _is_validation_enabled(
+        self._validate_sampled(
             controller,
-            metadata_validate_responses=self.metadata.validate_responses,
-        ):
-            return all_response_data
-        schema = self._get_response_schema(all_response_data.status_code)
-        self._validate_body(structured, schema)
+            all_response_data.status_code,
+            structured,
+        )
         return all_response_data
 
+    def _validate_stream(
+        self,
+        controller: 'Controller[BaseSerializer]',
+        stream: Any,
+    ) -> '_ValidationContext':
+        """
+        Validate streamed items lazily, when they are encoded.
+
+        We can't validate them here, because they are not produced yet.
+        """
+        modification = self.metadata.modification
+        assert modification is not None  # noqa: S101
+        item_type = get_args(modification.return_type)[0]
+        sample_rate = self._sample_rate()
+        return _ValidationContext(
+            raw_data=stream,
+            status_code=modification.status_code,
+            return_type=item_type,
+            headers=self._headers,
+            cookies=self._cookies,
+            streaming=True,
+            validate_item=(
+                None
+                if sample_rate < 1 and random.random() >= sample_rate  # noqa: S311
+                else functools.partial(
+                    self._validate_item,
+                    controller,
+                    item_type,
+                    sample_rate,
+                )
+            ),
+        )
+
+    def _validate_item(
+        self,
+        controller: 'Controller[BaseSerializer]',
+        item_type: Any,
+        sample_rate: float,
+        instance: Any,
+    ) -> None:
+        """
+        Validate a single streamed item.
+
+        The response is already started, so errors abort it.
+        """
+        if isinstance(instance, ServerSentEvent):
+            # Events are not validated by serializers, only their payloads:
+            instance = instance.data
+            item_type = event_data_type(item_type)
+        try:
+            self.serializer.from_python(
+                instance,
+                item_type,
+                strict=self.strict_validation,
+            )
+        except self.serializer.validation_error as exc:
+            self._report_error(
+                controller,
+                ResponseSerializationError(
+                    self.serializer.error_serialize(exc),
+                ),
+                sample_rate,
+            )
+
+    def _validate_sampled(
+        self,
+        controller: 'Controller[BaseSerializer]',
+        status_code: HTTPStatus | int,
+        structured: Any,
+        *,
+        response: HttpResponseBase | None = None,
+    ) -> None:
+        """
+        Validates a sample of responses.
+
+        When sample rate is less than ``1.0``, errors are only logged,
+        so schema drift can be detected without breaking any responses.
+        """
+        sample_rate = self._sample_rate()
+        if sample_rate < 1 and random.random() >= sample_rate:  # noqa: S311
+            return
+        try:
+            self._validate_schema(status_code, structured, response=response)
+        except ResponseSerializationError as exc:
+            self._report_error(controller, exc, sample_rate)
+
+    def _report_error(
+        self,
+        controller: 'Controller[BaseSerializer]',
+        exc: ResponseSerializationError,
+        sample_rate: float,
+    ) -> None:
+        if sample_rate >= 1:
+            raise exc
+        _logger.warning(
+            'Response of %s in %s does not match its schema: %s',
+            type(controller).__qualname__,
+            self.metadata.method,
+            exc.args[0],
+        )
+
+    def _sample_rate(self) -> float:
+        """Returns ``0.0`` when response validation is disabled."""
+        validate_responses = self.validate_responses
+        if validate_responses is None:
+            validate_responses = resolve_setting(Settings.validate_responses)
+        if not validate_responses:
+            return 0
+        if self.validate_responses_sample_rate is not None:
+            return self.validate_responses_sample_rate
+        return resolve_setting(  # type: ignore[no-any-return]
+            Settings.validate_responses_sample_rate,
+        )
+
+    def _validate_schema(
+        self,
+        status_code: HTTPStatus | int,
+        structured: Any,
+        *,
+        response: HttpResponseBase | None,
+    ) -> None:
+        schema = self._get_response_schema(status_code)
+        if schema.media_type is None and (
+            response is None or isinstance(response, HttpResponse)
+        ):
+            self._validate_body(structured, schema, response=response)
+        if response is not None:
+            self._validate_response_headers(response, schema)
+            self._validate_response_cookies(response, schema)
+
     def _get_response_schema(
         self,
         status_code: HTTPStatus | int,
@@ -128,6 +301,8 @@ class ResponseValidator:
 
         """
         if response:
+            if self._validate_raw_data(response, schema):
+                return
             structured = self.serializer.deserialize(structured)
 
         try:
@@ -141,10 +316,38 @@ class ResponseValidator:
                 self.serializer.error_serialize(exc),
             ) from None
 
-    def _validate_response_headers(
+    def _validate_raw_data(
         self,
         response: HttpResponse,
         schema: ResponseSpec,
+    ) -> bool:
+        """
+        Validates python data that was used to build the *response*.
+
+        Responses built with :func:`~django_modern_rest.response.build_response`
+        keep their raw data, so we don't have to parse our own json again.
+        Returns ``False`` when there's no raw data or it is not valid,
+        then the actual content must be validated.
+        """
+        raw_data = getattr(response, '__raw_data__', None)
+        if raw_data is None:
+            return False
+        try:
+            self.serializer.from_python(
+                raw_data[0],
+                schema.return_type,
+                strict=self.strict_validation,
+            )
+        except self.serializer.validation_error:
+            # Python objects can differ from their json representation,
+            # for example, tuples are dumped as json arrays:
+            return False
+        return True
+
+    def _validate_response_headers(
+        self,
+        response: HttpResponseBase,
+        schema: ResponseSpec,
     ) -> None:
         """Validates response headers against provided metadata."""
         if schema.headers is None:
@@ -165,8 +368,11 @@ class ResponseValidator:
         extra_response_headers = (
             response.headers.keys()
             - metadata_headers
-            - {'Content-Type'}  # it is added automatically
+            # These are added automatically:
+            - {'Content-Type', 'Content-Length'}
         )
+        if schema.media_type is not None:
+            extra_response_headers -= FILE_RESPONSE_HEADERS
         if extra_response_headers:
             raise ResponseSerializationError(
                 'Response has extra undescribed '
@@ -175,7 +381,7 @@ class ResponseValidator:
 
     def _validate_response_cookies(  # noqa: WPS210
         self,
-        response: HttpResponse,
+        response: HttpResponseBase,
         schema: ResponseSpec,
     ) -> None:
         """Validates response cookies against provided metadata."""
@@ -212,36 +418,6 @@ class ResponseValidator:
                 )
 
 
-@lru_cache(maxsize=MAX_CACHE_SIZE)
-def _is_validation_enabled(
-    controller: 'Controller[BaseSerializer]',
-    *,
-    metadata_validate_responses: bool | None,
-) -> bool:
-    """
-    Should we run response validation?
-
-    Priority:
-    - We first return any directly specified *validate_responses*
-        argument to endpoint itself
-    - Second is *validate_responses* on the blueprint, if it exists
-    - Then we return *validate_responses* from controller if specified
-    - Lastly we return the default value from settings
-    """
-    if metadata_validate_responses is not None:
-        return metadata_validate_responses
-    if (
-        controller.blueprint
-        and controller.blueprint.validate_responses is not None
-    ):
-        return controller.blueprint.validate_responses
-    if controller.validate_responses is not None:
-        return controller.validate_responses
-    return resolve_setting(  # type: ignore[no-any-return]
-        Settings.validate_responses,
-    )
-
-
 @final
 @dataclasses.dataclass(slots=True, frozen=True, kw_only=True)
 class _ValidationContext:
@@ -249,5 +425,9 @@ class _ValidationContext:
 
     raw_data: Any  # not empty
     status_code: HTTPStatus
-    headers: dict[str, str]
-    cookies: Mapping[str, NewCookie] | None
+    return_type: Any
+    headers: ResponseHeaders | None
+    cookies: SimpleCookie | None
+    # Streaming responses have their item type as *return_type*:
+    streaming: bool = False
+    validate_item: Callable[[Any], None] | None = None
@@ -0,0 +1,36 @@
+from http import HTTPStatus
+from pathlib import Path
+from typing import Final, final
+
+from django.http.response import HttpResponseBase
+
+from django_modern_rest import Controller, ResponseSpec, validate
+from django_modern_rest.files import build_file_response
+from django_modern_rest.plugins.pydantic import PydanticSerializer
+
+_REPORTS: Final = Path('/srv/reports')
+_PDF: Final = 'application/pdf'
+
+
+@final
+class ReportController(Controller[PydanticSerializer]):
+    @validate(
+        ResponseSpec(bytes, status_code=HTTPStatus.OK, media_type=_PDF),
+        ResponseSpec(
+            bytes,
+            status_code=HTTPStatus.PARTIAL_CONTENT,
+            media_type=_PDF,
+        ),
+        ResponseSpec(
+            None,
+            status_code=HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE,
+            media_type=_PDF,
+        ),
+    )
+    def get(self) -> HttpResponseBase:
+        # Reports are sent in chunks and are never fully stored in memory:
+        return build_file_response(
+            self.request,
+            _REPORTS / 'annual.pdf',
+            as_attachment=True,
+        )
@@ -0,0 +1,22 @@
+from collections.abc import AsyncIterator
+from typing import final
+
+import pydantic
+
+from django_modern_rest import Controller
+from django_modern_rest.plugins.pydantic import PydanticSerializer
+
+
+class UserModel(pydantic.BaseModel):
+    email: str
+
+
+@final
+class UserController(Controller[PydanticSerializer]):
+    async def get(self) -> AsyncIterator[UserModel]:
+        # Users are sent to the client while they are produced:
+        for index in range(3):
+            yield UserModel(email=f'user{index}@wms.org')
+
+
+# run: {"controller": "UserController", "method": "get", "url": "/api/users/", "curl_args": ["-H", "Accept: application/x-ndjson"]}  # noqa: ERA001, E501
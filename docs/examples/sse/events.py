@@ -0,0 +1,25 @@
+from collections.abc import AsyncIterator
+from typing import final
+
+import pydantic
+
+from django_modern_rest import Controller, ServerSentEvent
+from django_modern_rest.plugins.pydantic import PydanticSerializer
+
+
+class PriceModel(pydantic.BaseModel):
+    price: int
+
+
+@final
+class PriceController(Controller[PydanticSerializer]):
+    async def get(self) -> AsyncIterator[ServerSentEvent[PriceModel]]:
+        for price in range(3):
+            yield ServerSentEvent(
+                PriceModel(price=price),
+                event='price',
+                id=str(price),
+            )
+
+
+# run: {"controller": "PriceController", "method": "get", "url": "/api/prices/"}  # noqa: ERA001, E501
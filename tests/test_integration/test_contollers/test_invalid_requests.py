@@ -32,11 +32,7 @@ def test_parse_headers_error(dmr_client: DMRClient, *, url: str) -> None:
                 'type': 'missing',
                 'loc': ['parsed_headers', 'X-API-Token'],
                 'msg': 'Field required',
-                'input': {
-                    'Cookie': '',
-                    'Content-Length': '2',
-                    'Content-Type': 'application/xml',
-                },
+                'input': {},
             },
         ],
     })
@@ -70,12 +66,7 @@ async def test_parse_headers_error_async(
                 'type': 'missing',
                 'loc': ['parsed_headers', 'X-API-Token'],
                 'msg': 'Field required',
-                'input': {
-                    'Host': 'testserver',
-                    'Content-Length': '2',
-                    'Content-Type': 'application/xml',
-                    'Cookie': '',
-                },
+                'input': {},
             },
         ],
     })
@@ -0,0 +1,103 @@
+import tempfile
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from django.conf import LazySettings
+from django.core.exceptions import RequestAborted
+
+from django_modern_rest.asgi import ASGIHandler, get_asgi_application
+from django_modern_rest.settings import Settings, clear_settings_cache
+
+
+def _receive(*messages: dict[str, Any]) -> Any:
+    received = list(messages)
+
+    async def factory() -> dict[str, Any]:  # noqa: RUF029
+        return received.pop(0)
+
+    return factory
+
+
+@pytest.fixture
+def _small_body_size(settings: LazySettings) -> Iterator[None]:
+    clear_settings_cache()
+    settings.DMR_SETTINGS = {Settings.max_memory_body_size: 3}
+    yield
+
+    clear_settings_cache()
+
+
+@pytest.mark.asyncio
+async def test_body_is_not_copied() -> None:
+    """Ensures that single chunk bodies are used as is."""
+    body = b'{"key": "value"}'
+    body_file = await ASGIHandler().read_body(
+        _receive({'type': 'http.request', 'body': body}),
+    )
+
+    request, _ = ASGIHandler().create_request(
+        {
+            'type': 'http',
+            'method': 'POST',
+            'path': '/whatever/',
+            'headers': [(b'content-length', str(len(body)).encode())],
+        },
+        body_file,
+    )
+
+    assert request is not None
+    assert request.body is body
+
+
+@pytest.mark.asyncio
+async def test_body_chunks_are_joined() -> None:
+    """Ensures that body chunks are joined."""
+    body_file = await ASGIHandler().read_body(
+        _receive(
+            {'type': 'http.request', 'body': b'ab', 'more_body': True},
+            {'type': 'http.request', 'more_body': True},
+            {'type': 'http.request', 'body': b'cd'},
+        ),
+    )
+
+    assert body_file.read() == b'abcd'
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures('_small_body_size')
+async def test_big_body_is_spooled() -> None:
+    """Ensures that big bodies are handled by Django."""
+    body_file = await ASGIHandler().read_body(
+        _receive(
+            {'type': 'http.request', 'body': b'ab', 'more_body': True},
+            {'type': 'http.request', 'body': b'cd', 'more_body': True},
+            {'type': 'http.request', 'body': b'ef'},
+        ),
+    )
+
+    with body_file:
+        assert isinstance(body_file, tempfile.SpooledTemporaryFile)
+        assert body_file.read() == b'abcdef'
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'messages',
+    [
+        [{'type': 'http.disconnect'}],
+        [
+            {'type': 'http.request', 'body': b'ab', 'more_body': True},
+            {'type': 'http.disconnect'},
+        ],
+    ],
+)
+async def test_client_disconnect(messages: list[dict[str, Any]]) -> None:
+    """Ensures that early client disconnects abort requests."""
+    with pytest.raises(RequestAborted):
+        await ASGIHandler().read_body(_receive(*messages))
+
+
+def test_get_asgi_application() -> None:
+    """Ensures that our handler is returned."""
+    assert isinstance(get_asgi_application(), ASGIHandler)
@@ -85,3 +85,22 @@ def test_cookie_parsing_error(
             },
         ],
     })
+
+
+def test_cookie_parsing_from_meta(rf: RequestFactory) -> None:
+    """Ensures that only declared cookies are parsed from the header."""
+    request = rf.post(
+        '/whatever/',
+        headers={
+            'Cookie': (
+                r'csrftoken=abc; session_id="a\054b"; flag; user_id = 1; =x'
+            ),
+        },
+    )
+
+    response = _WrongPydanticBodyController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.CREATED, response.content
+    assert json.loads(response.content) == {'session_id': 'a,b', 'user_id': 1}
+    assert 'COOKIES' not in request.__dict__
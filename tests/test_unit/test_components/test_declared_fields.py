@@ -0,0 +1,151 @@
+import json
+from http import HTTPStatus
+from types import MappingProxyType
+from typing import Any, Final, NotRequired
+
+import msgspec
+import pydantic
+import pytest
+from django.http import HttpResponse
+from typing_extensions import TypedDict
+
+from django_modern_rest import Body, Controller, Cookies, Headers, Query
+from django_modern_rest.plugins.msgspec import MsgspecSerializer
+from django_modern_rest.plugins.pydantic import PydanticSerializer
+from django_modern_rest.serialization import BaseSerializer
+from django_modern_rest.test import DMRRequestFactory
+
+
+class _PydanticHeaders(pydantic.BaseModel):
+    token: str = pydantic.Field(alias='X-Token')
+
+
+class _PydanticQuery(pydantic.BaseModel):
+    page: int
+    tags: list[str] = []
+
+
+class _MsgspecHeaders(msgspec.Struct, rename={'token': 'X-Token'}):
+    token: str
+
+
+class _MsgspecQuery(TypedDict):
+    page: list[int]
+    tags: NotRequired[list[str]]
+
+
+class _Cookies(TypedDict):
+    session: str
+
+
+class _Body(TypedDict):
+    age: int
+
+
+_MODELS: Final = MappingProxyType({
+    PydanticSerializer: (_PydanticHeaders, _PydanticQuery),
+    MsgspecSerializer: (_MsgspecHeaders, _MsgspecQuery),
+})
+
+
+def _build_controller(
+    serializer: type[BaseSerializer],
+) -> type[Controller[BaseSerializer]]:
+    headers_model, query_model = _MODELS[serializer]
+
+    class _AllComponentsController(  # noqa: WPS215
+        Headers[headers_model],  # type: ignore[valid-type]
+        Query[query_model],  # type: ignore[valid-type]
+        Cookies[_Cookies],
+        Body[_Body],
+        Controller[serializer],  # type: ignore[valid-type]
+    ):
+        def post(self) -> dict[str, Any]:
+            return {
+                'headers': self.parsed_headers,
+                'query': self.parsed_query,
+                'cookies': self.parsed_cookies,
+                'body': self.parsed_body,
+            }
+
+    return _AllComponentsController
+
+
+@pytest.mark.parametrize(
+    ('serializer', 'parsed_query'),
+    [
+        (PydanticSerializer, {'page': 1, 'tags': []}),
+        (MsgspecSerializer, {'page': [1]}),
+    ],
+)
+def test_declared_fields_validation(
+    dmr_rf: DMRRequestFactory,
+    *,
+    serializer: type[BaseSerializer],
+    parsed_query: dict[str, Any],
+) -> None:
+    """Ensures that components are validated with declared fields only."""
+    request = dmr_rf.post(
+        '/whatever/?page=1&extra=1',
+        data={'age': 1},
+        headers={'X-Token': 'secret', 'X-Extra': 'extra'},
+    )
+    request.COOKIES.update({'session': 'abc', 'extra': 'cookie'})
+
+    response = _build_controller(serializer).as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.CREATED, response.content
+    assert json.loads(response.content) == {
+        'headers': {'X-Token': 'secret'},
+        'query': parsed_query,
+        'cookies': {'session': 'abc'},
+        'body': {'age': 1},
+    }
+
+
+class _ForbidModel(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(extra='forbid')
+
+    token: str
+
+
+class _AliasChoicesModel(pydantic.BaseModel):
+    token: str = pydantic.Field(
+        validation_alias=pydantic.AliasChoices('token', 'X-Token'),
+    )
+
+
+class _ForbidTypedDict(TypedDict):
+    __pydantic_config__ = pydantic.ConfigDict(extra='forbid')  # type: ignore[misc]
+
+    token: str
+
+
+class _ForbidStruct(msgspec.Struct, forbid_unknown_fields=True):
+    token: str
+
+
+@pytest.mark.parametrize(
+    ('serializer', 'model', 'field_names'),
+    [
+        (PydanticSerializer, _PydanticHeaders, frozenset(('token', 'X-Token'))),
+        (PydanticSerializer, _Cookies, frozenset(('session',))),
+        (PydanticSerializer, _ForbidModel, None),
+        (PydanticSerializer, _AliasChoicesModel, None),
+        (PydanticSerializer, _ForbidTypedDict, None),
+        (PydanticSerializer, dict[str, str], None),
+        (MsgspecSerializer, _MsgspecHeaders, frozenset(('X-Token',))),
+        (MsgspecSerializer, _Cookies, frozenset(('session',))),
+        (MsgspecSerializer, _ForbidStruct, None),
+        (MsgspecSerializer, dict[str, str], None),
+    ],
+)
+def test_serializer_field_names(
+    *,
+    serializer: type[BaseSerializer],
+    model: Any,
+    field_names: frozenset[str] | None,
+) -> None:
+    """Ensures that field names are only returned for known keys."""
+    assert serializer.field_names(model) == field_names
@@ -0,0 +1,143 @@
+import json
+from http import HTTPStatus
+from typing import Any, final
+
+import pydantic
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory
+from inline_snapshot import snapshot
+from typing_extensions import TypedDict
+
+from django_modern_rest import Controller, Headers
+from django_modern_rest.plugins.msgspec import MsgspecSerializer
+from django_modern_rest.plugins.pydantic import PydanticSerializer
+from django_modern_rest.serialization import BaseSerializer
+
+
+@final
+class _HeaderModel(pydantic.BaseModel):
+    token: str = pydantic.Field(alias='X-API-Token')
+    content_type: str = pydantic.Field(alias='content-type')
+
+
+@final
+class _HeadersController(
+    Controller[PydanticSerializer],
+    Headers[_HeaderModel],
+):
+    def post(self) -> _HeaderModel:
+        return self.parsed_headers
+
+
+def test_headers_parsing_from_meta(rf: RequestFactory) -> None:
+    """Ensures that only declared headers are read from ``META``."""
+    request = rf.post(
+        '/whatever/',
+        headers={'X-API-Token': 'secret', 'X-Other': 'other'},
+        content_type='application/json',
+    )
+
+    response = _HeadersController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.CREATED, response.content
+    assert json.loads(response.content) == {
+        'X-API-Token': 'secret',
+        'content-type': 'application/json',
+    }
+    assert 'headers' not in request.__dict__
+
+
+_LookupHeaders = TypedDict(
+    '_LookupHeaders',
+    {'x_api_key': str, 'X-API-TOKEN': str},
+)
+
+
+@pytest.mark.parametrize('serializer', [PydanticSerializer, MsgspecSerializer])
+def test_headers_parsing_like_http_headers(
+    rf: RequestFactory,
+    *,
+    serializer: type[BaseSerializer],
+) -> None:
+    """Ensures that declared headers are looked up like ``request.headers``."""
+
+    class _LookupController(
+        Controller[serializer],  # type: ignore[valid-type]
+        Headers[_LookupHeaders],
+    ):
+        def post(self) -> dict[str, Any]:
+            return self.parsed_headers  # type: ignore[return-value]
+
+    request = rf.post(
+        '/whatever/',
+        headers={'X-Api-Key': 'key', 'X-Api-Token': 'token'},
+    )
+
+    response = _LookupController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.CREATED, response.content
+    assert json.loads(response.content) == {
+        'x_api_key': request.headers['x_api_key'],
+        'X-API-TOKEN': request.headers['X-API-TOKEN'],
+    }
+
+
+@final
+class _ForbidHeaderModel(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(extra='forbid')
+
+    token: str = pydantic.Field(alias='X-API-Token')
+
+
+@final
+class _AllHeadersController(
+    Controller[PydanticSerializer],
+    Headers[_ForbidHeaderModel],
+):
+    def post(self) -> _ForbidHeaderModel:
+        raise NotImplementedError
+
+
+def test_headers_parsing_all_headers(rf: RequestFactory) -> None:
+    """Ensures that all headers are used when names are not known."""
+    request = rf.post('/whatever/', content_type='application/json')
+
+    response = _AllHeadersController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert json.loads(response.content) == snapshot({
+        'detail': [
+            {
+                'type': 'missing',
+                'loc': ['parsed_headers', 'X-API-Token'],
+                'msg': 'Field required',
+                'input': {
+                    'Cookie': '',
+                    'Content-Length': '2',
+                    'Content-Type': 'application/json',
+                },
+            },
+            {
+                'type': 'extra_forbidden',
+                'loc': ['parsed_headers', 'Cookie'],
+                'msg': 'Extra inputs are not permitted',
+                'input': '',
+            },
+            {
+                'type': 'extra_forbidden',
+                'loc': ['parsed_headers', 'Content-Length'],
+                'msg': 'Extra inputs are not permitted',
+                'input': '2',
+            },
+            {
+                'type': 'extra_forbidden',
+                'loc': ['parsed_headers', 'Content-Type'],
+                'msg': 'Extra inputs are not permitted',
+                'input': 'application/json',
+            },
+        ],
+    })
@@ -0,0 +1,246 @@
+import json
+from http import HTTPStatus
+from typing import ClassVar, Final, TypeVar, final
+
+import msgspec
+import pydantic
+import pytest
+from django.http import HttpResponse
+from django.test import AsyncRequestFactory
+from inline_snapshot import snapshot
+
+from django_modern_rest import Body, Controller, StreamingBody
+from django_modern_rest.plugins.msgspec import MsgspecSerializer
+from django_modern_rest.plugins.pydantic import PydanticSerializer
+from django_modern_rest.test import DMRAsyncRequestFactory, DMRRequestFactory
+
+_BODY: Final = b'\n'.join((
+    rb'{"name": "a\n"}',
+    b'',
+    b'  \r',
+    b'{"name": "b"}\r',
+    b'{"name": "c"}',
+))
+_PARSED: Final = ({'name': 'a\n'}, {'name': 'b'}, {'name': 'c'})
+_INVALID_BODY: Final = b'{"name": "a"}\n{"name": 1}\n'
+
+
+@final
+class _PydanticItem(pydantic.BaseModel):
+    name: str
+
+
+@final
+class _MsgspecItem(msgspec.Struct):
+    name: str
+
+
+@final
+class _PydanticController(
+    Body[list[_PydanticItem]],
+    Controller[PydanticSerializer],
+):
+    def post(self) -> list[_PydanticItem]:
+        return self.parsed_body
+
+
+@final
+class _MsgspecController(
+    Body[list[_MsgspecItem]],
+    Controller[MsgspecSerializer],
+):
+    def post(self) -> list[_MsgspecItem]:
+        return self.parsed_body
+
+
+_ItemT = TypeVar('_ItemT')
+
+
+class _SmallChunksBody(StreamingBody[_ItemT]):
+    # Small chunks cut items and line breaks in all possible places:
+    chunk_size: ClassVar[int] = 3
+
+
+@final
+class _PydanticStreamingController(
+    _SmallChunksBody[_PydanticItem],
+    Controller[PydanticSerializer],
+):
+    def post(self) -> list[_PydanticItem]:
+        return list(self.parsed_body)
+
+
+@final
+class _MsgspecStreamingController(
+    _SmallChunksBody[_MsgspecItem],
+    Controller[MsgspecSerializer],
+):
+    async def post(self) -> list[_MsgspecItem]:
+        return [parsed async for parsed in self.parsed_body]
+
+
+_CONTROLLERS: Final = (
+    _PydanticController,
+    _MsgspecController,
+    _PydanticStreamingController,
+)
+
+
+@pytest.mark.parametrize('controller', _CONTROLLERS)
+@pytest.mark.parametrize(
+    'content_type',
+    ['application/x-ndjson', 'application/jsonl'],
+)
+def test_ndjson_body(
+    dmr_rf: DMRRequestFactory,
+    *,
+    controller: type[Controller[PydanticSerializer]],
+    content_type: str,
+) -> None:
+    """Ensures that newline delimited json bodies are parsed line by line."""
+    request = dmr_rf.post('/whatever/', data=_BODY, content_type=content_type)
+
+    response = controller.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.CREATED, response.content
+    assert json.loads(response.content) == list(_PARSED)
+
+
+@pytest.mark.asyncio
+async def test_ndjson_streaming_body_async(
+    dmr_async_rf: DMRAsyncRequestFactory,
+) -> None:
+    """Ensures that newline delimited json is streamed in async code."""
+    # Our factory only takes content types from headers,
+    # but they are duplicated for async requests:
+    request = AsyncRequestFactory().post(
+        '/whatever/',
+        data=_BODY,
+        content_type='application/x-ndjson',
+    )
+
+    response = await dmr_async_rf.wrap(
+        _MsgspecStreamingController.as_view()(request),
+    )
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.CREATED, response.content
+    assert json.loads(response.content) == list(_PARSED)
+
+
+@pytest.mark.parametrize('controller', _CONTROLLERS)
+def test_empty_ndjson_body(
+    dmr_rf: DMRRequestFactory,
+    *,
+    controller: type[Controller[PydanticSerializer]],
+) -> None:
+    """Ensures that empty bodies have no items."""
+    request = dmr_rf.post(
+        '/whatever/',
+        data=b'\n',
+        content_type='application/x-ndjson',
+    )
+
+    response = controller.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.CREATED, response.content
+    assert json.loads(response.content) == []
+
+
+@pytest.mark.parametrize(
+    'controller',
+    [_PydanticController, _PydanticStreamingController],
+)
+def test_ndjson_body_invalid_item(
+    dmr_rf: DMRRequestFactory,
+    *,
+    controller: type[Controller[PydanticSerializer]],
+) -> None:
+    """Ensures that item validation errors have line indexes."""
+    request = dmr_rf.post(
+        '/whatever/',
+        data=_INVALID_BODY,
+        content_type='application/x-ndjson',
+    )
+
+    response = controller.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    error = json.loads(response.content)['detail'][0]
+    assert error['loc'][-2:] == [1, 'name']
+
+
+def test_msgspec_ndjson_body_invalid_item(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that msgspec reports invalid lines."""
+    request = dmr_rf.post(
+        '/whatever/',
+        data=_INVALID_BODY,
+        content_type='application/x-ndjson',
+    )
+
+    response = _MsgspecController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert json.loads(response.content) == snapshot({
+        'detail': [
+            {
+                'type': 'value_error',
+                'loc': [],
+                'msg': 'Expected `str`, got `int` - at `$.parsed_body[1].name`',
+            },
+        ],
+    })
+
+
+@pytest.mark.parametrize('controller', _CONTROLLERS)
+def test_ndjson_body_invalid_json(
+    dmr_rf: DMRRequestFactory,
+    *,
+    controller: type[Controller[PydanticSerializer]],
+) -> None:
+    """Ensures that lines with invalid json are reported."""
+    request = dmr_rf.post(
+        '/whatever/',
+        data=b'{"name": "a"}\n{"name": \n',
+        content_type='application/x-ndjson',
+    )
+
+    response = controller.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.parametrize(
+    'serializer',
+    [PydanticSerializer, MsgspecSerializer],
+)
+def test_ndjson_not_list_model(
+    dmr_rf: DMRRequestFactory,
+    *,
+    serializer: type[PydanticSerializer],
+) -> None:
+    """Ensures that lines are validated as a list for other models."""
+
+    class _TupleController(
+        Body[tuple[int, ...]],
+        Controller[serializer],  # type: ignore[valid-type]
+    ):
+        def post(self) -> list[int]:
+            return list(self.parsed_body)
+
+    request = dmr_rf.post(
+        '/whatever/',
+        data=b'1\n2\n',
+        content_type='application/x-ndjson',
+    )
+
+    response = _TupleController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.CREATED, response.content
+    assert json.loads(response.content) == [1, 2]
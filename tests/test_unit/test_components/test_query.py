@@ -0,0 +1,149 @@
+import json
+from http import HTTPStatus
+from typing import Annotated, Any, NotRequired, final
+
+import msgspec
+import pydantic
+import pytest
+from django.conf import LazySettings
+from django.core.exceptions import TooManyFieldsSent
+from django.http import HttpResponse
+from django.test import RequestFactory
+from typing_extensions import TypedDict
+
+from django_modern_rest import Controller, Query
+from django_modern_rest.plugins.msgspec import MsgspecSerializer
+from django_modern_rest.plugins.pydantic import PydanticSerializer
+from django_modern_rest.serialization import BaseSerializer
+
+
+@final
+class _PydanticQuery(pydantic.BaseModel):
+    per_page: int
+    text: str = pydantic.Field(alias='search')
+    tags: list[str] = []
+    ids: Annotated[tuple[int, ...], pydantic.Field(alias='id')] = ()
+
+
+@final
+class _MsgspecQuery(msgspec.Struct, rename={'text': 'search', 'ids': 'id'}):
+    per_page: int
+    text: str
+    tags: list[str] = msgspec.field(default_factory=list)
+    ids: Annotated[tuple[int, ...], msgspec.Meta(max_length=5)] = ()
+
+
+@final
+class _TypedDictQuery(TypedDict):
+    per_page: int
+    search: str
+    tags: NotRequired[list[str]]
+    id: NotRequired[tuple[int, ...]]
+
+
+def _build_controller(
+    serializer: type[BaseSerializer],
+    model: Any,
+) -> type[Controller[BaseSerializer]]:
+    class QueryController(
+        Query[model],
+        Controller[serializer],  # type: ignore[valid-type]
+    ):
+        def get(self) -> Any:
+            return self.parsed_query
+
+    return QueryController
+
+
+_QUERY_CONTROLLERS = (
+    _build_controller(PydanticSerializer, _PydanticQuery),
+    _build_controller(MsgspecSerializer, _MsgspecQuery),
+    _build_controller(PydanticSerializer, _TypedDictQuery),
+    _build_controller(MsgspecSerializer, _TypedDictQuery),
+)
+
+
+@pytest.mark.parametrize('controller', _QUERY_CONTROLLERS)
+@pytest.mark.parametrize('access_get', [True, False])
+def test_query_parsing_from_schema(
+    rf: RequestFactory,
+    *,
+    controller: type[Controller[BaseSerializer]],
+    access_get: bool,
+) -> None:
+    """Ensures that scalars and sequences are parsed from the schema."""
+    request = rf.get(
+        '/whatever/?per_page=1&per_page=10&search=a+b%21&tags=x&tags=&'
+        'id=1&id=2&other=%ff&unknown',
+    )
+    if access_get:
+        assert request.GET
+
+    response = controller.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+    assert json.loads(response.content) == {
+        'per_page': 10,
+        'search': 'a b!',
+        'tags': ['x', ''],
+        'id': [1, 2],
+    }
+    assert ('GET' in request.__dict__) is access_get
+
+
+@pytest.mark.parametrize('controller', _QUERY_CONTROLLERS)
+@pytest.mark.parametrize(
+    ('query_string', 'search'),
+    [
+        ('per_page=1&search=привет'.encode().decode('iso-8859-1'), 'привет'),
+        ('per_page=1&search=%D0%BF+\xff', 'п ÿ'),
+    ],
+)
+def test_query_parsing_raw_wsgi_string(
+    rf: RequestFactory,
+    *,
+    controller: type[Controller[BaseSerializer]],
+    query_string: str,
+    search: str,
+) -> None:
+    """Ensures that raw non-ascii WSGI query strings are decoded."""
+    request = rf.get('/whatever/', QUERY_STRING=query_string)
+
+    response = controller.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+    assert json.loads(response.content)['search'] == search
+    assert request.GET['search'] == search
+
+
+def test_query_parsing_too_many_fields(
+    rf: RequestFactory,
+    settings: LazySettings,
+) -> None:
+    """Ensures that the default limit of query fields is respected."""
+    settings.DATA_UPLOAD_MAX_NUMBER_FIELDS = 2
+    request = rf.get('/whatever/?per_page=1&search=a&tags=b')
+
+    with pytest.raises(TooManyFieldsSent):
+        _QUERY_CONTROLLERS[0].as_view()(request)
+
+
+@pytest.mark.parametrize(
+    ('serializer', 'model', 'sequence_field_names'),
+    [
+        (PydanticSerializer, _PydanticQuery, frozenset(('tags', 'ids', 'id'))),
+        (MsgspecSerializer, _MsgspecQuery, frozenset(('tags', 'id'))),
+        (MsgspecSerializer, _TypedDictQuery, frozenset(('tags', 'id'))),
+        (MsgspecSerializer, dict[str, list[str]], frozenset()),
+    ],
+)
+def test_sequence_field_names(
+    *,
+    serializer: type[BaseSerializer],
+    model: Any,
+    sequence_field_names: frozenset[str],
+) -> None:
+    """Ensures that sequence fields are found in models."""
+    assert serializer.sequence_field_names(model) == sequence_field_names
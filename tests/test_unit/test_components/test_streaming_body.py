@@ -0,0 +1,237 @@
+import json
+from http import HTTPStatus
+from typing import ClassVar, TypeVar, final
+
+import msgspec
+import pydantic
+import pytest
+from dirty_equals import IsStr
+from django.http import HttpResponse
+from inline_snapshot import snapshot
+
+from django_modern_rest import Controller, StreamingBody
+from django_modern_rest.plugins.msgspec import MsgspecSerializer
+from django_modern_rest.plugins.pydantic import PydanticSerializer
+from django_modern_rest.test import DMRAsyncRequestFactory, DMRRequestFactory
+
+
+@final
+class _PydanticItem(pydantic.BaseModel):
+    name: str
+    tags: list[str]
+
+
+_ItemT = TypeVar('_ItemT')
+
+
+class _SmallChunksBody(StreamingBody[_ItemT]):
+    # Small chunks cut items, strings, and escapes in all possible places:
+    chunk_size: ClassVar[int] = 3
+
+
+@final
+class _PydanticController(
+    _SmallChunksBody[_PydanticItem],
+    Controller[PydanticSerializer],
+):
+    def post(self) -> list[_PydanticItem]:
+        return list(self.parsed_body)
+
+
+@final
+class _MsgspecItem(msgspec.Struct):
+    name: str
+    tags: list[str]
+
+
+@final
+class _MsgspecController(
+    StreamingBody[_MsgspecItem],
+    Controller[MsgspecSerializer],
+):
+    async def post(self) -> list[_MsgspecItem]:
+        return [product async for product in self.parsed_body]
+
+
+_BODY = (
+    rb' [{"name": "a\"]", "tags": ["[", "{"]}, {"name": "\\", "tags": []} ] '
+)
+
+
+@pytest.mark.parametrize(
+    ('body', 'parsed'),
+    [
+        (b'[]', []),
+        (
+            _BODY,
+            [
+                {'name': 'a"]', 'tags': ['[', '{']},
+                {'name': '\\', 'tags': []},
+            ],
+        ),
+    ],
+)
+def test_streaming_body_sync(
+    dmr_rf: DMRRequestFactory,
+    *,
+    body: bytes,
+    parsed: list[object],
+) -> None:
+    """Ensures that items are parsed from the body stream."""
+    request = dmr_rf.post('/whatever/', data=body)
+
+    response = _PydanticController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.CREATED, response.content
+    assert json.loads(response.content) == parsed
+
+
+@pytest.mark.asyncio
+async def test_streaming_body_async(
+    dmr_async_rf: DMRAsyncRequestFactory,
+) -> None:
+    """Ensures that items are parsed from the body stream in async code."""
+    request = dmr_async_rf.post('/whatever/', data=_BODY)
+
+    response = await dmr_async_rf.wrap(_MsgspecController.as_view()(request))
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.CREATED, response.content
+    assert json.loads(response.content) == [
+        {'name': 'a"]', 'tags': ['[', '{']},
+        {'name': '\\', 'tags': []},
+    ]
+
+
+def test_streaming_body_invalid_item(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that item validation errors have item indexes."""
+    request = dmr_rf.post(
+        '/whatever/',
+        data=b'[{"name": "a", "tags": []}, {"name": 1, "tags": []}]',
+    )
+
+    response = _PydanticController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert json.loads(response.content) == snapshot({
+        'detail': [
+            {
+                'type': 'string_type',
+                'loc': [1, 'name'],
+                'msg': 'Input should be a valid string',
+                'input': 1,
+            },
+        ],
+    })
+
+
+@pytest.mark.asyncio
+async def test_streaming_body_invalid_item_async(
+    dmr_async_rf: DMRAsyncRequestFactory,
+) -> None:
+    """Ensures that async item validation errors have item indexes."""
+    request = dmr_async_rf.post(
+        '/whatever/',
+        data=b'[{"name": "a", "tags": []}, {"name": "b"}]',
+    )
+
+    response = await dmr_async_rf.wrap(_MsgspecController.as_view()(request))
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert json.loads(response.content) == snapshot({
+        'detail': [
+            {
+                'type': 'value_error',
+                'loc': [1],
+                'msg': 'Object missing required field `tags`',
+            },
+        ],
+    })
+
+
+@pytest.mark.parametrize(
+    ('body', 'index'),
+    [
+        (b'  ', 0),
+        (b'{}', 0),
+        (b'[1', 0),
+        (b'[{"name": "a", "tags": []}, {', 1),
+        (b'[{"name": "a", "tags": []}}', 0),
+        (b'[{"name": "a", "tags": []}] []', 1),
+        (b'[{"name": "a", "tags": []},]', 1),
+        (b'[{"name": "a", "tags": []}, {"name": "a", "tags": [}]', 1),
+    ],
+)
+def test_streaming_body_invalid_json(
+    dmr_rf: DMRRequestFactory,
+    *,
+    body: bytes,
+    index: int,
+) -> None:
+    """Ensures that invalid json arrays are reported."""
+    request = dmr_rf.post('/whatever/', data=body)
+
+    response = _PydanticController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert json.loads(response.content) == {
+        'detail': [
+            {
+                'type': IsStr,
+                'loc': [index],
+                'msg': IsStr,
+                'input': IsStr,
+                'ctx': {'error': IsStr},
+            },
+        ],
+    }
+
+
+def test_streaming_body_wrong_content_type(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that body stream can't be parsed with wrong content type."""
+    request = dmr_rf.post(
+        '/whatever/',
+        data=b'[]',
+        headers={'Content-Type': 'application/xml'},
+    )
+
+    response = _PydanticController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert json.loads(response.content) == snapshot({
+        'detail': [
+            {
+                'type': 'value_error',
+                'loc': [],
+                'msg': (
+                    'Value error, Cannot parse request body with content type '
+                    "'application/xml', expected 'application/json'"
+                ),
+                'input': '',
+                'ctx': {
+                    'error': (
+                        'Cannot parse request body with content type '
+                        "'application/xml', expected 'application/json'"
+                    ),
+                },
+            },
+        ],
+    })
+
+
+def test_streaming_body_context_data(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that raw body is provided to report errors of others."""
+    request = dmr_rf.post('/whatever/', data=b'[{"name": 1}]')
+    controller = _PydanticController()
+    controller.request = request
+
+    assert StreamingBody.provide_context_data(
+        controller,
+        _PydanticItem,
+        request,
+    ) == [{'name': 1}]
@@ -0,0 +1,63 @@
+import gc
+import weakref
+from collections.abc import Iterator
+from http import HTTPStatus
+from typing import Any, ClassVar, final
+
+import pytest
+from django.http import HttpResponse
+
+from django_modern_rest import Blueprint, Controller
+from django_modern_rest.controller import BlueprintsT
+from django_modern_rest.plugins.pydantic import PydanticSerializer
+from django_modern_rest.test import DMRRequestFactory
+
+_instances: list[weakref.ref[Any]] = []
+
+
+@final
+class _PlainController(Controller[PydanticSerializer]):
+    def get(self) -> int:
+        _instances.append(weakref.ref(self))
+        return 1
+
+
+@final
+class _UserBlueprint(Blueprint[PydanticSerializer]):
+    def get(self) -> int:
+        _instances.append(weakref.ref(self))
+        return 1
+
+
+@final
+class _ComposedController(Controller[PydanticSerializer]):
+    blueprints: ClassVar[BlueprintsT] = [_UserBlueprint]
+
+
+@pytest.fixture
+def _no_gc() -> Iterator[None]:
+    _instances.clear()
+    gc.disable()
+    yield
+    gc.enable()
+
+
+@pytest.mark.usefixtures('_no_gc')
+@pytest.mark.parametrize(
+    'controller',
+    [_PlainController, _ComposedController],
+)
+def test_instances_are_freed(
+    dmr_rf: DMRRequestFactory,
+    *,
+    controller: type[Controller[PydanticSerializer]],
+) -> None:
+    """Ensures that controllers and blueprints have no reference cycles."""
+    request = dmr_rf.get('/whatever/')
+
+    response = controller.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK
+    assert len(_instances) == 1
+    assert _instances[0]() is None
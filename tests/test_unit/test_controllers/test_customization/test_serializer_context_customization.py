@@ -1,8 +1,18 @@
-from typing import ClassVar, final
+import json
+from http import HTTPStatus
+from typing import Any, ClassVar, Generic, TypeVar, final
 
-from django_modern_rest import Controller
+from django.http import HttpRequest, HttpResponse
+from inline_snapshot import snapshot
+from typing_extensions import override
+
+from django_modern_rest import Blueprint, Body, Controller, Query
+from django_modern_rest.components import ComponentParser
 from django_modern_rest.plugins.pydantic import PydanticSerializer
-from django_modern_rest.serialization import SerializerContext
+from django_modern_rest.serialization import BaseSerializer, SerializerContext
+from django_modern_rest.test import DMRRequestFactory
+
+_ModelT = TypeVar('_ModelT')
 
 
 @final
@@ -30,3 +40,125 @@ def test_custom_serializer_context_cls() -> None:
         _CustomSerializerContextController._serializer_context,  # noqa: SLF001
         _SerializerContextSubclass,
     )
+
+
+@final
+class _BindingSerializerContext(SerializerContext):
+    """Customizes one of the steps, so the generic version is used."""
+
+    @override
+    def _bind_parsed(
+        self,
+        blueprint: 'Blueprint[BaseSerializer]',
+        validated: dict[str, Any],
+    ) -> None:
+        validated['parsed_query'] = {'custom': True}
+        super()._bind_parsed(blueprint, validated)
+
+
+@final
+class _CustomBindingController(
+    Query[dict[str, str]],
+    Controller[PydanticSerializer],
+):
+    serializer_context_cls: ClassVar[type[SerializerContext]] = (
+        _BindingSerializerContext
+    )
+
+    def get(self) -> dict[str, bool]:
+        return self.parsed_query  # type: ignore[return-value]
+
+
+def test_customized_serializer_context_steps(dmr_rf: DMRRequestFactory) -> None:
+    """Ensure that customized steps are respected."""
+    response = _CustomBindingController.as_view()(dmr_rf.get('/whatever/'))
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+    assert json.loads(response.content) == {'custom': True}
+
+
+@final
+class _CustomBindingBodyController(
+    Query[dict[str, str]],
+    Body[dict[str, int]],
+    Controller[PydanticSerializer],
+):
+    serializer_context_cls: ClassVar[type[SerializerContext]] = (
+        _BindingSerializerContext
+    )
+
+    def post(self) -> list[Any]:
+        return [self.parsed_query, self.parsed_body]
+
+
+def test_customized_serializer_context_body(dmr_rf: DMRRequestFactory) -> None:
+    """Ensure that components validating their data work with custom steps."""
+    response = _CustomBindingBodyController.as_view()(
+        dmr_rf.post('/whatever/', data={'age': 1}),
+    )
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.CREATED, response.content
+    assert json.loads(response.content) == [{'custom': True}, {'age': 1}]
+
+
+def test_customized_serializer_context_body_error(
+    dmr_rf: DMRRequestFactory,
+) -> None:
+    """Ensure that components validating their data report errors."""
+    response = _CustomBindingBodyController.as_view()(
+        dmr_rf.post('/whatever/', data={'age': 'abc'}),
+    )
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.BAD_REQUEST, response.content
+    assert json.loads(response.content) == snapshot({
+        'detail': [
+            {
+                'type': 'int_parsing',
+                'loc': ['parsed_body', 'age'],
+                'msg': (
+                    'Input should be a valid integer, '
+                    'unable to parse string as an integer'
+                ),
+                'input': 'abc',
+            },
+        ],
+    })
+
+
+class _WeirdNameComponent(ComponentParser, Generic[_ModelT]):
+    context_name: ClassVar[str] = 'parsed-weird-name'
+
+    @override
+    @classmethod
+    def provide_context_data(
+        cls,
+        blueprint: 'Blueprint[BaseSerializer]',
+        model: Any,
+        request: HttpRequest,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        return request.GET.get('weird')
+
+
+@final
+class _WeirdNameController(
+    _WeirdNameComponent[str],
+    Controller[PydanticSerializer],
+):
+    def get(self) -> str:
+        return getattr(self, 'parsed-weird-name')  # type: ignore[no-any-return]
+
+
+def test_component_with_non_identifier_name(dmr_rf: DMRRequestFactory) -> None:
+    """Ensure that component names are not required to be identifiers."""
+    response = _WeirdNameController.as_view()(
+        dmr_rf.get('/whatever/', data={'weird': 'name'}),
+    )
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+    assert json.loads(response.content) == 'name'
@@ -0,0 +1,157 @@
+import json
+from collections.abc import Callable
+from http import HTTPStatus
+from typing import Any, ClassVar, final
+
+import pydantic
+import pytest
+from asgiref.sync import iscoroutinefunction
+from django.http import HttpRequest, HttpResponse
+from inline_snapshot import snapshot
+
+from django_modern_rest import (
+    Blueprint,
+    Body,
+    Controller,
+    ResponseSpec,
+)
+from django_modern_rest.decorators import wrap_middleware
+from django_modern_rest.plugins.pydantic import PydanticSerializer
+from django_modern_rest.routing import compose_blueprints
+from django_modern_rest.test import DMRAsyncRequestFactory, DMRRequestFactory
+
+
+class _UserModel(pydantic.BaseModel):
+    email: str
+
+
+@final
+class _UserController(Controller[PydanticSerializer]):
+    def get(self) -> list[int]:
+        return [self.kwargs['user_id']]
+
+
+@final
+class _AsyncUserController(Controller[PydanticSerializer]):
+    async def get(self) -> list[int]:
+        return [self.kwargs['user_id']]
+
+
+@final
+class _UserCreateBlueprint(
+    Body[_UserModel],
+    Blueprint[PydanticSerializer],
+):
+    def post(self) -> _UserModel:
+        return self.parsed_body
+
+
+@final
+class _UserListBlueprint(Blueprint[PydanticSerializer]):
+    def get(self) -> list[_UserModel]:
+        return []
+
+
+def _add_header(
+    get_response: Callable[[HttpRequest], HttpResponse],
+) -> Callable[[HttpRequest], HttpResponse]:
+    def decorator(request: HttpRequest, *args: Any, **kwargs: Any) -> Any:
+        response = get_response(request, *args, **kwargs)
+        response['X-Middleware'] = 'called'
+        return response
+
+    return decorator
+
+
+@wrap_middleware(
+    _add_header,
+    ResponseSpec(return_type=list[int], status_code=HTTPStatus.OK),
+)
+def _add_header_json(response: HttpResponse) -> HttpResponse:
+    return response
+
+
+@final
+@_add_header_json
+class _WrappedController(Controller[PydanticSerializer]):
+    responses: ClassVar[list[ResponseSpec]] = _add_header_json.responses
+
+    def get(self) -> list[int]:
+        return []
+
+
+def test_fast_view_sync(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that fast view calls sync endpoints."""
+    view = _UserController.as_fast_view()
+
+    response = view(dmr_rf.get('/whatever/'), user_id=1)
+
+    assert not iscoroutinefunction(view)
+    assert view.view_class is _UserController  # type: ignore[attr-defined]
+    assert response.status_code == HTTPStatus.OK, response.content
+    assert json.loads(response.content) == [1]
+
+
+@pytest.mark.asyncio
+async def test_fast_view_async(dmr_async_rf: DMRAsyncRequestFactory) -> None:
+    """Ensures that fast view calls async endpoints."""
+    view = _AsyncUserController.as_fast_view()
+
+    response = await view(dmr_async_rf.get('/whatever/'), user_id=1)  # type: ignore[misc]
+
+    assert iscoroutinefunction(view)
+    assert response.status_code == HTTPStatus.OK, response.content
+    assert json.loads(response.content) == [1]
+
+
+@pytest.mark.asyncio
+async def test_fast_view_async_not_allowed(
+    dmr_async_rf: DMRAsyncRequestFactory,
+) -> None:
+    """Ensures that fast view returns awaitable 405 for async controllers."""
+    view = _AsyncUserController.as_fast_view()
+
+    response = await view(dmr_async_rf.delete('/whatever/'))  # type: ignore[misc]
+
+    assert response.status_code == HTTPStatus.METHOD_NOT_ALLOWED
+
+
+def test_fast_view_blueprints(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that fast view works with blueprints."""
+    view = compose_blueprints(
+        _UserCreateBlueprint,
+        _UserListBlueprint,
+    ).as_fast_view()
+
+    response = view(dmr_rf.post('/whatever/', data={'email': 'a@b.c'}))
+
+    assert response.status_code == HTTPStatus.CREATED, response.content
+    assert json.loads(response.content) == {'email': 'a@b.c'}
+
+    response = view(dmr_rf.get('/whatever/'))
+
+    assert response.status_code == HTTPStatus.OK, response.content
+    assert json.loads(response.content) == []
+
+
+def test_fast_view_not_allowed(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that fast view returns 405 for unknown methods."""
+    view = _UserController.as_fast_view()
+
+    response = view(dmr_rf.put('/whatever/'))
+
+    assert response.status_code == HTTPStatus.METHOD_NOT_ALLOWED
+    assert json.loads(response.content) == snapshot({
+        'detail': "Method 'PUT' is not allowed, allowed: ['GET']",
+    })
+
+
+def test_fast_view_custom_dispatch(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that fast view respects custom `dispatch` methods."""
+    view = _WrappedController.as_fast_view()
+
+    response = view(dmr_rf.get('/whatever/'))
+
+    assert view.csrf_exempt  # type: ignore[attr-defined]
+    assert response.status_code == HTTPStatus.OK, response.content
+    assert response.headers['X-Middleware'] == 'called'
@@ -0,0 +1,74 @@
+import json
+from http import HTTPStatus
+from typing import final
+
+import pytest
+from django.http import HttpResponse
+from typing_extensions import override
+
+from django_modern_rest import Controller
+from django_modern_rest.plugins.pydantic import PydanticSerializer
+from django_modern_rest.response import SerializedResponse, build_response
+from django_modern_rest.test import DMRRequestFactory
+
+
+@final
+class _Controller(Controller[PydanticSerializer]):
+    def get(self) -> str:
+        raise NotImplementedError
+
+    def post(self) -> str:
+        raise NotImplementedError
+
+
+def test_method_not_allowed_is_copied(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that pre-built 405 responses are not shared."""
+    request = dmr_rf.put('/whatever/')
+
+    response = _Controller.as_view()(request)
+    response.headers['X-Modified'] = 'true'
+    response.set_cookie('modified', 'true')
+    response = _Controller.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.METHOD_NOT_ALLOWED
+    assert response.headers == {
+        'Allow': 'GET, POST',
+        'Content-Type': 'application/json',
+        'Content-Length': str(len(response.content)),
+    }
+    assert not response.cookies
+    assert json.loads(response.content) == {
+        'detail': "Method 'PUT' is not allowed, allowed: ['GET', 'POST']",
+    }
+
+
+@final
+class _CustomController(Controller[PydanticSerializer]):
+    def get(self) -> str:
+        raise NotImplementedError
+
+    @override
+    @classmethod
+    def build_method_not_allowed(cls, method: str) -> SerializedResponse:
+        return build_response(
+            cls.serializer,
+            raw_data={'method': method},
+            status_code=HTTPStatus.METHOD_NOT_ALLOWED,
+        )
+
+
+@pytest.mark.parametrize('method', ['DELETE', 'UNKNOWN'])
+def test_custom_method_not_allowed(
+    dmr_rf: DMRRequestFactory,
+    *,
+    method: str,
+) -> None:
+    """Ensures that cached and not cached 405 responses can be customized."""
+    request = dmr_rf.generic(method, '/whatever/')
+
+    response = _CustomController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.METHOD_NOT_ALLOWED
+    assert json.loads(response.content) == {'method': method}
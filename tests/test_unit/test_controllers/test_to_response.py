@@ -127,17 +127,25 @@ def test_to_response_fails_validation(
     [
         (
             HTTPMethod.GET,
-            {'X-Custom': 'value', 'Content-Type': 'application/json'},
+            {
+                'X-Custom': 'value',
+                'Content-Type': 'application/json',
+                'Content-Length': '9',
+            },
             HTTPStatus.ACCEPTED,
         ),
         (
             HTTPMethod.POST,
-            {'X-Custom': 'value', 'Content-Type': 'application/json5'},
+            {
+                'X-Custom': 'value',
+                'Content-Type': 'application/json5',
+                'Content-Length': '9',
+            },
             HTTPStatus.CREATED,
         ),
         (
             HTTPMethod.DELETE,
-            {'Content-Type': 'application/json'},
+            {'Content-Type': 'application/json', 'Content-Length': '9'},
             HTTPStatus.OK,
         ),
     ],
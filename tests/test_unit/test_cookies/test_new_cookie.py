@@ -1,9 +1,12 @@
 import json
 from http import HTTPMethod, HTTPStatus
 from typing import final
+from unittest import mock
 
 import pytest
 from django.http import HttpResponse
+from django.http.response import ResponseHeaders
+from freezegun.api import FrozenDateTimeFactory
 from inline_snapshot import snapshot
 
 from django_modern_rest import (
@@ -45,6 +48,7 @@ def test_add_new_cookies(dmr_rf: DMRRequestFactory) -> None:
     assert response.headers == {
         'Content-Type': 'application/json',
         'X-Session-Id': 'abc',  # header is preserved
+        'Content-Length': str(len(response.content)),
     }
     assert response.cookies.output() == snapshot("""\
 Set-Cookie: session_id=123; Path=/; SameSite=lax\r
@@ -52,6 +56,50 @@ Set-Cookie: user_id=456; HttpOnly; Path=/; SameSite=lax\
 """)
 
 
+@final
+class _CookieMaxAgeController(Controller[PydanticSerializer]):
+    @modify(
+        cookies={
+            'session_id': NewCookie(value='123', max_age=1000),
+            'user_id': NewCookie(value='456', max_age=10, expires=100),
+        },
+    )
+    def get(self) -> list[int]:
+        return [1, 2]
+
+
+@pytest.mark.freeze_time('02-11-2025 10:15:00')
+def test_new_cookies_max_age(
+    dmr_rf: DMRRequestFactory,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Ensures that pre-rendered cookies have relative ``expires``."""
+    request = dmr_rf.get('/whatever/')
+
+    response = _CookieMaxAgeController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+    assert response.cookies.output() == snapshot(
+        'Set-Cookie: session_id=123; expires=Tue, 11 Feb 2025 10:31:40 GMT; '
+        'Max-Age=1000; Path=/; SameSite=lax\r\n'
+        'Set-Cookie: user_id=456; expires=Tue, 11 Feb 2025 10:16:40 GMT; '
+        'Max-Age=10; Path=/; SameSite=lax',
+    )
+
+    freezer.tick(60)
+    response = _CookieMaxAgeController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+    assert response.cookies.output() == snapshot(
+        'Set-Cookie: session_id=123; expires=Tue, 11 Feb 2025 10:32:40 GMT; '
+        'Max-Age=1000; Path=/; SameSite=lax\r\n'
+        'Set-Cookie: user_id=456; expires=Tue, 11 Feb 2025 10:17:40 GMT; '
+        'Max-Age=10; Path=/; SameSite=lax',
+    )
+
+
 @final
 class _CookieValidateController(Controller[PydanticSerializer]):
     @validate(
@@ -105,6 +153,7 @@ def test_validate_correct_cookies(dmr_rf: DMRRequestFactory) -> None:
     assert response.headers == {
         'Content-Type': 'application/json',
         'X-Session-Id': 'abc',  # header is preserved
+        'Content-Length': str(len(response.content)),
     }
     assert response.cookies.output() == snapshot("""\
 Set-Cookie: session_id=123; expires=Tue, 11 Feb 2025 10:31:40 GMT; \
@@ -122,7 +171,10 @@ def test_validate_correct_optional(dmr_rf: DMRRequestFactory) -> None:
     assert isinstance(response, HttpResponse)
     assert response.status_code == HTTPStatus.CREATED, response.content
     assert json.loads(response.content) == [1, 2]
-    assert response.headers == {'Content-Type': 'application/json'}
+    assert response.headers == {
+        'Content-Type': 'application/json',
+        'Content-Length': str(len(response.content)),
+    }
     assert response.cookies.output() == snapshot(
         'Set-Cookie: optional=123; Path=/; SameSite=strict',
     )
@@ -200,3 +252,23 @@ def test_validate_cookies(
         response.content
     )
     assert json.loads(response.content)['detail']
+
+
+def test_new_headers_are_prebuilt(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that new headers are not normalized again for responses."""
+    request = dmr_rf.get('/whatever/')
+
+    with mock.patch.object(
+        ResponseHeaders,
+        '__setitem__',
+        autospec=True,
+        side_effect=ResponseHeaders.__setitem__,
+    ) as set_header:
+        response = _CookieModifyController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+    assert response.headers['X-Session-Id'] == 'abc'
+    assert 'X-Session-Id' not in {
+        call.args[1] for call in set_header.call_args_list
+    }
@@ -47,5 +47,6 @@ def test_solvable_response_annotations() -> None:
     endpoint = MyController.api_endpoints['GET']
     assert str(endpoint.response_validator.metadata.responses) == snapshot(
         '{<HTTPStatus.OK: 200>: ResponseSpec(return_type=list[int], '
-        'status_code=<HTTPStatus.OK: 200>, headers=None, cookies=None)}',
+        'status_code=<HTTPStatus.OK: 200>, headers=None, cookies=None, '
+        'media_type=None)}',
     )
@@ -39,7 +39,10 @@ def test_modify_status_code(rf: RequestFactory) -> None:
 
     assert isinstance(response, HttpResponse)
     assert response.status_code == HTTPStatus.ACCEPTED
-    assert response.headers == {'Content-Type': 'application/json'}
+    assert response.headers == {
+        'Content-Type': 'application/json',
+        'Content-Length': str(len(response.content)),
+    }
     assert json.loads(response.content) == {'result': 'done'}
 
 
@@ -190,6 +193,7 @@ def test_modify_response_headers(rf: RequestFactory) -> None:
     assert response.headers == {
         'Content-Type': 'application/json',
         'X-Test': 'true',
+        'Content-Length': str(len(response.content)),
     }
     assert json.loads(response.content) == {'result': 'done'}
 
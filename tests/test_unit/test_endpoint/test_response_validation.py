@@ -1,4 +1,7 @@
+import datetime as dt
+import gc
 import json
+import weakref
 from http import HTTPMethod, HTTPStatus
 from typing import ClassVar, TypeAlias, final
 
@@ -395,3 +398,99 @@ def test_double_validation_raw_dict_return(
     assert isinstance(response, HttpResponse)
     assert response.status_code == HTTPStatus.OK
     assert json.loads(response.content) == {'username': 'admin'}
+
+
+@final
+class _DatetimeModel(pydantic.BaseModel):
+    created_at: dt.datetime
+
+
+@final
+class _ToResponseController(Controller[PydanticSerializer]):
+    @validate(
+        ResponseSpec(
+            return_type=_DatetimeModel,
+            status_code=HTTPStatus.OK,
+        ),
+    )
+    def get(self) -> HttpResponse:
+        return self.to_response(
+            _DatetimeModel(
+                created_at=dt.datetime.fromisoformat('2025-01-01T10:00:00'),
+            ),
+        )
+
+    @validate(
+        ResponseSpec(
+            return_type=dict[str, int],
+            status_code=HTTPStatus.OK,
+        ),
+    )
+    def put(self) -> HttpResponse:
+        response = self.to_response({'key': 1}, status_code=HTTPStatus.OK)
+        response.content = b'{"key": "a"}'
+        return response
+
+    @validate(
+        ResponseSpec(
+            return_type=dict[str, list[int]],
+            status_code=HTTPStatus.OK,
+        ),
+    )
+    def patch(self) -> HttpResponse:
+        return self.to_response({'key': (1, 2)}, status_code=HTTPStatus.OK)
+
+
+def test_to_response_validates_raw_data(
+    dmr_rf: DMRRequestFactory,
+) -> None:
+    """Ensures that responses are validated without parsing their json."""
+    request = dmr_rf.get('/whatever/')
+
+    response = _ToResponseController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+    assert json.loads(response.content) == {
+        'created_at': '2025-01-01T10:00:00',
+    }
+
+
+def test_to_response_changed_content(
+    dmr_rf: DMRRequestFactory,
+) -> None:
+    """Ensures that changed content of responses is validated."""
+    request = dmr_rf.put('/whatever/')
+
+    response = _ToResponseController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert json.loads(response.content)['detail']
+
+
+def test_to_response_json_representation(
+    dmr_rf: DMRRequestFactory,
+) -> None:
+    """Ensures that json is validated when raw data is not valid."""
+    request = dmr_rf.patch('/whatever/')
+
+    response = _ToResponseController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+    assert json.loads(response.content) == {'key': [1, 2]}
+
+
+def test_requests_are_not_retained(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that response validation does not keep requests alive."""
+    request = dmr_rf.get('/whatever/')
+    request_ref = weakref.ref(request)
+
+    response = _RawPydanticReturnController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK
+    del request  # noqa: WPS420
+    gc.collect()
+    assert request_ref() is None
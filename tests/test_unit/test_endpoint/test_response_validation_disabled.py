@@ -138,7 +138,10 @@ def test_validate_headers(
 
     assert isinstance(response, HttpResponse)
     assert response.status_code == HTTPStatus.CREATED
-    assert response.headers == {'Content-Type': 'application/json'}
+    assert response.headers == {
+        'Content-Type': 'application/json',
+        'Content-Length': str(len(response.content)),
+    }
     assert json.loads(response.content) == []
 
 
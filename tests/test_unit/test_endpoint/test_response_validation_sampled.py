@@ -0,0 +1,226 @@
+import json
+import logging
+import math
+from collections.abc import Iterator
+from http import HTTPStatus
+from typing import Any, ClassVar, Final, final
+
+import pytest
+from django.conf import LazySettings
+from django.http import HttpResponse
+
+from django_modern_rest import (
+    Blueprint,
+    Controller,
+    ResponseSpec,
+    modify,
+    validate,
+)
+from django_modern_rest.controller import BlueprintsT
+from django_modern_rest.exceptions import EndpointMetadataError
+from django_modern_rest.plugins.pydantic import PydanticSerializer
+from django_modern_rest.settings import (
+    Settings,
+    clear_settings_cache,
+)
+from django_modern_rest.test import DMRRequestFactory
+
+# `random.random()` is always less than this rate:
+_ALWAYS_SAMPLED: Final = math.nextafter(1, 0)
+
+
+@pytest.fixture
+def _sampled_validation(settings: LazySettings) -> Iterator[None]:
+    clear_settings_cache()
+
+    settings.DMR_SETTINGS = {
+        Settings.validate_responses_sample_rate: _ALWAYS_SAMPLED,
+    }
+
+    yield
+
+    clear_settings_cache()
+
+
+@final
+class _WrongController(Controller[PydanticSerializer]):
+    def get(self) -> list[int]:
+        return ['a']  # type: ignore[list-item]
+
+    @validate(
+        ResponseSpec(return_type=list[int], status_code=HTTPStatus.OK),
+    )
+    def post(self) -> HttpResponse:
+        return HttpResponse(b'["a"]')
+
+
+@pytest.mark.usefixtures('_sampled_validation')
+@pytest.mark.parametrize('method', ['get', 'post'])
+def test_sampled_validation_logs_errors(
+    dmr_rf: DMRRequestFactory,
+    caplog: pytest.LogCaptureFixture,
+    *,
+    method: str,
+) -> None:
+    """Ensures that sampled validation errors are logged, not returned."""
+    request = dmr_rf.generic(method, '/whatever/')
+
+    with caplog.at_level(logging.WARNING):
+        response = _WrongController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code in {HTTPStatus.OK, HTTPStatus.CREATED}
+    assert json.loads(response.content) == ['a']
+    assert len(caplog.records) == 1
+    assert '_WrongController' in caplog.records[0].getMessage()
+
+
+@final
+class _NotSampledController(Controller[PydanticSerializer]):
+    validate_responses_sample_rate: ClassVar[float | None] = 0
+
+    def get(self) -> list[int]:
+        return ['a']  # type: ignore[list-item]
+
+    @modify(validate_responses_sample_rate=1)
+    def post(self) -> list[int]:
+        return ['a']  # type: ignore[list-item]
+
+
+def test_controller_sample_rate(
+    dmr_rf: DMRRequestFactory,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Ensures that controllers can skip validation of all responses."""
+    request = dmr_rf.get('/whatever/')
+
+    with caplog.at_level(logging.WARNING):
+        response = _NotSampledController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK
+    assert json.loads(response.content) == ['a']
+    assert not caplog.records
+
+
+def test_endpoint_sample_rate(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that endpoints have a priority over controllers."""
+    request = dmr_rf.post('/whatever/')
+
+    response = _NotSampledController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert json.loads(response.content)['detail']
+
+
+@final
+class _SampledBlueprint(Blueprint[PydanticSerializer]):
+    validate_responses_sample_rate: ClassVar[float | None] = _ALWAYS_SAMPLED
+
+    def post(self) -> list[int]:
+        return ['a']  # type: ignore[list-item]
+
+
+@final
+class _BlueprintOverController(Controller[PydanticSerializer]):
+    validate_responses_sample_rate: ClassVar[float | None] = 0
+
+    blueprints: ClassVar[BlueprintsT] = [_SampledBlueprint]
+
+
+def test_blueprint_sample_rate(
+    dmr_rf: DMRRequestFactory,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Ensures that blueprints have a priority over controllers."""
+    request = dmr_rf.post('/whatever/')
+
+    with caplog.at_level(logging.WARNING):
+        response = _BlueprintOverController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.CREATED
+    assert json.loads(response.content) == ['a']
+    assert len(caplog.records) == 1
+
+
+@final
+class _DisabledController(Controller[PydanticSerializer]):
+    validate_responses: ClassVar[bool | None] = False
+    validate_responses_sample_rate: ClassVar[float | None] = 1
+
+    def get(self) -> list[int]:
+        return ['a']  # type: ignore[list-item]
+
+
+def test_disabled_validation_sample_rate(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that disabled validation does not depend on sample rate."""
+    request = dmr_rf.get('/whatever/')
+
+    response = _DisabledController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK
+    assert json.loads(response.content) == ['a']
+
+
+_INVALID_SAMPLE_RATES: Final = (-0.1, 1.5, True, '0.5')
+
+
+@pytest.mark.parametrize('sample_rate', _INVALID_SAMPLE_RATES)
+def test_invalid_endpoint_sample_rate(sample_rate: Any) -> None:
+    """Ensures that endpoint sample rates are validated."""
+    with pytest.raises(EndpointMetadataError, match='invalid endpoint'):
+
+        class _InvalidController(Controller[PydanticSerializer]):
+            @modify(validate_responses_sample_rate=sample_rate)
+            def get(self) -> list[int]:
+                raise NotImplementedError
+
+
+@pytest.mark.parametrize('sample_rate', _INVALID_SAMPLE_RATES)
+def test_invalid_controller_sample_rate(sample_rate: Any) -> None:
+    """Ensures that controller sample rates are validated."""
+    with pytest.raises(EndpointMetadataError, match='invalid controller'):
+
+        class _InvalidController(Controller[PydanticSerializer]):
+            validate_responses_sample_rate = sample_rate
+
+            def get(self) -> list[int]:
+                raise NotImplementedError
+
+
+@pytest.mark.parametrize('sample_rate', _INVALID_SAMPLE_RATES)
+def test_invalid_blueprint_sample_rate(sample_rate: Any) -> None:
+    """Ensures that blueprint sample rates are validated."""
+
+    class _InvalidBlueprint(Blueprint[PydanticSerializer]):
+        validate_responses_sample_rate = sample_rate
+
+        def get(self) -> list[int]:
+            raise NotImplementedError
+
+    with pytest.raises(EndpointMetadataError, match='invalid blueprint'):
+
+        class _InvalidController(Controller[PydanticSerializer]):
+            blueprints: ClassVar[BlueprintsT] = [_InvalidBlueprint]
+
+
+@pytest.fixture
+def _invalid_sample_rate(settings: LazySettings) -> Iterator[None]:
+    clear_settings_cache()
+    settings.DMR_SETTINGS = {Settings.validate_responses_sample_rate: 2}
+    yield
+
+    clear_settings_cache()
+
+
+@pytest.mark.usefixtures('_invalid_sample_rate')
+def test_invalid_settings_sample_rate() -> None:
+    """Ensures that the sample rate setting is validated."""
+    with pytest.raises(EndpointMetadataError, match='invalid settings'):
+
+        class _InvalidController(Controller[PydanticSerializer]):
+            def get(self) -> list[int]:
+                raise NotImplementedError
@@ -43,10 +43,36 @@ def test_meta_sync(dmr_rf: DMRRequestFactory) -> None:
     assert response.headers == {
         'Allow': 'OPTIONS, POST, PUT',
         'Content-Type': 'application/json',
+        'Content-Length': str(len(response.content)),
     }
     assert json.loads(response.content) is None
 
 
+def test_meta_prebuilt_response(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that pre-built options responses are not shared."""
+    request = dmr_rf.options('/whatever/', data={})
+
+    response = _MetaController.as_view()(request)
+    response.headers['X-Modified'] = 'true'
+    response = _MetaController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.NO_CONTENT, response.content
+    assert 'X-Modified' not in response.headers
+    assert response is not _MetaController._options_response  # noqa: SLF001
+
+
+@final
+class _NoMetaController(Controller[PydanticSerializer]):
+    def get(self) -> str:
+        raise NotImplementedError
+
+
+def test_no_meta_prebuilt_response() -> None:
+    """Ensures that options responses are only pre-built when used."""
+    assert not hasattr(_NoMetaController, '_options_response')
+
+
 @final
 class _AsyncMetaController(
     AsyncMetaMixin,
@@ -79,5 +105,6 @@ async def test_meta_async(dmr_async_rf: DMRAsyncRequestFactory) -> None:
     assert response.headers == {
         'Allow': 'DELETE, GET, OPTIONS',
         'Content-Type': 'application/json',
+        'Content-Length': str(len(response.content)),
     }
     assert json.loads(response.content) is None
@@ -66,5 +66,8 @@ def test_msgspec_components(
 
     assert isinstance(response, HttpResponse)
     assert response.status_code == HTTPStatus.OK, response.content
-    assert response.headers == {'Content-Type': 'application/json'}
+    assert response.headers == {
+        'Content-Type': 'application/json',
+        'Content-Length': str(len(response.content)),
+    }
     assert json.loads(response.content) == f'{first_name} {last_name}'
@@ -0,0 +1,256 @@
+import json
+from collections.abc import Callable, Iterator
+from http import HTTPStatus
+from typing import Any, ClassVar, Final, final
+
+import pytest
+from django.conf import LazySettings
+from django.http import HttpResponse
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    pytest.skip(reason='msgspec is not installed', allow_module_level=True)
+
+from django_modern_rest import Body, Controller
+from django_modern_rest.internal.json import FromJson, deserialize, serialize
+from django_modern_rest.plugins.msgspec import (
+    MsgpackSerializer,
+    MsgspecConvertOptions,
+    MsgspecSerializer,
+    _get_cached_decoder,
+    _get_cached_msgpack_decoder,
+)
+from django_modern_rest.settings import Settings, clear_settings_cache
+from django_modern_rest.test import DMRRequestFactory
+
+_EMAIL: Final = 'a@b.c'
+
+#: Buffers passed to the custom deserializer:
+_deserialized: list[FromJson] = []
+
+
+def _custom_deserialize(buffer: FromJson, *args: Any, **kwargs: Any) -> Any:
+    _deserialized.append(buffer)
+    return deserialize(buffer, *args, **kwargs)
+
+
+@pytest.fixture
+def _custom_deserializer(settings: LazySettings) -> Iterator[None]:
+    clear_settings_cache()
+    settings.DMR_SETTINGS = {Settings.deserialize: _custom_deserialize}
+    _deserialized.clear()
+    yield
+
+    clear_settings_cache()
+
+
+@final
+class _User(msgspec.Struct):
+    email: str
+
+
+@final
+class _UsersController(Controller[MsgspecSerializer], Body[list[_User]]):
+    def post(self) -> list[_User]:
+        return self.parsed_body
+
+
+@pytest.mark.usefixtures('_custom_deserializer')
+@pytest.mark.parametrize(
+    ('content_type', 'body'),
+    [
+        ('application/json', json.dumps([{'email': _EMAIL}]).encode()),
+        ('application/x-ndjson', json.dumps({'email': _EMAIL}).encode()),
+    ],
+)
+def test_custom_deserialize_setting(
+    dmr_rf: DMRRequestFactory,
+    *,
+    content_type: str,
+    body: bytes,
+) -> None:
+    """Ensures that custom deserializers are used for bodies."""
+    request = dmr_rf.post('/whatever/', data=body, content_type=content_type)
+
+    response = _UsersController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.CREATED, response.content
+    assert json.loads(response.content) == [{'email': _EMAIL}]
+    assert _deserialized
+
+
+#: Models passed to `from_python` of serializers with convert options:
+_converted: list[Any] = []
+
+
+class _ConvertMixin:
+    convert_kwargs: ClassVar[MsgspecConvertOptions] = {'str_keys': True}
+
+    @classmethod
+    def from_python(
+        cls,
+        unstructured: Any,
+        model: Any,
+        *,
+        strict: bool,
+    ) -> Any:
+        _converted.append(model)
+        return super().from_python(  # type: ignore[misc]
+            unstructured,
+            model,
+            strict=strict,
+        )
+
+
+@final
+class _ConvertJsonSerializer(_ConvertMixin, MsgspecSerializer):
+    """Json serializer with custom convert options."""
+
+
+@final
+class _ConvertMsgpackSerializer(_ConvertMixin, MsgpackSerializer):
+    """MessagePack serializer with custom convert options."""
+
+
+@pytest.mark.parametrize(
+    ('serializer', 'body'),
+    [
+        (_ConvertJsonSerializer, msgspec.json.encode(_User(_EMAIL))),
+        (_ConvertMsgpackSerializer, msgspec.msgpack.encode(_User(_EMAIL))),
+    ],
+)
+def test_convert_kwargs(
+    dmr_rf: DMRRequestFactory,
+    *,
+    serializer: type[MsgspecSerializer],
+    body: bytes,
+) -> None:
+    """Ensures that bodies are converted with custom convert options."""
+
+    class _UserController(
+        Controller[serializer],  # type: ignore[valid-type]
+        Body[_User],
+    ):
+        def post(self) -> _User:
+            return self.parsed_body
+
+    _converted.clear()
+    request = dmr_rf.post(
+        '/whatever/',
+        data=body,
+        content_type=serializer.content_type,
+    )
+
+    response = _UserController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.CREATED, response.content
+    assert _User in _converted
+
+
+def _pretty_serialize(to_serialize: Any, *args: Any, **kwargs: Any) -> bytes:
+    return msgspec.json.format(serialize(to_serialize, *args, **kwargs))
+
+
+@pytest.fixture
+def _pretty_serializer(settings: LazySettings) -> Iterator[None]:
+    clear_settings_cache()
+    settings.DMR_SETTINGS = {Settings.serialize: _pretty_serialize}
+    yield
+
+    clear_settings_cache()
+
+
+@final
+class _UserController(Controller[MsgspecSerializer]):
+    def get(self) -> _User:
+        return _User(_EMAIL)
+
+
+@pytest.mark.usefixtures('_pretty_serializer')
+def test_custom_serialize_setting(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that custom serializers are used for typed responses."""
+    request = dmr_rf.get('/whatever/')
+
+    response = _UserController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+    assert response.content == b'{\n  "email": "a@b.c"\n}'
+
+
+@final
+class _Point:
+    def __init__(self, x_coord: int, y_coord: int) -> None:
+        self.x_coord = x_coord
+        self.y_coord = y_coord
+
+
+class _PointHookMixin:
+    @classmethod
+    def deserialize_hook(
+        cls,
+        target_type: type[Any],
+        to_deserialize: Any,
+    ) -> Any:
+        if target_type is _Point:
+            return _Point(*to_deserialize)
+        return super().deserialize_hook(  # type: ignore[misc]
+            target_type,
+            to_deserialize,
+        )
+
+
+@final
+class _PointJsonSerializer(_PointHookMixin, MsgspecSerializer):
+    """Json serializer with custom deserialize hook."""
+
+
+@final
+class _PointMsgpackSerializer(_PointHookMixin, MsgpackSerializer):
+    """MessagePack serializer with custom deserialize hook."""
+
+
+@pytest.mark.parametrize(
+    ('serializer', 'get_decoder', 'body'),
+    [
+        (_PointJsonSerializer, _get_cached_decoder, b'[1, 2]'),
+        (
+            _PointMsgpackSerializer,
+            _get_cached_msgpack_decoder,
+            msgspec.msgpack.encode([1, 2]),
+        ),
+    ],
+)
+def test_optimizer_uses_serializer_hooks(
+    dmr_rf: DMRRequestFactory,
+    *,
+    serializer: type[MsgspecSerializer],
+    get_decoder: Callable[..., Any],
+    body: bytes,
+) -> None:
+    """Ensures that decoders are pre-built with hooks of the serializer."""
+    get_decoder.cache_clear()  # type: ignore[attr-defined]
+
+    class _PointController(
+        Controller[serializer],  # type: ignore[valid-type]
+        Body[_Point],
+    ):
+        def post(self) -> list[int]:
+            return [self.parsed_body.x_coord, self.parsed_body.y_coord]
+
+    misses = get_decoder.cache_info().misses  # type: ignore[attr-defined]
+    request = dmr_rf.post(
+        '/whatever/',
+        data=body,
+        content_type=serializer.content_type,
+    )
+
+    response = _PointController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.CREATED, response.content
+    assert get_decoder.cache_info().misses == misses  # type: ignore[attr-defined]
+    assert serializer.deserialize(response.content) == [1, 2]
@@ -0,0 +1,177 @@
+from collections.abc import Iterator
+from http import HTTPStatus
+from typing import Final, final
+
+import pytest
+from django.http import HttpResponse
+from inline_snapshot import snapshot
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    pytest.skip(reason='msgspec is not installed', allow_module_level=True)
+
+from django_modern_rest import (
+    Body,
+    Controller,
+    Query,
+    ResponseSpec,
+    StreamingBody,
+    validate,
+)
+from django_modern_rest.exceptions import EndpointMetadataError
+from django_modern_rest.plugins.msgspec import MsgpackSerializer
+from django_modern_rest.test import DMRRequestFactory
+
+_MSGPACK: Final = 'application/msgpack'
+
+
+@final
+class _User(msgspec.Struct):
+    email: str
+    age: int
+
+
+@final
+class _UserController(Controller[MsgpackSerializer], Body[_User]):
+    def post(self) -> _User:
+        return self.parsed_body
+
+
+@final
+class _InvalidUserController(
+    Controller[MsgpackSerializer],
+    Query[dict[str, str]],
+):
+    @validate(ResponseSpec(_User, status_code=HTTPStatus.OK))
+    def get(self) -> HttpResponse:
+        return HttpResponse(
+            msgspec.msgpack.encode({'email': 1, 'age': 1}),
+            content_type=_MSGPACK,
+        )
+
+
+@final
+class _UsersImportController(
+    Controller[MsgpackSerializer],
+    StreamingBody[_User],
+):
+    def post(self) -> list[str]:
+        return [user.email for user in self.parsed_body]
+
+
+def test_msgpack_body(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that bodies and responses are encoded as MessagePack."""
+    request = dmr_rf.post(
+        '/whatever/',
+        data=msgspec.msgpack.encode({'email': 'a@b.c', 'age': '1'}),
+        content_type=_MSGPACK,
+    )
+
+    response = _UserController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.CREATED, response.content
+    assert response.headers['Content-Type'] == _MSGPACK
+    assert msgspec.msgpack.decode(response.content) == {
+        'email': 'a@b.c',
+        'age': 1,
+    }
+
+
+@pytest.mark.parametrize(
+    ('body', 'content_type'),
+    [
+        (msgspec.msgpack.encode({'email': 'a@b.c'}), _MSGPACK),
+        (b'\xc1', _MSGPACK),
+        (msgspec.json.encode({'email': 'a@b.c', 'age': 1}), 'application/json'),
+    ],
+)
+def test_invalid_msgpack_body(
+    dmr_rf: DMRRequestFactory,
+    *,
+    body: bytes,
+    content_type: str,
+) -> None:
+    """Ensures that invalid bodies are reported as MessagePack."""
+    request = dmr_rf.post('/whatever/', data=body, content_type=content_type)
+
+    response = _UserController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.headers['Content-Type'] == _MSGPACK
+    assert msgspec.msgpack.decode(response.content)['detail']
+
+
+def test_empty_msgpack_body() -> None:
+    """Ensures that empty bodies are parsed as ``None``, like in json."""
+    assert MsgpackSerializer.deserialize(b'') is None
+
+
+def test_msgpack_response_validation(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that MessagePack responses are validated."""
+    request = dmr_rf.get('/whatever/')
+
+    response = _InvalidUserController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert msgspec.msgpack.decode(response.content) == snapshot({
+        'detail': [
+            {
+                'type': 'value_error',
+                'loc': [],
+                'msg': 'Expected `str`, got `int` - at `$.email`',
+            },
+        ],
+    })
+
+
+def test_msgpack_streaming_body(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that items of MessagePack arrays are parsed one by one."""
+    request = dmr_rf.post(
+        '/whatever/',
+        data=msgspec.msgpack.encode([
+            {'email': 'a@b.c', 'age': 1},
+            {'email': 'd@e.f', 'age': 2},
+        ]),
+        content_type=_MSGPACK,
+    )
+
+    response = _UsersImportController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.CREATED, response.content
+    assert msgspec.msgpack.decode(response.content) == ['a@b.c', 'd@e.f']
+
+
+def test_invalid_msgpack_streaming_body(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that malformed MessagePack arrays are reported."""
+    request = dmr_rf.post('/whatever/', data=b'\x92\xc1', content_type=_MSGPACK)
+
+    response = _UsersImportController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert msgspec.msgpack.decode(response.content) == snapshot({
+        'detail': [
+            {
+                'type': 'value_error',
+                'loc': [0],
+                'msg': (
+                    r"MessagePack data is malformed: invalid opcode '\xc1' "
+                    '(byte 1)'
+                ),
+            },
+        ],
+    })
+
+
+def test_msgpack_streams_not_supported() -> None:
+    """Ensures that MessagePack responses can't be streamed."""
+    with pytest.raises(EndpointMetadataError, match='support streaming'):
+
+        class _StreamController(Controller[MsgpackSerializer]):
+            def get(self) -> Iterator[int]:
+                raise NotImplementedError
@@ -1,9 +1,10 @@
 import sys
 from http import HTTPStatus
-from typing import final
+from typing import Any, final
 
 import pytest
 from django.http import HttpResponse
+from django.http.request import HttpHeaders
 from faker import Faker
 
 try:
@@ -14,6 +15,7 @@ except ImportError:  # pragma: no cover
 
 from django_modern_rest import Body, Controller
 from django_modern_rest.plugins.msgspec import MsgspecSerializer
+from django_modern_rest.serialization import BaseSerializer
 from django_modern_rest.test import DMRRequestFactory
 
 
@@ -80,3 +82,22 @@ def test_serialize_errors_types(
             MsgspecSerializer().error_serialize(err)
     else:
         assert MsgspecSerializer().error_serialize(err)
+
+
+@pytest.mark.parametrize(
+    ('structure', 'model'),
+    [
+        (_MsgSpecUserModel(email='email@test.edu'), _MsgSpecUserModel),
+        ([{'key': 1}], list[dict[str, int]]),
+        (HttpHeaders({'HTTP_ACCEPT': 'application/json'}), dict[str, str]),
+    ],
+)
+def test_to_json_matches_serialize(structure: Any, model: Any) -> None:
+    """Ensures that prebuilt encoders produce the same json."""
+    default_to_json = BaseSerializer.__dict__['to_json'].__func__
+
+    assert MsgspecSerializer.to_json(structure, model) == default_to_json(
+        MsgspecSerializer,
+        structure,
+        model,
+    )
@@ -63,7 +63,10 @@ def test_msgspec_model_controller(
 
     assert isinstance(response, HttpResponse)
     assert response.status_code == HTTPStatus.CREATED, response.content
-    assert response.headers == {'Content-Type': 'application/json'}
+    assert response.headers == {
+        'Content-Type': 'application/json',
+        'Content-Length': str(len(response.content)),
+    }
     assert json.loads(response.content) == {
         'full_name': (
             f'{request_data["first_name"]} {request_data["last_name"]}'
@@ -85,7 +88,10 @@ def test_msgspec_model_controller_invalid_input(
 
     assert isinstance(response, HttpResponse)
     assert response.status_code == HTTPStatus.BAD_REQUEST, response.content
-    assert response.headers == {'Content-Type': 'application/json'}
+    assert response.headers == {
+        'Content-Type': 'application/json',
+        'Content-Length': str(len(response.content)),
+    }
     assert json.loads(response.content) == snapshot({
         'detail': [
             {
@@ -114,7 +120,10 @@ def test_msgspec_model_controller_invalid_types(
 
     assert isinstance(response, HttpResponse)
     assert response.status_code == HTTPStatus.BAD_REQUEST, response.content
-    assert response.headers == {'Content-Type': 'application/json'}
+    assert response.headers == {
+        'Content-Type': 'application/json',
+        'Content-Length': str(len(response.content)),
+    }
     assert json.loads(response.content) == snapshot({
         'detail': [
             {
@@ -164,7 +173,10 @@ def test_msgspec_returns_validated(
     assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY, (
         response.content
     )
-    assert response.headers == {'Content-Type': 'application/json'}
+    assert response.headers == {
+        'Content-Type': 'application/json',
+        'Content-Length': str(len(response.content)),
+    }
     assert json.loads(response.content)['detail']
 
 
@@ -198,7 +210,10 @@ def test_msgspec_field_names_work(
 
     assert isinstance(response, HttpResponse)
     assert response.status_code == HTTPStatus.CREATED, response.content
-    assert response.headers == {'Content-Type': 'application/json'}
+    assert response.headers == {
+        'Content-Type': 'application/json',
+        'Content-Length': str(len(response.content)),
+    }
     assert json.loads(response.content) == request_data
 
 
@@ -236,5 +251,8 @@ def test_msgspec_struct_renames_work(
 
     assert isinstance(response, HttpResponse)
     assert response.status_code == HTTPStatus.CREATED, response.content
-    assert response.headers == {'Content-Type': 'application/json'}
+    assert response.headers == {
+        'Content-Type': 'application/json',
+        'Content-Length': str(len(response.content)),
+    }
     assert json.loads(response.content) == request_data
@@ -0,0 +1,190 @@
+import datetime as dt
+import json
+from collections.abc import Iterator
+from http import HTTPStatus
+from typing import Any, final
+
+import pydantic
+import pytest
+from django.conf import LazySettings
+from django.http import HttpResponse
+from inline_snapshot import snapshot
+
+from django_modern_rest import Body, Controller
+from django_modern_rest.exceptions import DataParsingError
+from django_modern_rest.internal.json import FromJson, deserialize
+from django_modern_rest.plugins.pydantic import PydanticSerializer
+from django_modern_rest.serialization import BaseSerializer
+from django_modern_rest.settings import Settings, clear_settings_cache
+from django_modern_rest.test import DMRRequestFactory
+
+
+@final
+class _BodyModel(pydantic.BaseModel):
+    user_id: int
+    created_at: dt.datetime
+    tags: list[str] = []
+
+
+@final
+class _BodyController(
+    Controller[PydanticSerializer],
+    Body[_BodyModel],
+):
+    def post(self) -> _BodyModel:
+        return self.parsed_body
+
+
+def _generic_from_json(buffer: bytes) -> Any:
+    # Default implementation: `deserialize` and `from_python`
+    from_json = BaseSerializer.__dict__['from_json'].__func__
+    return from_json(PydanticSerializer, buffer, _BodyModel, strict=False)
+
+
+@pytest.mark.parametrize(
+    'request_data',
+    [
+        b'{"user_id": 1, "created_at": "2025-01-01T10:00:00"}',
+        b'{"user_id": "1", "created_at": "2025-01-01", "tags": ["a"]}',
+    ],
+)
+def test_from_json_matches_python_validation(request_data: bytes) -> None:
+    """Ensures that json validation is the same as the generic path."""
+    assert PydanticSerializer.from_json(
+        request_data,
+        _BodyModel,
+        strict=False,
+    ) == _generic_from_json(request_data)
+
+
+def test_from_json_invalid_json() -> None:
+    """Ensures that invalid json is reported as a validation error."""
+    with pytest.raises(pydantic.ValidationError):
+        PydanticSerializer.from_json(b'{', _BodyModel, strict=False)
+    with pytest.raises(DataParsingError):
+        _generic_from_json(b'{')
+
+
+@pytest.mark.parametrize(
+    ('request_data', 'errors'),
+    [
+        (
+            b'{',
+            snapshot({
+                'detail': [
+                    {
+                        'type': 'value_error',
+                        'loc': [],
+                        'msg': 'Value error, Input data was truncated',
+                        'input': '',
+                        'ctx': {'error': 'Input data was truncated'},
+                    },
+                ],
+            }),
+        ),
+        (
+            b'[]',
+            snapshot({
+                'detail': [
+                    {
+                        'type': 'model_type',
+                        'loc': ['parsed_body'],
+                        'msg': (
+                            'Input should be a valid dictionary '
+                            'or instance of _BodyModel'
+                        ),
+                        'input': [],
+                        'ctx': {'class_name': '_BodyModel'},
+                    },
+                ],
+            }),
+        ),
+        (
+            b'{"user_id": "a", "created_at": "2025-01-01"}',
+            snapshot({
+                'detail': [
+                    {
+                        'type': 'int_parsing',
+                        'loc': ['parsed_body', 'user_id'],
+                        'msg': (
+                            'Input should be a valid integer, '
+                            'unable to parse string as an integer'
+                        ),
+                        'input': 'a',
+                    },
+                ],
+            }),
+        ),
+    ],
+)
+def test_from_json_error_format(
+    dmr_rf: DMRRequestFactory,
+    *,
+    request_data: bytes,
+    errors: Any,
+) -> None:
+    """Ensures that errors are reported in the regular format."""
+    request = dmr_rf.post(
+        '/whatever/',
+        data=request_data,
+        content_type='application/json',
+    )
+
+    response = _BodyController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert json.loads(response.content) == errors
+
+
+def test_from_json_valid_body(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that valid bodies are parsed from json."""
+    request = dmr_rf.post(
+        '/whatever/',
+        data={'user_id': 1, 'created_at': '2025-01-01T10:00:00'},
+    )
+
+    response = _BodyController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.CREATED, response.content
+    assert json.loads(response.content) == {
+        'user_id': 1,
+        'created_at': '2025-01-01T10:00:00',
+        'tags': [],
+    }
+
+
+#: Buffers passed to the custom deserializer:
+_deserialized: list[FromJson] = []
+
+
+def _custom_deserialize(buffer: FromJson, *args: Any, **kwargs: Any) -> Any:
+    _deserialized.append(buffer)
+    return deserialize(buffer, *args, **kwargs)
+
+
+@pytest.fixture
+def _custom_deserializer(settings: LazySettings) -> Iterator[None]:
+    clear_settings_cache()
+    settings.DMR_SETTINGS = {Settings.deserialize: _custom_deserialize}
+    _deserialized.clear()
+    yield
+
+    clear_settings_cache()
+
+
+@pytest.mark.usefixtures('_custom_deserializer')
+def test_from_json_custom_deserialize(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that custom deserializers are used for bodies."""
+    request = dmr_rf.post(
+        '/whatever/',
+        data={'user_id': '1', 'created_at': '2025-01-01T10:00:00'},
+    )
+
+    response = _BodyController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.CREATED, response.content
+    assert json.loads(response.content)['user_id'] == 1
+    assert _deserialized == [request.body]
@@ -0,0 +1,121 @@
+import datetime as dt
+import json
+from collections.abc import Iterator
+from http import HTTPStatus
+from typing import Annotated, Any, final
+
+import pydantic
+import pytest
+from django.conf import LazySettings
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from django_modern_rest import Controller, modify
+from django_modern_rest.internal.json import serialize
+from django_modern_rest.plugins.pydantic import PydanticSerializer
+from django_modern_rest.settings import Settings, clear_settings_cache
+
+
+@final
+class _ItemModel(pydantic.BaseModel):
+    item_id: int = pydantic.Field(alias='id')
+    created_at: dt.datetime
+
+
+def _build_models() -> list[_ItemModel]:
+    return [
+        _ItemModel(
+            id=1,
+            created_at=dt.datetime.fromisoformat('2025-01-01T10:00:00'),
+        ),
+        _ItemModel(
+            id=2,
+            created_at=dt.datetime.fromisoformat('2025-01-02T10:00:00'),
+        ),
+    ]
+
+
+@pytest.mark.parametrize(
+    'model',
+    [
+        list[_ItemModel],
+        Annotated[list[_ItemModel], 'metadata'],
+        list[_ItemModel | None],
+        list[Any],
+        Any,
+    ],
+)
+def test_to_json_matches_serialize(model: Any) -> None:
+    """Ensures that typed serialization is the same as the default one."""
+    models = _build_models()
+
+    assert PydanticSerializer.to_json(
+        models,
+        model,
+    ) == PydanticSerializer.serialize(models)
+
+
+def test_to_json_does_not_match_model() -> None:
+    """Ensures that data that does not match the model is still serialized."""
+    structure = [{'id': 1, 'extra': {'key'}}]
+
+    assert PydanticSerializer.to_json(
+        structure,
+        list[_ItemModel],
+    ) == PydanticSerializer.serialize(structure)
+
+
+@final
+class _ItemsController(Controller[PydanticSerializer]):
+    def get(self) -> list[_ItemModel]:
+        return _build_models()
+
+    @modify(validate_responses=False)
+    def post(self) -> list[_ItemModel]:
+        return [{'id': 3, 'created_at': 'now'}]  # type: ignore[list-item]
+
+
+def test_to_json_endpoint(rf: RequestFactory) -> None:
+    """Ensures that endpoints serialize responses of known types."""
+    response = _ItemsController.as_view()(rf.get('/whatever/'))
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+    assert json.loads(response.content) == [
+        {'id': 1, 'created_at': '2025-01-01T10:00:00'},
+        {'id': 2, 'created_at': '2025-01-02T10:00:00'},
+    ]
+
+
+def test_to_json_endpoint_unvalidated(rf: RequestFactory) -> None:
+    """Ensures that unvalidated responses are serialized as they are."""
+    response = _ItemsController.as_view()(rf.post('/whatever/'))
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.CREATED, response.content
+    assert json.loads(response.content) == [{'id': 3, 'created_at': 'now'}]
+
+
+def _pretty_serialize(to_serialize: Any, *args: Any, **kwargs: Any) -> bytes:
+    structure = json.loads(serialize(to_serialize, *args, **kwargs))
+    return json.dumps(structure, indent=2).encode()
+
+
+@pytest.fixture
+def _pretty_serializer(settings: LazySettings) -> Iterator[None]:
+    clear_settings_cache()
+    settings.DMR_SETTINGS = {Settings.serialize: _pretty_serialize}
+    yield
+
+    clear_settings_cache()
+
+
+@pytest.mark.usefixtures('_pretty_serializer')
+def test_to_json_custom_serialize_setting() -> None:
+    """Ensures that custom serializers are used for typed responses."""
+    models = _build_models()
+
+    assert PydanticSerializer.to_json(
+        models,
+        list[_ItemModel],
+    ) == _pretty_serialize(models, PydanticSerializer.serialize_hook)
@@ -1,7 +1,13 @@
+from http import HTTPStatus
+from typing import Any, final
+
 import pytest
+from typing_extensions import override
 
+from django_modern_rest.plugins.msgspec import MsgspecSerializer
 from django_modern_rest.plugins.pydantic import PydanticSerializer
 from django_modern_rest.response import build_response
+from django_modern_rest.types import EmptyObj
 
 
 def test_build_response_no_status() -> None:
@@ -18,3 +24,30 @@ def test_build_response_no_status() -> None:
             raw_data=[],
             method=None,  # pyright: ignore[reportArgumentType]
         )
+
+
+@pytest.mark.parametrize('return_type', [EmptyObj, list[int]])
+def test_build_response_does_not_copy_content(return_type: Any) -> None:
+    """Ensure that serialized content is used without extra copies."""
+    encoded = b'[1]'
+
+    @final
+    class _ContentSerializer(MsgspecSerializer):
+        @override
+        @classmethod
+        def serialize(cls, structure: Any) -> bytes:
+            return encoded
+
+        @override
+        @classmethod
+        def to_json(cls, structure: Any, model: Any) -> bytes:
+            return encoded
+
+    response = build_response(
+        _ContentSerializer,
+        raw_data=[],
+        status_code=HTTPStatus.OK,
+        return_type=return_type,
+    )
+
+    assert response.content is encoded
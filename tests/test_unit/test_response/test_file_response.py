@@ -0,0 +1,401 @@
+import io
+from collections.abc import Iterator
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any, Final, final
+from wsgiref.util import FileWrapper
+
+import pytest
+from django.conf import LazySettings
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.signals import request_finished, request_started
+from django.db import close_old_connections
+from django.http import FileResponse, HttpResponse
+from django.http.response import HttpResponseBase
+from django.urls import path
+from typing_extensions import override
+
+from django_modern_rest import Controller, ResponseSpec, validate
+from django_modern_rest.files import FileOffload, build_file_response
+from django_modern_rest.plugins.pydantic import PydanticSerializer
+from django_modern_rest.settings import Settings, clear_settings_cache
+from django_modern_rest.test import DMRRequestFactory
+
+_REPORT: Final = b'report.pdf'
+
+
+@pytest.fixture(autouse=True)
+def _keep_connections() -> Iterator[None]:
+    # Handlers close database connections, test clients keep them:
+    request_started.disconnect(close_old_connections)
+    request_finished.disconnect(close_old_connections)
+    yield
+    request_started.connect(close_old_connections)
+    request_finished.connect(close_old_connections)
+
+
+@pytest.fixture
+def report(tmp_path: Path) -> Path:
+    """Create a text report file with a space in its name."""
+    report_path = tmp_path / 'report one.txt'
+    report_path.write_bytes(_REPORT)
+    return report_path
+
+
+@final
+class _ReportController(Controller[PydanticSerializer]):
+    @validate(
+        ResponseSpec(bytes, status_code=HTTPStatus.OK, media_type='text/plain'),
+        ResponseSpec(
+            bytes,
+            status_code=HTTPStatus.PARTIAL_CONTENT,
+            media_type='text/plain',
+        ),
+        ResponseSpec(
+            None,
+            status_code=HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE,
+            media_type='text/plain',
+        ),
+    )
+    def get(self) -> HttpResponseBase:
+        return build_file_response(self.request, self.request.GET['path'])
+
+
+def _read(response: HttpResponseBase) -> bytes:
+    assert isinstance(response, FileResponse)
+    sent = b''.join(response.streaming_content)  # type: ignore[arg-type]
+    response.close()
+    return sent
+
+
+def test_file_response(dmr_rf: DMRRequestFactory, report: Path) -> None:
+    """Ensures that files are sent with validated file responses."""
+    request = dmr_rf.get('/whatever/', data={'path': str(report)})
+
+    response = _ReportController.as_view()(request)
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers == {
+        'Content-Type': 'text/plain',
+        'Content-Length': '10',
+        'Content-Disposition': 'inline; filename="report one.txt"',
+        'Accept-Ranges': 'bytes',
+    }
+    assert _read(response) == _REPORT
+
+
+@pytest.mark.parametrize(
+    ('range_header', 'content_range', 'expected'),
+    [
+        ('bytes=0-3', 'bytes 0-3/10', b'repo'),
+        ('bytes=5-', 'bytes 5-9/10', b't.pdf'),
+        ('bytes=-3', 'bytes 7-9/10', b'pdf'),
+        ('bytes=8-100', 'bytes 8-9/10', b'df'),
+        ('bytes=-100', 'bytes 0-9/10', _REPORT),
+        (' bytes=9-9 ', 'bytes 9-9/10', b'f'),
+    ],
+)
+def test_range_request(
+    dmr_rf: DMRRequestFactory,
+    report: Path,
+    *,
+    range_header: str,
+    content_range: str,
+    expected: bytes,
+) -> None:
+    """Ensures that byte ranges are sent as partial content."""
+    request = dmr_rf.get(
+        '/whatever/',
+        data={'path': str(report)},
+        headers={'Range': range_header},
+    )
+
+    response = _ReportController.as_view()(request)
+
+    assert response.status_code == HTTPStatus.PARTIAL_CONTENT
+    assert response.headers['Content-Range'] == content_range
+    assert response.headers['Content-Length'] == str(len(expected))
+    assert _read(response) == expected
+
+
+@pytest.mark.parametrize('range_header', ['bytes=10-', 'bytes=-0'])
+def test_unsatisfiable_range(
+    dmr_rf: DMRRequestFactory,
+    report: Path,
+    *,
+    range_header: str,
+) -> None:
+    """Ensures that ranges outside of files are not satisfiable."""
+    request = dmr_rf.get(
+        '/whatever/',
+        data={'path': str(report)},
+        headers={'Range': range_header},
+    )
+
+    response = _ReportController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE
+    assert response.headers['Content-Range'] == 'bytes */10'
+    assert response.content == b''
+
+
+@pytest.mark.parametrize(
+    'headers',
+    [
+        {'Range': 'bytes=3-1'},
+        {'Range': 'bytes=-'},
+        {'Range': 'bytes=0-1,3-4'},
+        {'Range': 'items=0-1'},
+        {'Range': 'bytes=0-1', 'If-Range': '"etag"'},
+    ],
+)
+def test_ignored_range(
+    dmr_rf: DMRRequestFactory,
+    report: Path,
+    *,
+    headers: dict[str, str],
+) -> None:
+    """Ensures that unsupported ranges are ignored."""
+    request = dmr_rf.get(
+        '/whatever/',
+        data={'path': str(report)},
+        headers=headers,
+    )
+
+    response = _ReportController.as_view()(request)
+
+    assert response.status_code == HTTPStatus.OK
+    assert _read(response) == _REPORT
+
+
+def test_file_object_range(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that ranges of file objects start at their position."""
+    file_object = io.BytesIO(b'xxreport.pdf')
+    file_object.seek(2)
+    request = dmr_rf.get('/whatever/', headers={'Range': 'bytes=1-2'})
+
+    response = build_file_response(
+        request,
+        file_object,
+        content_type='application/octet-stream',
+        filename='report.bin',
+        as_attachment=True,
+    )
+
+    assert response.status_code == HTTPStatus.PARTIAL_CONTENT
+    assert response.headers['Content-Disposition'] == (
+        'attachment; filename="report.bin"'
+    )
+    assert _read(response) == b'ep'
+
+
+@final
+class _UnseekableFile(io.BytesIO):
+    @override
+    def seekable(self) -> bool:
+        return False
+
+
+def test_unseekable_file(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that ranges of unseekable files are not supported."""
+    request = dmr_rf.get('/whatever/', headers={'Range': 'bytes=1-2'})
+
+    response = build_file_response(request, _UnseekableFile(_REPORT))
+
+    assert response.status_code == HTTPStatus.OK
+    assert 'Accept-Ranges' not in response.headers
+    assert _read(response) == _REPORT
+
+
+def test_truncated_file(dmr_rf: DMRRequestFactory, report: Path) -> None:
+    """Ensures that files truncated while they are sent end the response."""
+    request = dmr_rf.get('/whatever/', headers={'Range': 'bytes=2-'})
+
+    response = build_file_response(request, report)
+    report.write_bytes(b'rep')
+
+    assert _read(response) == b'p'
+
+
+@pytest.fixture
+def _offload(
+    settings: LazySettings,
+    request: pytest.FixtureRequest,
+    tmp_path: Path,
+) -> Iterator[None]:
+    clear_settings_cache()
+    settings.DMR_SETTINGS = {
+        Settings.file_offload: FileOffload(root=tmp_path, **request.param),
+    }
+    yield
+
+    clear_settings_cache()
+
+
+@pytest.mark.parametrize(
+    ('_offload', 'header', 'location'),
+    [
+        (
+            {'header': 'X-Accel-Redirect', 'location': '/protected/'},
+            'X-Accel-Redirect',
+            '/protected/report%20one.txt',
+        ),
+        ({'header': 'X-Sendfile'}, 'X-Sendfile', 'report one.txt'),
+    ],
+    indirect=['_offload'],
+)
+@pytest.mark.usefixtures('_offload')
+def test_file_offload(
+    dmr_rf: DMRRequestFactory,
+    report: Path,
+    *,
+    header: str,
+    location: str,
+) -> None:
+    """Ensures that files can be sent by web servers."""
+    request = dmr_rf.get(
+        '/whatever/',
+        data={'path': str(report)},
+        headers={'Range': 'bytes=0-1'},
+    )
+
+    response = _ReportController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers['Content-Type'] == 'text/plain'
+    assert response.headers['Content-Disposition'] == (
+        'inline; filename="report one.txt"'
+    )
+    assert response.headers[header].endswith(location)
+    assert response.content == b''
+
+
+@pytest.mark.parametrize(
+    '_offload',
+    [{'header': 'X-Sendfile'}],
+    indirect=True,
+)
+@pytest.mark.usefixtures('_offload')
+def test_file_offload_attachment(
+    dmr_rf: DMRRequestFactory,
+    report: Path,
+) -> None:
+    """Ensures that offloaded files keep their content type and name."""
+    response = build_file_response(
+        dmr_rf.get('/whatever/'),
+        report,
+        filename='report.bin',
+        as_attachment=True,
+    )
+
+    assert response.headers['Content-Type'] == 'application/octet-stream'
+    assert response.headers['Content-Disposition'] == (
+        'attachment; filename="report.bin"'
+    )
+
+
+@pytest.mark.parametrize(
+    '_offload',
+    [{'header': 'X-Sendfile'}],
+    indirect=True,
+)
+@pytest.mark.usefixtures('_offload')
+def test_file_offload_outside_root(
+    dmr_rf: DMRRequestFactory,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> None:
+    """Ensures that files outside of offload root are sent by Django."""
+    outside = tmp_path_factory.mktemp('outside') / 'report.txt'
+    outside.write_bytes(_REPORT)
+
+    response = build_file_response(dmr_rf.get('/whatever/'), outside)
+
+    assert 'X-Sendfile' not in response.headers
+    assert _read(response) == _REPORT
+
+
+@final
+class _FileWrapper:
+    """Records files sent with ``wsgi.file_wrapper``."""
+
+    def __init__(self) -> None:
+        self.files: list[Any] = []
+
+    def __call__(self, file_object: Any, block_size: int) -> FileWrapper:
+        self.files.append(file_object)
+        return FileWrapper(file_object, block_size)
+
+
+@final
+class _FileController(Controller[PydanticSerializer]):
+    @validate(
+        ResponseSpec(bytes, status_code=HTTPStatus.OK, media_type='text/plain'),
+        ResponseSpec(
+            bytes,
+            status_code=HTTPStatus.PARTIAL_CONTENT,
+            media_type='text/plain',
+        ),
+    )
+    def get(self) -> HttpResponseBase:
+        return build_file_response(self.request, self.request.GET['path'])
+
+
+urlpatterns = [path('report/', _FileController.as_view())]
+
+
+@pytest.mark.parametrize(
+    ('range_header', 'wrapped', 'expected'),
+    [
+        ('', True, _REPORT),
+        ('bytes=0-1', False, b're'),
+    ],
+)
+def test_wsgi_file_wrapper(
+    settings: LazySettings,
+    report: Path,
+    *,
+    range_header: str,
+    wrapped: bool,
+    expected: bytes,
+) -> None:
+    """Ensures that only whole files are sent with WSGI file wrappers."""
+    settings.ROOT_URLCONF = __name__
+    file_wrapper = _FileWrapper()
+    environ = {
+        'REQUEST_METHOD': 'GET',
+        'PATH_INFO': '/report/',
+        'QUERY_STRING': f'path={report}',
+        'SERVER_NAME': 'testserver',
+        'SERVER_PORT': '80',
+        'HTTP_RANGE': range_header,
+        'wsgi.input': io.BytesIO(),
+        'wsgi.url_scheme': 'http',
+        'wsgi.file_wrapper': file_wrapper,
+    }
+
+    chunks = WSGIHandler()(environ, lambda *args: None)  # type: ignore[arg-type]
+    sent = b''.join(chunks)
+    chunks.close()
+
+    assert sent == expected
+    assert bool(file_wrapper.files) is wrapped
+
+
+@final
+class _CsvController(Controller[PydanticSerializer]):
+    @validate(
+        ResponseSpec(str, status_code=HTTPStatus.OK, media_type='text/csv'),
+    )
+    def get(self) -> HttpResponse:
+        return HttpResponse(b'id\n1\n', content_type='text/csv')
+
+
+def test_binary_body_not_validated(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that bodies of non-json media types are not validated."""
+    response = _CsvController.as_view()(dmr_rf.get('/whatever/'))
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK
+    assert response.content == b'id\n1\n'
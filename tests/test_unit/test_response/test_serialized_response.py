@@ -0,0 +1,132 @@
+from collections.abc import Callable
+from http import HTTPStatus
+from unittest import mock
+
+import pytest
+from django.http import HttpResponse
+from django.http.response import ResponseHeaders
+
+from django_modern_rest.plugins.pydantic import PydanticSerializer
+from django_modern_rest.response import SerializedResponse, build_response
+
+
+def test_same_attributes_as_http_response() -> None:
+    """Ensure that we set all the attributes that Django sets."""
+    response = SerializedResponse(
+        b'[]',
+        status=HTTPStatus.OK,
+        content_type='application/json',
+    )
+    django_response = HttpResponse(
+        b'[]',
+        status=HTTPStatus.OK,
+        content_type='application/json',
+    )
+
+    assert response.__dict__.keys() == django_response.__dict__.keys()
+    assert response.serialize() == (
+        django_response.serialize().replace(
+            b'\r\n\r\n',
+            b'\r\nContent-Length: 2\r\n\r\n',
+        )
+    )
+
+
+def test_content_length_is_updated() -> None:
+    """Ensure that ``Content-Length`` always matches the content."""
+    response = SerializedResponse(
+        b'[]',
+        status=HTTPStatus.OK,
+        content_type='application/json',
+    )
+    assert response.headers['Content-Length'] == '2'
+
+    response.content = b'[1]'
+    assert response.headers['Content-Length'] == '3'
+
+    response.write(b', 2')
+    assert response.content == b'[1], 2'
+    assert response.headers['Content-Length'] == '6'
+
+
+def test_headers_are_normalized() -> None:
+    """Ensure that regular headers are normalized and keep content type."""
+    response = SerializedResponse(
+        b'[]',
+        status=HTTPStatus.CREATED,
+        content_type='application/json',
+        headers={'content-type': 'application/json5', 'X-Custom': '€'},
+    )
+
+    assert response.status_code == HTTPStatus.CREATED
+    assert response.headers == {
+        'content-type': 'application/json5',
+        'X-Custom': '=?utf-8?b?4oKs?=',
+        'Content-Length': '2',
+    }
+
+
+@pytest.mark.parametrize('status', [99, 600, 999])
+def test_invalid_status_code(status: int) -> None:
+    """Ensure that status codes are validated like in Django."""
+    with pytest.raises(ValueError, match='from 100 to 599'):
+        SerializedResponse(
+            b'[]',
+            status=status,
+            content_type='application/json',
+        )
+
+
+def test_prebuilt_headers_are_copied() -> None:
+    """Ensure that pre-built headers are copied, not normalized again."""
+    prebuilt = ResponseHeaders({'X-Custom': '€'})
+
+    with mock.patch.object(
+        ResponseHeaders,
+        '__setitem__',
+        autospec=True,
+        side_effect=ResponseHeaders.__setitem__,
+    ) as set_header:
+        response = SerializedResponse(
+            b'[]',
+            status=HTTPStatus.OK,
+            content_type='application/json',
+            headers=prebuilt,
+        )
+
+    assert [call.args[1] for call in set_header.call_args_list] == [
+        'Content-Type',
+    ]
+    assert response.headers == {
+        'Content-Type': 'application/json',
+        'X-Custom': '=?utf-8?b?4oKs?=',
+        'Content-Length': '2',
+    }
+
+
+def _change_content(response: SerializedResponse) -> None:
+    response.content = response.content
+
+
+def _write_content(response: SerializedResponse) -> None:
+    response.write(b'')
+
+
+@pytest.mark.parametrize('change_content', [_change_content, _write_content])
+def test_changed_content_clears_raw_data(
+    change_content: Callable[[SerializedResponse], None],
+) -> None:
+    """Ensure that raw data is not used after the content is changed."""
+    response = build_response(
+        PydanticSerializer,
+        raw_data=[1],
+        status_code=HTTPStatus.OK,
+    )
+
+    raw_data = response.__raw_data__
+
+    change_content(response)
+
+    assert raw_data == ([1],)
+    assert response.__raw_data__ is None
+    assert response.content == b'[1]'
@@ -0,0 +1,274 @@
+import json
+import logging
+from collections.abc import AsyncIterator, Iterator
+from http import HTTPStatus
+from typing import ClassVar, Final, final
+
+import pydantic
+import pytest
+from django.http import HttpResponse, StreamingHttpResponse
+
+from django_modern_rest import (
+    Controller,
+    HeaderSpec,
+    NewCookie,
+    NewHeader,
+    ResponseSpec,
+    modify,
+    validate,
+)
+from django_modern_rest.exceptions import ResponseSerializationError
+from django_modern_rest.plugins.pydantic import PydanticSerializer
+from django_modern_rest.test import DMRAsyncRequestFactory, DMRRequestFactory
+
+_MANY_ITEMS: Final = 100_000
+_SAMPLE_RATE: Final = 0.5
+
+
+@final
+class _Product(pydantic.BaseModel):
+    id: int
+
+
+@final
+class _SyncController(Controller[PydanticSerializer]):
+    @modify(
+        headers={'X-Total': NewHeader(value='3')},
+        cookies={'session': NewCookie(value='abc')},
+    )
+    def get(self) -> Iterator[_Product]:
+        return (_Product(id=index) for index in range(3))
+
+    def post(self) -> Iterator[_Product]:
+        return iter([])
+
+    def put(self) -> Iterator[_Product]:
+        yield _Product(id=1)
+        yield {'id': 'a'}  # type: ignore[misc]
+
+
+@final
+class _AsyncController(Controller[PydanticSerializer]):
+    async def get(self) -> AsyncIterator[_Product]:
+        for index in range(3):
+            yield _Product(id=index)
+
+    async def post(self) -> AsyncIterator[int]:
+        for index in range(_MANY_ITEMS):
+            yield index
+
+
+def test_streaming_spec() -> None:
+    """Ensures that streamed items are described as json arrays."""
+    metadata = _SyncController.api_endpoints['GET'].metadata
+
+    assert metadata.responses[HTTPStatus.OK].return_type == list[_Product]
+    assert metadata.modification is not None
+    assert metadata.modification.streaming
+
+
+@pytest.mark.parametrize(
+    ('accept', 'content_type', 'expected'),
+    [
+        ('*/*', 'application/json', b'[{"id":0},{"id":1},{"id":2}]'),
+        (
+            'application/x-ndjson',
+            'application/x-ndjson',
+            b'{"id":0}\n{"id":1}\n{"id":2}\n',
+        ),
+        (
+            'application/jsonl, */*',
+            'application/jsonl',
+            b'{"id":0}\n{"id":1}\n{"id":2}\n',
+        ),
+        (
+            'application/x-ndjson;q=0, */*',
+            'application/json',
+            b'[{"id":0},{"id":1},{"id":2}]',
+        ),
+        (
+            'application/json, application/x-ndjson;q=0.5',
+            'application/json',
+            b'[{"id":0},{"id":1},{"id":2}]',
+        ),
+    ],
+)
+def test_sync_streaming(
+    dmr_rf: DMRRequestFactory,
+    *,
+    accept: str,
+    content_type: str,
+    expected: bytes,
+) -> None:
+    """Ensures that sync iterators are streamed."""
+    request = dmr_rf.get('/whatever/', headers={'Accept': accept})
+
+    response = _SyncController.as_view()(request)
+
+    assert isinstance(response, StreamingHttpResponse)
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers == {
+        'Content-Type': content_type,
+        'X-Total': '3',
+    }
+    assert response.cookies['session'].value == 'abc'
+    assert b''.join(response.streaming_content) == expected  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    ('accept', 'expected'),
+    [
+        ('application/json', b'[]'),
+        ('application/x-ndjson', b''),
+    ],
+)
+def test_empty_streaming(
+    dmr_rf: DMRRequestFactory,
+    *,
+    accept: str,
+    expected: bytes,
+) -> None:
+    """Ensures that empty iterators are streamed."""
+    request = dmr_rf.post('/whatever/', headers={'Accept': accept})
+
+    response = _SyncController.as_view()(request)
+
+    assert isinstance(response, StreamingHttpResponse)
+    assert response.status_code == HTTPStatus.CREATED
+    assert b''.join(response.streaming_content) == expected  # type: ignore[arg-type]
+
+
+def test_streaming_chunks(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that items are sent in chunks of a limited size."""
+
+    class _ManyItemsController(Controller[PydanticSerializer]):
+        def get(self) -> Iterator[int]:
+            return iter(range(_MANY_ITEMS))
+
+    response = _ManyItemsController.as_view()(dmr_rf.get('/whatever/'))
+
+    assert isinstance(response, StreamingHttpResponse)
+    chunks = list(response.streaming_content)  # type: ignore[arg-type]
+    assert len(chunks) > 1
+    assert json.loads(b''.join(chunks)) == list(range(_MANY_ITEMS))
+
+
+@pytest.mark.asyncio
+async def test_async_streaming(dmr_async_rf: DMRAsyncRequestFactory) -> None:
+    """Ensures that async generators are streamed."""
+    request = dmr_async_rf.get('/whatever/')
+
+    response = await dmr_async_rf.wrap(_AsyncController.as_view()(request))
+
+    assert isinstance(response, StreamingHttpResponse)
+    assert response.is_async
+    assert response.status_code == HTTPStatus.OK
+    assert json.loads(
+        b''.join([chunk async for chunk in response.streaming_content]),  # type: ignore[union-attr]
+    ) == [{'id': 0}, {'id': 1}, {'id': 2}]
+
+
+@pytest.mark.asyncio
+async def test_async_streaming_chunks(
+    dmr_async_rf: DMRAsyncRequestFactory,
+) -> None:
+    """Ensures that async items are sent in chunks of a limited size."""
+    request = dmr_async_rf.post('/whatever/')
+
+    response = await dmr_async_rf.wrap(_AsyncController.as_view()(request))
+
+    assert isinstance(response, StreamingHttpResponse)
+    chunks = [chunk async for chunk in response.streaming_content]  # type: ignore[union-attr]
+    assert len(chunks) > 1
+    assert json.loads(b''.join(chunks)) == list(range(_MANY_ITEMS))
+
+
+def test_invalid_item(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that invalid items abort the started response."""
+    response = _SyncController.as_view()(dmr_rf.put('/whatever/'))
+
+    assert isinstance(response, StreamingHttpResponse)
+    assert response.status_code == HTTPStatus.OK
+    with pytest.raises(ResponseSerializationError, match='int_type'):
+        b''.join(response.streaming_content)  # type: ignore[arg-type]
+
+
+@final
+class _SampledController(Controller[PydanticSerializer]):
+    validate_responses_sample_rate: ClassVar[float | None] = _SAMPLE_RATE
+
+    def get(self) -> Iterator[int]:
+        return iter(['a'])  # type: ignore[list-item]
+
+
+def test_sampled_invalid_item(
+    dmr_rf: DMRRequestFactory,
+    caplog: pytest.LogCaptureFixture,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensures that sampled validation of items only logs errors."""
+    monkeypatch.setattr('random.random', float)
+    response = _SampledController.as_view()(dmr_rf.get('/whatever/'))
+
+    assert isinstance(response, StreamingHttpResponse)
+    with caplog.at_level(logging.WARNING):
+        streamed = b''.join(response.streaming_content)  # type: ignore[arg-type]
+
+    assert streamed == b'["a"]'
+    assert len(caplog.records) == 1
+    assert '_SampledController' in caplog.records[0].getMessage()
+
+
+def test_not_sampled_items(
+    dmr_rf: DMRRequestFactory,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensures that items of not sampled responses are not validated."""
+    monkeypatch.setattr('random.random', lambda: _SAMPLE_RATE)
+    response = _SampledController.as_view()(dmr_rf.get('/whatever/'))
+
+    assert isinstance(response, StreamingHttpResponse)
+    assert b''.join(response.streaming_content) == b'["a"]'  # type: ignore[arg-type]
+
+
+@final
+class _RealStreamingController(Controller[PydanticSerializer]):
+    @validate(
+        ResponseSpec(
+            list[int],
+            status_code=HTTPStatus.OK,
+            headers={'X-Total': HeaderSpec()},
+        ),
+    )
+    def get(self) -> StreamingHttpResponse:
+        return StreamingHttpResponse(
+            iter([b'[1]']),
+            headers={'X-Total': '1'},
+        )
+
+    @validate(ResponseSpec(list[int], status_code=HTTPStatus.OK))
+    def post(self) -> StreamingHttpResponse:
+        return StreamingHttpResponse(
+            iter([b'[1]']),
+            headers={'X-Total': '1'},
+        )
+
+
+def test_real_streaming_response(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that streaming responses are validated without content."""
+    response = _RealStreamingController.as_view()(dmr_rf.get('/whatever/'))
+
+    assert isinstance(response, StreamingHttpResponse)
+    assert response.status_code == HTTPStatus.OK
+    assert b''.join(response.streaming_content) == b'[1]'  # type: ignore[arg-type]
+
+
+def test_real_streaming_response_headers(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that headers of streaming responses are validated."""
+    response = _RealStreamingController.as_view()(dmr_rf.post('/whatever/'))
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert json.loads(response.content) == {
+        'detail': "Response has extra undescribed {'X-Total'} headers",
+    }
@@ -0,0 +1,125 @@
+from typing import Final
+
+import pytest
+from django.http import HttpRequest, HttpResponse
+from django.urls import (
+    Resolver404,
+    URLResolver,
+    include,
+    re_path,
+)
+from django.utils.translation import gettext_lazy
+
+from django_modern_rest.routing import Router, _PrefixRoutePattern, path
+
+
+def _view(request: HttpRequest, **kwargs: object) -> HttpResponse:
+    raise NotImplementedError
+
+
+_NESTED: Final = (
+    path('', _view, name='nested-index'),
+    path('<int:pk>/', _view, name='nested-detail'),
+)
+
+_PATTERNS: Final = (
+    path('users/', _view, name='users'),
+    path('users/<int:user_id>/', _view, name='user'),
+    path('users/<slug:username>/', _view, name='user-by-slug'),
+    path('users/<uuid:user_uid>/posts/', _view, name='user-posts'),
+    path('tags/<str:tag>', _view, name='tag'),
+    path('tags/<tag>/items/', _view, name='tag-items'),
+    path('page-<int:number>/', _view, name='page'),
+    path('files/<path:file_path>', _view, name='files'),
+    path('', _view, name='index'),
+    path('nested/', include((list(_NESTED), 'nested'), namespace='nested')),
+    path('v<int:version>/', include(list(_NESTED))),
+    path('partial', include([path('-suffix/', _view, name='partial')])),
+    path(gettext_lazy('translated/'), _view, name='translated'),  # type: ignore[call-overload]
+    re_path(r'^regex/(?P<year>[0-9]{4})/$', _view, name='regex'),
+    path('extra/', _view, {'extra': True}, name='extra'),
+)
+
+
+def _resolvers() -> tuple[URLResolver, URLResolver]:
+    return (
+        URLResolver(_PrefixRoutePattern(''), Router(_PATTERNS).urls),
+        URLResolver(
+            _PrefixRoutePattern(''),
+            Router(_PATTERNS, compiled=True).urls,
+        ),
+    )
+
+
+@pytest.mark.parametrize(
+    'request_path',
+    [
+        'users/',
+        'users/1/',
+        'users/some-user/',
+        'users/3fa85f64-5717-4562-b3fc-2c963f66afa6/posts/',
+        'tags/python',
+        'tags/python/items/',
+        'page-2/',
+        'files/a/b/c.txt',
+        '',
+        'nested/',
+        'nested/10/',
+        'v2/',
+        'v2/5/',
+        'partial-suffix/',
+        'translated/',
+        'regex/2025/',
+        'extra/',
+    ],
+)
+def test_compiled_resolve_same_as_django(request_path: str) -> None:
+    """Ensures that compiled router resolves routes the same way."""
+    default, compiled = _resolvers()
+
+    default_match = default.resolve(request_path)
+    compiled_match = compiled.resolve(request_path)
+
+    assert compiled_match.url_name == default_match.url_name
+    assert compiled_match.args == default_match.args
+    assert compiled_match.kwargs == default_match.kwargs
+    assert compiled_match.captured_kwargs == default_match.captured_kwargs  # type: ignore[attr-defined]
+    assert compiled_match.extra_kwargs == default_match.extra_kwargs  # type: ignore[attr-defined]
+    assert compiled_match.route == default_match.route
+    assert compiled_match.namespaces == default_match.namespaces
+    assert compiled_match.view_name == default_match.view_name
+
+
+@pytest.mark.parametrize(
+    'request_path',
+    [
+        'users',
+        'users/abc/def/',
+        'users/1/posts/',
+        'tags/',
+        'page-abc/',
+        'nested/abc/',
+        'v2/abc/',
+        'regex/20/',
+        'missing/',
+    ],
+)
+def test_compiled_resolve_not_found(request_path: str) -> None:
+    """Ensures that compiled router raises 404 the same way."""
+    default, compiled = _resolvers()
+
+    with pytest.raises(Resolver404):
+        default.resolve(request_path)
+    with pytest.raises(Resolver404):
+        compiled.resolve(request_path)
+
+
+def test_compiled_reverse() -> None:
+    """Ensures that compiled router can still reverse urls."""
+    default, compiled = _resolvers()
+
+    assert compiled.reverse('user', user_id=1) == default.reverse(
+        'user',
+        user_id=1,
+    )
+    assert compiled.reverse('regex', year='2025') == 'regex/2025/'
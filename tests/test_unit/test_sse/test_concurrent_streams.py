@@ -0,0 +1,118 @@
+import asyncio
+import collections
+from collections.abc import AsyncIterator, Mapping
+from typing import Any, Final, final
+
+import pytest
+from django.conf import LazySettings
+from django.urls import path
+
+from django_modern_rest import Controller, ServerSentEvent
+from django_modern_rest.asgi import ASGIHandler
+from django_modern_rest.plugins.msgspec import MsgspecSerializer
+
+_STREAMS: Final = 200
+_EVENTS: Final = 5
+_TIMEOUT: Final = 30
+_SEND_DELAY: Final = 0.01
+
+#: Events produced and producers closed, by stream id:
+_produced: collections.Counter[str] = collections.Counter()
+_closed: set[str] = set()
+
+
+@final
+class _TickerController(Controller[MsgspecSerializer]):
+    async def get(self) -> AsyncIterator[ServerSentEvent[int]]:
+        stream_id = self.request.GET['stream']
+        try:  # noqa: WPS501
+            while True:  # noqa: WPS457
+                _produced[stream_id] += 1
+                yield ServerSentEvent(_produced[stream_id], id=stream_id)
+                await asyncio.sleep(0)
+        finally:
+            _closed.add(stream_id)
+
+
+urlpatterns = [path('events/', _TickerController.as_view())]
+
+
+@final
+class _EventStreamClient:
+    """Reads events from ASGI app and disconnects after some of them."""
+
+    def __init__(self, stream_id: str, *, send_delay: float = 0) -> None:
+        self.stream_id = stream_id
+        self.chunks: list[bytes] = []
+        self._send_delay = send_delay
+        self._request_sent = False
+        self._disconnected = asyncio.Event()
+
+    async def run(self, app: ASGIHandler) -> None:
+        await app(
+            {
+                'type': 'http',
+                'method': 'GET',
+                'path': '/events/',
+                'query_string': f'stream={self.stream_id}'.encode(),
+                'headers': [(b'host', b'testserver')],
+            },
+            self._receive,
+            self._send,
+        )
+
+    async def _receive(self) -> dict[str, Any]:
+        if not self._request_sent:
+            self._request_sent = True
+            return {'type': 'http.request', 'body': b''}
+        await self._disconnected.wait()
+        return {'type': 'http.disconnect'}
+
+    async def _send(self, message: Mapping[str, Any]) -> None:
+        if message['type'] != 'http.response.body':
+            return
+        # Slow clients are modelled by slow sends:
+        await asyncio.sleep(self._send_delay)
+        self.chunks.append(message['body'])
+        if len(self.chunks) == _EVENTS:
+            self._disconnected.set()
+
+
+@pytest.fixture
+def _event_urls(settings: LazySettings) -> None:
+    settings.ROOT_URLCONF = __name__
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures('_event_urls')
+async def test_concurrent_streams() -> None:
+    """Ensures that a single worker serves many streams and disconnects."""
+    app = ASGIHandler()
+    clients = [_EventStreamClient(f'many{index}') for index in range(_STREAMS)]
+
+    await asyncio.wait_for(
+        asyncio.gather(*(client.run(app) for client in clients)),
+        timeout=_TIMEOUT,
+    )
+
+    for client in clients:
+        assert len(client.chunks) == _EVENTS
+        assert (
+            client.chunks[0] == f'id: {client.stream_id}\ndata: 1\n\n'.encode()
+        )
+        # Producers are closed when clients disconnect:
+        assert client.stream_id in _closed
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures('_event_urls')
+async def test_slow_client_backpressure() -> None:
+    """Ensures that producers wait for slow clients."""
+    client = _EventStreamClient('slow', send_delay=_SEND_DELAY)
+
+    await asyncio.wait_for(client.run(ASGIHandler()), timeout=_TIMEOUT)
+
+    assert len(client.chunks) == _EVENTS
+    # Only the next event can be produced while the previous one is sent:
+    assert _produced['slow'] <= _EVENTS + 1
+    assert 'slow' in _closed
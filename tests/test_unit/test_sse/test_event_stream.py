@@ -0,0 +1,185 @@
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from http import HTTPStatus
+from typing import ClassVar, final
+
+import pydantic
+import pytest
+from django.conf import LazySettings
+from django.http import StreamingHttpResponse
+
+from django_modern_rest import Controller, NewCookie, ServerSentEvent, modify
+from django_modern_rest.exceptions import (
+    EndpointMetadataError,
+    ResponseSerializationError,
+)
+from django_modern_rest.plugins.pydantic import PydanticSerializer
+from django_modern_rest.settings import Settings, clear_settings_cache
+from django_modern_rest.test import DMRAsyncRequestFactory
+
+
+@pytest.fixture
+def _fast_heartbeat(settings: LazySettings) -> Iterator[None]:
+    clear_settings_cache()
+    settings.DMR_SETTINGS = {Settings.sse_heartbeat_interval: 0.01}
+    yield
+
+    clear_settings_cache()
+
+
+@final
+class _Message(pydantic.BaseModel):
+    text: str
+
+
+@final
+class _EventsController(Controller[PydanticSerializer]):
+    async def get(self) -> AsyncIterator[ServerSentEvent[_Message]]:
+        yield ServerSentEvent(_Message(text='a\nb'))
+        yield ServerSentEvent(
+            _Message(text='c'),
+            event='message',
+            id='2',
+            retry=1000,
+        )
+
+    async def post(self) -> AsyncIterator[ServerSentEvent[_Message]]:
+        yield ServerSentEvent({'text': 1})  # type: ignore[arg-type]
+
+    async def put(self) -> AsyncIterator[ServerSentEvent[_Message]]:
+        await asyncio.sleep(0.1)
+        yield ServerSentEvent(_Message(text='late'))
+
+
+@final
+class _Countdown:
+    """Async iterator, which is not a generator."""
+
+    def __init__(self) -> None:
+        self._count = 2
+
+    def __aiter__(self) -> '_Countdown':
+        return self
+
+    async def __anext__(self) -> ServerSentEvent[int]:
+        self._count -= 1
+        if self._count < 0:
+            raise StopAsyncIteration
+        return ServerSentEvent(self._count)
+
+
+@final
+class _NotValidatedController(Controller[PydanticSerializer]):
+    validate_responses: ClassVar[bool | None] = False
+
+    @modify(cookies={'session': NewCookie(value='abc')})
+    async def get(self) -> AsyncIterator[ServerSentEvent[int]]:
+        return _Countdown()
+
+
+async def _read(response: StreamingHttpResponse) -> list[bytes]:
+    return [chunk async for chunk in response.streaming_content]  # type: ignore[union-attr]
+
+
+@pytest.mark.asyncio
+async def test_event_stream(dmr_async_rf: DMRAsyncRequestFactory) -> None:
+    """Ensures that events are encoded with all their fields."""
+    request = dmr_async_rf.get('/whatever/')
+
+    response = await dmr_async_rf.wrap(_EventsController.as_view()(request))
+
+    assert isinstance(response, StreamingHttpResponse)
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers == {
+        'Content-Type': 'text/event-stream',
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no',
+    }
+    chunks = await _read(response)
+    # Line breaks in payloads are escaped:
+    assert chunks[0].splitlines() == [rb'data: {"text":"a\nb"}', b'']
+    assert chunks[1] == (
+        b'id: 2\nevent: message\nretry: 1000\ndata: {"text":"c"}\n\n'
+    )
+
+
+@pytest.mark.asyncio
+async def test_invalid_event(dmr_async_rf: DMRAsyncRequestFactory) -> None:
+    """Ensures that invalid event payloads abort the stream."""
+    request = dmr_async_rf.post('/whatever/')
+
+    response = await dmr_async_rf.wrap(_EventsController.as_view()(request))
+
+    assert isinstance(response, StreamingHttpResponse)
+    assert response.status_code == HTTPStatus.CREATED
+    with pytest.raises(ResponseSerializationError, match='string_type'):
+        await _read(response)
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures('_fast_heartbeat')
+async def test_heartbeat(dmr_async_rf: DMRAsyncRequestFactory) -> None:
+    """Ensures that idle streams send heartbeat comments."""
+    request = dmr_async_rf.put('/whatever/')
+
+    response = await dmr_async_rf.wrap(_EventsController.as_view()(request))
+
+    assert isinstance(response, StreamingHttpResponse)
+    chunks = await _read(response)
+    assert chunks[-1] == b'data: {"text":"late"}\n\n'
+    assert len(chunks) > 1
+    assert set(chunks[:-1]) == {b':\n\n'}
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures('_fast_heartbeat')
+async def test_close_idle_stream(dmr_async_rf: DMRAsyncRequestFactory) -> None:
+    """Ensures that producers are closed with idle streams."""
+    request = dmr_async_rf.put('/whatever/')
+    response = await dmr_async_rf.wrap(_EventsController.as_view()(request))
+    assert isinstance(response, StreamingHttpResponse)
+    stream = aiter(response.streaming_content)  # type: ignore[arg-type]
+
+    assert await anext(stream) == b':\n\n'
+    await stream.aclose()  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+async def test_not_validated_events(
+    dmr_async_rf: DMRAsyncRequestFactory,
+) -> None:
+    """Ensures that events are streamed from any async iterators."""
+    request = dmr_async_rf.get('/whatever/')
+
+    response = await dmr_async_rf.wrap(
+        _NotValidatedController.as_view()(request),
+    )
+
+    assert isinstance(response, StreamingHttpResponse)
+    assert response.cookies['session'].value == 'abc'
+    assert await _read(response) == [b'data: 1\n\n', b'data: 0\n\n']
+
+
+@pytest.mark.parametrize('field', ['event', 'id'])
+def test_event_line_breaks(field: str) -> None:
+    """Ensures that event fields can't break the stream format."""
+    with pytest.raises(ValueError, match='line breaks'):
+        ServerSentEvent(1, **{field: 'a\r\ndata: 2'})  # type: ignore[arg-type]
+
+
+def test_sync_event_stream() -> None:
+    """Ensures that events can't be produced by sync iterators."""
+    with pytest.raises(EndpointMetadataError, match='AsyncIterator'):
+
+        class _SyncController(Controller[PydanticSerializer]):
+            def get(self) -> Iterator[ServerSentEvent[int]]:
+                raise NotImplementedError
+
+
+def test_event_stream_response_spec() -> None:
+    """Ensures that event streams are described with their media type."""
+    metadata = _EventsController.api_endpoints['GET'].metadata
+    response_spec = metadata.responses[HTTPStatus.OK]
+
+    assert response_spec.media_type == 'text/event-stream'
+    assert response_spec.return_type == list[ServerSentEvent[_Message]]